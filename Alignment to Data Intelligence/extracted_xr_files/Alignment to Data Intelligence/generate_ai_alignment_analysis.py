@@ -9,6 +9,12 @@ from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation as LDA
 import nltk
 import re
+import sys
+from pathlib import Path
+
+# Shared analytics (artifact manifest)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "analysis" / "common"))
+from artifact_manifest import build_manifest
 
 print("="*80)
 print("XR AI ALIGNMENT: COMPLETE ANALYSIS")
@@ -160,3 +166,7 @@ print("  - xr_ai_alignment_sentiment.csv")
 print("  - xr_ai_alignment_sentiment_distribution.png")
 print("  - xr_ai_alignment_topics.csv")
 print("="*80)
+
+# Index the outputs for the dashboard pages
+manifest = build_manifest('ai_alignment')
+print(f"✓ Artifact manifest: {len(manifest.entries)} artifacts (data version {manifest.data_version})")
@@ -6,11 +6,22 @@ Author: Mathemagica 2.0 Data Science Team
 Date: November 2024
 """
 
+import sys
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
 
+# Shared analytics (model registry, DTM cache, LDA planner, top-word selection, topics over time)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "analysis" / "common"))
+from dtm_cache import get_dtm_cache
+from dynamic_topics import fit_dynamic_topics
+from lda_planner import plan_for_matrix
+from model_registry import register_fitted_model
+from topic_coherence import top_word_indices
+
 class XR_TopicModeler:
     """LDA-based topic modeling for XR scalability"""
 
@@ -26,24 +37,25 @@ class XR_TopicModeler:
 
         print(f"\nFitting LDA model with {self.n_topics} topics...")
 
-        # Create document-term matrix
-        self.vectorizer = CountVectorizer(
+        # Create document-term matrix (shared cache: reused across runs and scripts)
+        cached = get_dtm_cache().get_or_build(texts, CountVectorizer(
             max_df=0.85,
             min_df=2,
             stop_words='english',
             max_features=1000
-        )
+        ))
+        self.vectorizer = cached.vectorizer
 
-        doc_term_matrix = self.vectorizer.fit_transform(texts)
+        doc_term_matrix = cached.matrix
         print(f"[OK] Document-term matrix: {doc_term_matrix.shape}")
 
-        # Fit LDA
+        # Fit LDA (learning method / workers planned from corpus size; max_iter is a cap)
+        plan = plan_for_matrix(doc_term_matrix, self.n_topics, max_iter=self.max_iter)
+        print(f"[OK] LDA plan: {plan.reason}")
         self.lda_model = LatentDirichletAllocation(
             n_components=self.n_topics,
-            max_iter=self.max_iter,
-            learning_method='online',
             random_state=self.random_state,
-            n_jobs=-1
+            **plan.lda_kwargs()
         )
 
         self.lda_model.fit(doc_term_matrix)
@@ -51,6 +63,26 @@ class XR_TopicModeler:
 
         return doc_term_matrix
 
+    def save_model(self, texts, name='scalability_script04'):
+        """Persist fitted vectorizer + LDA in the model registry"""
+
+        if self.lda_model is None:
+            print("[ERR] Model not fitted")
+            return None
+
+        params = {
+            'n_topics': self.n_topics,
+            'max_iter': self.max_iter,
+            'random_state': self.random_state,
+            'max_features': 1000
+        }
+        key = register_fitted_model(
+            name, self.vectorizer, self.lda_model, texts, params,
+            metadata={'script': Path(__file__).name, 'n_documents': len(texts)}
+        )
+        print(f"[OK] Registered model: {key}")
+        return key
+
     def display_topics(self, n_words=12):
         """Display top words per topic with XR-specific labels"""
 
@@ -73,10 +105,12 @@ class XR_TopicModeler:
             'compute': '[EDGE COMPUTING: Processing/CDN/Distributed]'
         }
 
-        for topic_idx, topic in enumerate(self.lda_model.components_):
-            top_indices = topic.argsort()[-n_words:][::-1]
-            top_words = [feature_names[i] for i in top_indices]
-            top_weights = [topic[i] for i in top_indices]
+        components = self.lda_model.components_
+        top_indices = top_word_indices(components, n_words)
+        top_weights = np.take_along_axis(components, top_indices, axis=1)
+
+        for topic_idx in range(len(components)):
+            top_words = feature_names[top_indices[topic_idx]].tolist()
 
             # Auto-label based on keywords
             label = '[GENERAL SCALING THEME]'
@@ -86,7 +120,7 @@ class XR_TopicModeler:
                     break
 
             print(f"\nTOPIC {topic_idx + 1}: {label}")
-            for i, (word, weight) in enumerate(zip(top_words, top_weights), 1):
+            for i, (word, weight) in enumerate(zip(top_words, top_weights[topic_idx]), 1):
                 print(f"    {i:2d}. {word:20s} (weight: {weight:.4f})")
 
     def get_document_topics(self, doc_term_matrix):
@@ -106,8 +140,46 @@ class XR_TopicModeler:
 
         return doc_topic_dist
 
-def main():
-    """Main execution"""
+def run_dynamic(df, n_topics=3):
+    """Topics over time: monthly windows, warm-started, one chain per category in parallel"""
+
+    print(f"\n{'=' * 80}")
+    print("XR SCALABILITY: TOPICS OVER TIME (MONTHLY WINDOWS)")
+    print(f"{'=' * 80}")
+
+    df = df.dropna(subset=['cleaned_text', 'date'])
+    texts = df['cleaned_text'].astype(str).tolist()
+
+    for groups, suffix in [(None, ''), (df['category'], '_By_Category')]:
+        dynamic = fit_dynamic_topics(texts, df['date'], groups=groups, n_topics=n_topics)
+
+        windows = dynamic['windows']
+        cold = windows.loc[~windows['warm_start'], 'fit_seconds'].mean()
+        warm = windows.loc[windows['warm_start'], 'fit_seconds'].mean()
+        print(f"\n[OK] {windows['group'].nunique()} chain(s), {len(windows)} windows "
+              f"(first window fit {cold:.2f}s, warm-started windows {warm:.2f}s)")
+
+        dynamic['prevalence'].to_csv(f'XR_Topic_Prevalence_Over_Time{suffix}.csv', index=False)
+        drift = dynamic['drift'].assign(
+            top_words=dynamic['drift']['top_words'].str.join(', '),
+            new_words=dynamic['drift']['new_words'].str.join(', ')
+        )
+        drift.to_csv(f'XR_Topic_Keyword_Drift{suffix}.csv', index=False)
+        print(f"[OK] Saved: XR_Topic_Prevalence_Over_Time{suffix}.csv, XR_Topic_Keyword_Drift{suffix}.csv")
+
+        if groups is None:
+            prevalence = dynamic['prevalence'].pivot(index='window', columns='topic_id', values='prevalence')
+            prevalence.columns = [f'Topic_{topic_id + 1}' for topic_id in prevalence.columns]
+            print(f"\nTopic prevalence by month:")
+            print(prevalence.round(3).to_string())
+
+            for _, row in drift.dropna(subset=['jaccard_to_previous']).iterrows():
+                if row['new_words']:
+                    print(f"  {row['window']} Topic {row['topic_id'] + 1}: "
+                          f"overlap {row['jaccard_to_previous']:.2f}, new: {row['new_words']}")
+
+def main(dynamic=False):
+    """Main execution (dynamic=True adds topics over time)"""
 
     print("=" * 80)
     print("XR SCALABILITY: TOPIC MODELING (LDA)")
@@ -123,12 +195,14 @@ def main():
         return
 
     # Prepare texts
-    texts = df['cleaned_text'].dropna().astype(str).tolist()
+    documents = df['cleaned_text'].dropna().astype(str)
+    texts = documents.tolist()
     print(f"[OK] Prepared {len(texts)} documents for modeling")
 
     # Initialize and fit LDA
     modeler = XR_TopicModeler(n_topics=3, max_iter=25)
     doc_term_matrix = modeler.fit_lda(texts)
+    modeler.save_model(texts)
 
     # Display topics
     modeler.display_topics(n_words=12)
@@ -142,9 +216,14 @@ def main():
             doc_topic_dist,
             columns=[f'Topic_{i+1}' for i in range(modeler.n_topics)]
         )
+        # Corpus row index, the same record_id the sentiment script writes
+        topic_df.insert(0, 'record_id', documents.index)
         topic_df.to_csv('XR_LDA_Topic_Distribution.csv', index=False)
         print(f"\n[OK] Saved: XR_LDA_Topic_Distribution.csv")
 
+    if dynamic:
+        run_dynamic(df, n_topics=modeler.n_topics)
+
     print("\n" + "=" * 80)
     print("INTERPRETATION:")
     print("  Topics represent latent XR scalability challenges")
@@ -153,4 +232,5 @@ def main():
     print("=" * 80)
 
 if __name__ == "__main__":
-    main()
+    # python XR_Script_04_Topic_Modeling_LDA.py --dynamic
+    main(dynamic="--dynamic" in sys.argv[1:])
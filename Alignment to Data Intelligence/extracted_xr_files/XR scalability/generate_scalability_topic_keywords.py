@@ -8,8 +8,16 @@ Following the same pattern as Maturity, Interoperability, and AI Alignment dimen
 import pandas as pd
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
+from pathlib import Path
 import sys
 
+# Shared analytics (model registry, DTM cache, LDA planner, artifact manifest)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "analysis" / "common"))
+from artifact_manifest import build_manifest
+from dtm_cache import get_dtm_cache
+from lda_planner import plan_for_matrix
+from model_registry import register_fitted_model
+
 print("="*80)
 print("XR SCALABILITY: TOPIC KEYWORDS EXTRACTION")
 print("="*80)
@@ -26,31 +34,39 @@ except FileNotFoundError:
 texts = df['cleaned_text'].dropna().astype(str).tolist()
 print(f"[2/4] Prepared {len(texts)} documents for topic modeling")
 
-# Create document-term matrix
+# Create document-term matrix (shared cache: reused across runs and scripts)
 print("[3/4] Running LDA topic modeling...")
-vectorizer = CountVectorizer(
+cached = get_dtm_cache().get_or_build(texts, CountVectorizer(
     max_df=0.85,
     min_df=2,
     stop_words='english',
     max_features=1000,
     ngram_range=(1, 2)  # Include bigrams like "edge computing"
-)
+))
+vectorizer = cached.vectorizer
 
-doc_term_matrix = vectorizer.fit_transform(texts)
+doc_term_matrix = cached.matrix
 print(f"  ✓ Document-term matrix: {doc_term_matrix.shape}")
 
-# Fit LDA with 3 topics
+# Fit LDA with 3 topics (learning method / workers planned from corpus size)
+plan = plan_for_matrix(doc_term_matrix, n_topics=3, max_iter=25)
 lda_model = LatentDirichletAllocation(
     n_components=3,
-    max_iter=25,
-    learning_method='online',
     random_state=42,
-    n_jobs=-1
+    **plan.lda_kwargs()
 )
 
 lda_model.fit(doc_term_matrix)
 print(f"  ✓ LDA model fitted with 3 topics")
 
+model_key = register_fitted_model(
+    'scalability_keywords', vectorizer, lda_model, texts,
+    params={'n_topics': 3, 'max_iter': 25, 'random_state': 42,
+            'max_features': 1000, 'ngram_range': (1, 2)},
+    metadata={'script': Path(__file__).name, 'n_documents': len(texts)}
+)
+print(f"  ✓ Registered model: {model_key}")
+
 # Extract topic keywords
 feature_names = vectorizer.get_feature_names_out()
 n_top_words = 10
@@ -85,3 +101,7 @@ print("="*80)
 print("\nThis file can now be loaded by the Scalability dashboard page")
 print("to display actual topic keywords instead of hardcoded labels.")
 print("="*80)
+
+# Index the outputs for the dashboard pages
+manifest = build_manifest('scalability')
+print(f"✓ Artifact manifest: {len(manifest.entries)} artifacts (data version {manifest.data_version})")
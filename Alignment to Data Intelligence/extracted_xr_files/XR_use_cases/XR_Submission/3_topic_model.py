@@ -3,12 +3,19 @@
 - Reads xr_usecases_corpus.csv
 - Produces xr_topics.json and xr_doc_dominant_topic.csv
 """
-import pandas as pd, re, json
+import pandas as pd, re, json, sys
+from pathlib import Path
 import nltk
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
+
+# Shared analytics (model registry, artifact manifest)
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "analysis" / "common"))
+from artifact_manifest import build_manifest
+from model_registry import register_fitted_model
+
 nltk.download('punkt', quiet=True)
 nltk.download('stopwords', quiet=True)
 nltk.download('wordnet', quiet=True)
@@ -36,6 +43,11 @@ terms = vectorizer.get_feature_names_out()
 n_topics = 5
 lda = LatentDirichletAllocation(n_components=n_topics, random_state=42)
 lda.fit(dtm)
+register_fitted_model(
+    'use_cases', vectorizer, lda, df['text_for_topics'].tolist(),
+    params={'n_topics': n_topics, 'random_state': 42, 'ngram_range': (1, 2), 'max_df': 0.95},
+    metadata={'script': Path(__file__).name, 'n_documents': len(df)}
+)
 
 topics=[]
 for i, comp in enumerate(lda.components_):
@@ -50,3 +62,7 @@ df_out = df[['id','source','date']].copy()
 df_out['dominant_topic'] = doc_topic.argmax(axis=1)
 df_out.to_csv("xr_doc_dominant_topic.csv", index=False)
 print("Saved: xr_topics.json and xr_doc_dominant_topic.csv")
+
+# Index the outputs for the dashboard pages
+manifest = build_manifest('use_cases')
+print(f"✓ Artifact manifest: {len(manifest.entries)} artifacts (data version {manifest.data_version})")
@@ -9,6 +9,12 @@ from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation as LDA
 import nltk
 import re
+import sys
+from pathlib import Path
+
+# Shared analytics (artifact manifest)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "analysis" / "common"))
+from artifact_manifest import build_manifest
 
 print("="*80)
 print("XR INTEROPERABILITY: COMPLETE ANALYSIS")
@@ -155,3 +161,7 @@ print("  - xr_interop_sentiment.csv")
 print("  - xr_interop_sentiment_distribution.png")
 print("  - xr_interop_topics.csv")
 print("="*80)
+
+# Index the outputs for the dashboard pages
+manifest = build_manifest('interoperability')
+print(f"✓ Artifact manifest: {len(manifest.entries)} artifacts (data version {manifest.data_version})")
@@ -12,6 +12,13 @@ from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation as LDA
 import nltk
 import re
+import sys
+from pathlib import Path
+
+# Shared analytics (model registry, artifact manifest)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "analysis" / "common"))
+from artifact_manifest import build_manifest
+from model_registry import register_fitted_model
 
 print("="*80)
 print("XR MATURITY: COMPLETE ANALYTICS REGENERATION (EXPANDED DATASET)")
@@ -133,6 +140,13 @@ vectorizer = CountVectorizer(
 doc_term_matrix = vectorizer.fit_transform(documents)
 lda = LDA(n_components=5, random_state=42, max_iter=50)
 lda.fit(doc_term_matrix)
+model_key = register_fitted_model(
+    'maturity', vectorizer, lda, documents,
+    params={'n_topics': 5, 'random_state': 42, 'max_iter': 50,
+            'max_features': 150, 'ngram_range': (1, 2)},
+    metadata={'script': Path(__file__).name, 'n_documents': len(documents)}
+)
+print(f"  ✓ Registered model: {model_key}")
 
 feature_names = vectorizer.get_feature_names_out()
 print("\n  Top Topics Identified:")
@@ -185,6 +199,10 @@ print("  - xr_sentiment_distribution.png (visualization)")
 print("  - xr_topics.csv (5 topics)")
 print("  - XR_present_state_corpus.txt (full text)")
 
+# Index the outputs for the dashboard pages
+manifest = build_manifest('maturity')
+print(f"✓ Artifact manifest: {len(manifest.entries)} artifacts (data version {manifest.data_version})")
+
 print("\n" + "="*80)
 print("✅ All analytics generated following Interoperability standard")
 print("="*80)
@@ -0,0 +1,445 @@
+"""
+Analytics Artifact Manifest
+Per-dimension JSON index of pre-computed artifacts (role, schema, content hash, data version)
+
+Pipelines write the manifest; dashboard pages resolve artifacts through it
+instead of hard-coding file names, and never compute artifacts on request.
+
+Usage:
+    python analysis/common/artifact_manifest.py [--check] [dimension_id ...]
+"""
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from data_loader import get_loader
+from dimensions import ALL_DIMENSIONS, get_dimension_by_id
+from image_assets import FULL_WIDTH, build_variants, image_html
+
+
+MANIFEST_NAME = "artifact_manifest.json"
+MANIFEST_VERSION = 1
+
+# Canonical columns per tabular role; ArtifactSpec.rename maps each file's own convention onto them
+ROLE_COLUMNS = {
+    'top_words': ['Word', 'Frequency'],
+    'topics': ['topic', 'keywords']
+}
+
+
+@dataclass
+class ArtifactSpec:
+    """Where one artifact of a dimension lives and how to read or build it"""
+    role: str
+    file: str  # relative to the dimension's output directory
+    kind: str  # 'csv', 'json' or 'png'
+    rename: Dict[str, str] = field(default_factory=dict)
+    generator: Optional[str] = None  # 'wordcloud' or 'top_words': built by build_manifest()
+    fallback: bool = False  # generator only fills in when the dimension's own pipeline wrote nothing
+    options: Dict = field(default_factory=dict)
+
+
+ARTIFACT_SPECS: Dict[str, List[ArtifactSpec]] = {
+    'maturity': [
+        ArtifactSpec('wordcloud_image', "dashboard_wordcloud.png", 'png', generator='wordcloud',
+                     options={'colormap': 'viridis', 'title': 'Dominant Themes in XR Maturity'}),
+        ArtifactSpec('top_words', "dashboard_top_words.csv", 'csv', generator='top_words'),
+        ArtifactSpec('sentiment', "xr_sentences_sentiment.csv", 'csv',
+                     options={'score_col': 'compound', 'label_col': 'label'}),
+        ArtifactSpec('topics', "xr_topics.csv", 'csv'),
+    ],
+    'interoperability': [
+        ArtifactSpec('wordcloud_image', "xr_interop_wordcloud.png", 'png', generator='wordcloud', fallback=True,
+                     options={'colormap': 'plasma', 'title': 'Key Concepts in XR Interoperability'}),
+        ArtifactSpec('top_words', "xr_interop_top_words.csv", 'csv', generator='top_words', fallback=True,
+                     rename={'word': 'Word', 'frequency': 'Frequency'}),
+        ArtifactSpec('sentiment', "xr_interop_sentiment.csv", 'csv',
+                     options={'score_col': 'compound', 'label_col': 'label'}),
+        ArtifactSpec('sentiment_image', "xr_interop_sentiment_distribution.png", 'png'),
+        ArtifactSpec('topics', "xr_interop_topics.csv", 'csv'),
+    ],
+    'scalability': [
+        ArtifactSpec('wordcloud_image', "dashboard_wordcloud.png", 'png', generator='wordcloud',
+                     options={'colormap': 'inferno', 'title': 'Infrastructure Themes in XR Scalability'}),
+        ArtifactSpec('top_words', "dashboard_top_words.csv", 'csv', generator='top_words'),
+        ArtifactSpec('sentiment', "XR_Sentiment_Analysis_Results.csv", 'csv',
+                     options={'score_col': 'global_sentiment_score', 'label_col': 'global_sentiment_class'}),
+        ArtifactSpec('topics', "XR_Scalability_Topics.csv", 'csv'),
+        ArtifactSpec('topic_distribution', "XR_LDA_Topic_Distribution.csv", 'csv'),
+    ],
+    'ai_alignment': [
+        ArtifactSpec('wordcloud_image', "xr_ai_alignment_wordcloud.png", 'png', generator='wordcloud', fallback=True,
+                     options={'colormap': 'viridis', 'title': 'AI-XR Integration Themes'}),
+        ArtifactSpec('top_words', "xr_ai_alignment_top_words.csv", 'csv', generator='top_words', fallback=True,
+                     rename={'word': 'Word', 'frequency': 'Frequency'}),
+        ArtifactSpec('sentiment', "xr_ai_alignment_sentiment.csv", 'csv',
+                     options={'score_col': 'compound', 'label_col': 'label'}),
+        ArtifactSpec('sentiment_image', "xr_ai_alignment_sentiment_distribution.png", 'png'),
+        ArtifactSpec('topics', "xr_ai_alignment_topics.csv", 'csv'),
+    ],
+    'use_cases': [
+        ArtifactSpec('wordcloud_image', "dashboard_wordcloud.png", 'png', generator='wordcloud',
+                     options={'colormap': 'Set2', 'title': 'Dominant Use Case Themes'}),
+        ArtifactSpec('top_words', "dashboard_top_words.csv", 'csv', generator='top_words'),
+        ArtifactSpec('sentiment', "xr_sentiment_output.csv", 'csv',
+                     options={'score_col': 'compound', 'label_col': 'label'}),
+        ArtifactSpec('topics', "xr_topics.json", 'json',
+                     rename={'topic_name': 'topic', 'terms': 'keywords'}),
+        ArtifactSpec('doc_topics', "xr_doc_dominant_topic.csv", 'csv'),
+    ],
+}
+
+# Process-wide cache: manifest path -> (parsed manifest JSON, ArtifactManifest)
+_manifest_cache: Dict[Path, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def output_dir(dimension_id: str) -> Path:
+    """Directory holding a dimension's analytics outputs (and its manifest)"""
+    return get_dimension_by_id(dimension_id).get_data_paths()[0].parent
+
+
+def manifest_path(dimension_id: str) -> Path:
+    """Location of a dimension's manifest file"""
+    return output_dir(dimension_id) / MANIFEST_NAME
+
+
+def content_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes (16 hex characters)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def data_fingerprint(dimension_id: str) -> str:
+    """
+    Content-based version of a dimension's input data files
+
+    Unlike modification times, this survives a fresh checkout, so a
+    committed manifest stays valid until the data actually changes.
+    """
+    digest = hashlib.sha256()
+    for path in get_dimension_by_id(dimension_id).get_data_paths():
+        digest.update(path.name.encode('utf-8'))
+        digest.update(content_hash(path).encode('utf-8') if path.exists() else b'missing')
+    return digest.hexdigest()[:16]
+
+
+def describe_schema(path: Path, kind: str) -> Dict:
+    """Columns/rows of a CSV, structure of a JSON file, or size of an image"""
+    if kind == 'csv':
+        frame = pd.read_csv(path)
+        return {'columns': frame.columns.tolist(), 'rows': int(len(frame))}
+    if kind == 'json':
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if isinstance(payload, list):
+            keys = sorted({key for item in payload if isinstance(item, dict) for key in item})
+            return {'type': 'list', 'length': len(payload), 'keys': keys}
+        return {'type': type(payload).__name__, 'keys': sorted(payload) if isinstance(payload, dict) else []}
+    if kind == 'png':
+        from PIL import Image
+        with Image.open(path) as image:
+            return {'width': image.width, 'height': image.height}
+    raise ValueError(f"Unknown artifact kind '{kind}'")
+
+
+class ArtifactManifest:
+    """Resolved manifest of one dimension"""
+
+    def __init__(self, dimension_id: str, payload: Dict, root: Path):
+        """
+        Args:
+            dimension_id: Dimension the manifest describes
+            payload: Parsed manifest JSON
+            root: Directory the artifact paths are relative to
+        """
+        self.dimension_id = dimension_id
+        self.payload = payload
+        self.root = root
+        self.entries = {entry['role']: entry for entry in payload.get('artifacts', [])}
+        self._specs = {spec.role: spec for spec in ARTIFACT_SPECS.get(dimension_id, [])}
+        self._normalized: Dict[str, tuple] = {}  # role -> (parsed file, normalized frame)
+
+    @classmethod
+    def empty(cls, dimension_id: str) -> 'ArtifactManifest':
+        """Manifest with no artifacts (pages then show their 'not available' notes)"""
+        return cls(dimension_id, {'artifacts': []}, output_dir(dimension_id))
+
+    @property
+    def data_version(self) -> Optional[str]:
+        return self.payload.get('data_version')
+
+    def has(self, role: str) -> bool:
+        return self.path(role) is not None
+
+    def entry(self, role: str) -> Optional[Dict]:
+        """Manifest record (file, kind, schema, content_hash, ...) for a role"""
+        return self.entries.get(role)
+
+    def path(self, role: str) -> Optional[Path]:
+        """Absolute artifact path, or None when the role is not in the manifest / on disk"""
+        entry = self.entries.get(role)
+        if entry is None:
+            return None
+        path = self.root / entry['file']
+        return path if path.exists() else None
+
+    def version(self, role: str) -> Optional[str]:
+        """Content hash of an artifact (a cache key that survives checkouts)"""
+        entry = self.entries.get(role)
+        return entry['content_hash'] if entry else None
+
+    def image_html(self, role: str, alt: str = "", width: int = FULL_WIDTH) -> Optional[str]:
+        """
+        <img> tag serving the image's rendition for a display width
+
+        Returns:
+            HTML for st.markdown(..., unsafe_allow_html=True), or None if unavailable
+        """
+        path = self.path(role)
+        if path is None:
+            return None
+        return image_html(path, alt, width, self.entries[role].get('variants', []))
+
+    def option(self, role: str, name: str, default=None):
+        """Per-role option from the manifest (e.g. sentiment score_col)"""
+        entry = self.entries.get(role) or {}
+        return entry.get('options', {}).get(name, default)
+
+    def load(self, role: str):
+        """
+        Read an artifact, with tabular roles mapped to canonical columns
+
+        Files are parsed through XRDataLoader.load_artifact(), so each one is
+        read once per file version; treat the result as read-only.
+
+        Returns:
+            DataFrame for csv/json artifacts, bytes for images, or None if unavailable
+        """
+        path = self.path(role)
+        if path is None:
+            return None
+
+        parsed = get_loader().load_artifact(path)
+        if self.entries[role]['kind'] == 'png':
+            return parsed
+
+        cached = self._normalized.get(role)
+        if cached is not None and cached[0] is parsed:
+            return cached[1]
+
+        frame = pd.DataFrame(parsed) if isinstance(parsed, list) else parsed
+        spec = self._specs.get(role)
+        if spec and spec.rename:
+            frame = frame.rename(columns=spec.rename)
+        if role == 'topics' and 'keywords' in frame.columns:
+            frame = frame.assign(keywords=[
+                ', '.join(map(str, words)) if isinstance(words, list) else words
+                for words in frame['keywords']
+            ])
+
+        self._normalized[role] = (parsed, frame)
+        return frame
+
+
+# ============================================================================
+# PIPELINE: BUILD / CHECK
+# ============================================================================
+
+def generate_artifact(dimension_id: str, spec: ArtifactSpec, path: Path, text: Optional[str] = None):
+    """
+    Build a generator-backed artifact from the dimension's text corpus
+
+    Uses the same settings the dashboard pages used to compute on request.
+    """
+    from text_analytics import WordCloudGenerator
+
+    text = text if text is not None else get_loader().get_text_corpus(dimension_id)
+
+    if spec.generator == 'wordcloud':
+        generator = WordCloudGenerator(width=1200, height=600)
+        wordcloud = generator.generate(
+            text, max_words=100, colormap=spec.options.get('colormap', 'viridis'), background_color='white'
+        )
+        generator.save(wordcloud, path)
+    elif spec.generator == 'top_words':
+        top_words = WordCloudGenerator().get_top_words(text, n=spec.options.get('n', 20))
+        pd.DataFrame(top_words, columns=ROLE_COLUMNS['top_words']).to_csv(path, index=False)
+    else:
+        raise ValueError(f"No generator for artifact role '{spec.role}'")
+
+
+def build_manifest(dimension_id: str, generate_missing: bool = True, force: bool = False) -> ArtifactManifest:
+    """
+    Index a dimension's artifacts and write its manifest
+
+    Generator-backed artifacts are built when missing and rebuilt when the
+    input data changed since the last manifest (or with force=True).
+    Fallback artifacts are only built when missing, so files written by
+    the dimension's own pipeline are indexed as they are. Roles without
+    a file are left out.
+
+    Returns:
+        The written manifest
+    """
+    root = output_dir(dimension_id)
+    data_version = data_fingerprint(dimension_id)
+
+    previous = load_manifest(dimension_id)
+    stale = previous is not None and previous.data_version != data_version
+
+    text = None
+    artifacts = []
+    for spec in ARTIFACT_SPECS[dimension_id]:
+        path = root / spec.file
+        if spec.generator and generate_missing and (
+            not path.exists() or (not spec.fallback and (force or stale))
+        ):
+            if text is None:
+                text = get_loader().get_text_corpus(dimension_id)
+            generate_artifact(dimension_id, spec, path, text)
+
+        if not path.exists():
+            continue
+
+        entry = {
+            'role': spec.role,
+            'file': spec.file,
+            'kind': spec.kind,
+            'schema': describe_schema(path, spec.kind),
+            'content_hash': content_hash(path),
+            'bytes': path.stat().st_size,
+            'generator': spec.generator,
+            'generated': bool(spec.generator) and not spec.fallback,
+            'options': spec.options
+        }
+        if spec.kind == 'png':
+            # Downscaled renditions for the pages; rebuilt whenever the image content changed
+            previous_entry = (previous.entry(spec.role) if previous else None) or {}
+            changed = previous_entry.get('content_hash') != entry['content_hash']
+            entry['variants'] = build_variants(path, force=force or changed)
+        artifacts.append(entry)
+
+    payload = {
+        'manifest_version': MANIFEST_VERSION,
+        'dimension': dimension_id,
+        'data_version': data_version,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'artifacts': artifacts
+    }
+
+    path = manifest_path(dimension_id)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
+        f.write('\n')
+    tmp_path.replace(path)
+
+    return ArtifactManifest(dimension_id, payload, root)
+
+
+def check_manifest(dimension_id: str) -> List[str]:
+    """
+    Problems with a dimension's manifest (empty list = up to date)
+
+    Hashes every artifact and data file, so this is for pipelines and
+    tests, not for page loads.
+    """
+    manifest = load_manifest(dimension_id)
+    if manifest is None:
+        return [f"{dimension_id}: no manifest (run artifact_manifest.py)"]
+
+    problems = []
+    if manifest.data_version != data_fingerprint(dimension_id):
+        problems.append(f"{dimension_id}: input data changed since the manifest was built")
+
+    for role, entry in manifest.entries.items():
+        path = manifest.root / entry['file']
+        if not path.exists():
+            problems.append(f"{dimension_id}: {role} missing ({entry['file']})")
+        elif content_hash(path) != entry['content_hash']:
+            problems.append(f"{dimension_id}: {role} changed since the manifest was built ({entry['file']})")
+        for variant in entry.get('variants', []):
+            if not (manifest.root / variant['file']).exists():
+                problems.append(f"{dimension_id}: {role} rendition missing ({variant['file']})")
+
+    for spec in ARTIFACT_SPECS.get(dimension_id, []):
+        if spec.role not in manifest.entries:
+            problems.append(f"{dimension_id}: {spec.role} not in manifest ({spec.file})")
+
+    return problems
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+def load_manifest(dimension_id: str) -> Optional[ArtifactManifest]:
+    """
+    Read a dimension's manifest (cached until the manifest file changes)
+
+    Returns:
+        ArtifactManifest, or None if the pipeline has not written one
+    """
+    path = manifest_path(dimension_id)
+    try:
+        payload = get_loader().load_artifact(path)
+    except FileNotFoundError:
+        return None
+
+    with _cache_lock:
+        cached = _manifest_cache.get(path)
+        if cached and cached[0] is payload:
+            return cached[1]
+
+        manifest = ArtifactManifest(dimension_id, payload, path.parent)
+        _manifest_cache[path] = (payload, manifest)
+    return manifest
+
+
+def get_manifest(dimension_id: str) -> ArtifactManifest:
+    """Manifest for a page: the written manifest, or an empty one if none exists"""
+    return load_manifest(dimension_id) or ArtifactManifest.empty(dimension_id)
+
+
+# ============================================================================
+# PIPELINE ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    dimension_ids = args or [dim.id for dim in ALL_DIMENSIONS]
+
+    print("=" * 70)
+    print("ANALYTICS ARTIFACT MANIFESTS")
+    print("=" * 70)
+
+    if "--check" in sys.argv[1:]:
+        problems = [problem for dimension_id in dimension_ids for problem in check_manifest(dimension_id)]
+        for problem in problems:
+            print(f"⚠️  {problem}")
+        print(f"\n{'✅ All manifests up to date' if not problems else f'❌ {len(problems)} problem(s)'}")
+        sys.exit(1 if problems else 0)
+
+    for dimension_id in dimension_ids:
+        manifest = build_manifest(dimension_id, force="--force" in sys.argv[1:])
+        print(f"\n✅ {dimension_id}: {manifest_path(dimension_id).name} in {output_dir(dimension_id).name}")
+        for role, entry in manifest.entries.items():
+            print(f"   {role:20s} {entry['file']:45s} {entry['content_hash']}")
+
+        start = time.perf_counter()
+        for role in manifest.entries:
+            manifest.load(role)
+        print(f"⏱️  Load all artifacts: {(time.perf_counter() - start) * 1000:.1f} ms")
@@ -0,0 +1,189 @@
+"""
+Startup Cache Warmer
+Background thread that fills the shared caches before the first visitor opens a page
+"""
+import threading
+import time
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from data_loader import load_dimension
+from dimensions import ALL_DIMENSIONS, get_overall_readiness
+from artifact_manifest import get_manifest
+from figure_cache import readiness_figure
+from joint_topics import data_version, get_joint_topics
+from sentiment_stats import get_sentiment_intervals
+from source_index import get_source_index
+from topic_sentiment import TOPIC_SENTIMENT_SOURCES, get_topic_sentiment
+
+
+def warm_dimension_analytics(dimension_id: str):
+    """
+    Load everything a dimension page renders by default into the process caches
+
+    Manifest tables are parsed and normalized, images are encoded to the
+    data URIs the pages embed, and sentiment intervals / topic-sentiment
+    tables are computed for the current file versions, as is the source index.
+    """
+    manifest = get_manifest(dimension_id)
+    for role, entry in manifest.entries.items():
+        if not manifest.has(role):
+            continue
+        if entry['kind'] == 'png':
+            manifest.image_html(role)
+        else:
+            manifest.load(role)
+
+    sentiment_df = manifest.load('sentiment')
+    if sentiment_df is not None:
+        get_sentiment_intervals(
+            sentiment_df,
+            manifest.option('sentiment', 'score_col', 'compound'),
+            manifest.option('sentiment', 'label_col', 'label'),
+            version=manifest.version('sentiment')
+        )
+
+    if dimension_id in TOPIC_SENTIMENT_SOURCES:
+        get_topic_sentiment(dimension_id)
+
+    get_source_index(dimension_id)
+
+
+def warmup_steps() -> List[Tuple[str, Callable]]:
+    """Default warm-up plan: (label, callable) per step, cheapest first per dimension"""
+    steps = []
+    for dimension in ALL_DIMENSIONS:
+        steps.append((f"{dimension.name}: data and corpus", partial(load_dimension, dimension.id)))
+        steps.append((f"{dimension.name}: analytics", partial(warm_dimension_analytics, dimension.id)))
+    steps.append(("Synthesis: readiness chart",
+                  lambda: readiness_figure(ALL_DIMENSIONS, get_overall_readiness()['average_score'])))
+    steps.append(("Synthesis: shared themes", lambda: get_joint_topics(version=data_version(), fit=False)))
+    return steps
+
+
+class CacheWarmer:
+    """
+    Runs warm-up steps once on a daemon thread and reports progress
+
+    Steps only call the regular cached accessors (get_loader(),
+    get_manifest(), get_joint_topics(), ...), so a page rendered while
+    warming is still running computes whatever is missing itself and
+    shares the result. A failing step is recorded and skipped.
+    """
+
+    def __init__(self, steps: Optional[Callable[[], List[Tuple[str, Callable]]]] = None):
+        """
+        Initialize warmer
+
+        Args:
+            steps: Factory returning (label, callable) pairs (default: warmup_steps)
+        """
+        self._steps_factory = steps or warmup_steps
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.total = 0
+        self.completed = 0
+        self.current: Optional[str] = None
+        self.errors: List[Tuple[str, str]] = []
+        self.timings: List[Tuple[str, float]] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def start(self) -> "CacheWarmer":
+        """Start warming in the background (no-op if already started)"""
+        with self._lock:
+            if self._thread is None:
+                self.started_at = time.perf_counter()
+                self._thread = threading.Thread(target=self._run, name="cache-warmer", daemon=True)
+                self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            steps = self._steps_factory()
+            with self._lock:
+                self.total = len(steps)
+
+            for label, step in steps:
+                with self._lock:
+                    self.current = label
+                start = time.perf_counter()
+                try:
+                    step()
+                except Exception as exc:
+                    with self._lock:
+                        self.errors.append((label, str(exc)))
+                with self._lock:
+                    self.timings.append((label, time.perf_counter() - start))
+                    self.completed += 1
+        finally:
+            with self._lock:
+                self.current = None
+                self.finished_at = time.perf_counter()
+            self._done.set()
+
+    @property
+    def done(self) -> bool:
+        """True once every step has run"""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until warming finishes; returns False on timeout"""
+        return self._done.wait(timeout)
+
+    def progress(self) -> Dict:
+        """Snapshot for display: completed, total, fraction, current, errors, elapsed, done"""
+        with self._lock:
+            end = self.finished_at or time.perf_counter()
+            return {
+                'completed': self.completed,
+                'total': self.total,
+                'fraction': self.completed / self.total if self.total else float(self.done),
+                'current': self.current,
+                'errors': list(self.errors),
+                'elapsed': end - self.started_at if self.started_at else 0.0,
+                'done': self.done
+            }
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+_global_warmer = None
+_global_lock = threading.Lock()
+
+def get_cache_warmer() -> CacheWarmer:
+    """Get global cache warmer instance (singleton, shared by all sessions)"""
+    global _global_warmer
+    with _global_lock:
+        if _global_warmer is None:
+            _global_warmer = CacheWarmer()
+    return _global_warmer
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("CACHE WARMER - TEST")
+    print("=" * 70)
+
+    warmer = get_cache_warmer().start()
+    warmer.wait()
+    progress = warmer.progress()
+
+    print()
+    for label, seconds in warmer.timings:
+        print(f"⏱️  {label:50s} {seconds * 1000:8.0f} ms")
+    for label, error in progress['errors']:
+        print(f"⚠️  {label}: {error}")
+    print(f"\n✅ {progress['completed']}/{progress['total']} steps in {progress['elapsed']:.1f} s")
+
+    start = time.perf_counter()
+    for step_label, step in warmup_steps():
+        step()
+    print(f"⏱️  Same steps, warm: {(time.perf_counter() - start) * 1000:.0f} ms")
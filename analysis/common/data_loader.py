@@ -2,9 +2,11 @@
 Unified Data Loader for All XR Dimensions
 Handles different data formats and provides standardized interfaces
 """
+import json
 import pandas as pd
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import sys
 
 # Add dashboard config to path
@@ -25,6 +27,80 @@ class XRDataLoader:
         self.dimensions = ALL_DIMENSIONS
         self.data_cache = {}
 
+        # Parsed files: resolved path -> (file version, object)
+        self._artifact_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+        self._artifact_lock = threading.Lock()
+        self.artifact_reads = 0  # files actually parsed (cache misses)
+
+    # ------------------------------------------------------------------
+    # Cached file access
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def file_version(path: Path) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a file, or None if it does not exist"""
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _parse_file(path: Path) -> Any:
+        if path.suffix == '.csv':
+            return pd.read_csv(path)
+        if path.suffix == '.json':
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        if path.suffix in ('.txt', '.md'):
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        return path.read_bytes()
+
+    def load_artifact(self, path: Path) -> Any:
+        """
+        Parse a data or analytics file once per file version
+
+        The result is shared by every caller in the process (and every
+        Streamlit session), so treat it as read-only: copy a DataFrame
+        before changing it.
+
+        Args:
+            path: CSV, JSON, text or binary (e.g. PNG) file
+
+        Returns:
+            DataFrame (.csv), parsed JSON (.json), str (.txt/.md) or bytes (anything else)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        path = Path(path).resolve()
+        version = self.file_version(path)
+        if version is None:
+            raise FileNotFoundError(f"Artifact not found: {path}")
+
+        with self._artifact_lock:
+            cached = self._artifact_cache.get(path)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+        value = self._parse_file(path)
+
+        with self._artifact_lock:
+            self._artifact_cache[path] = (version, value)
+            self.artifact_reads += 1
+        return value
+
+    def _memoize(self, key: tuple, paths: Sequence[Path], build: Callable[[], Any]) -> Any:
+        """Value derived from files, rebuilt only when one of them changes"""
+        versions = tuple(self.file_version(path) for path in paths)
+        cached = self.data_cache.get(key)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        value = build()
+        self.data_cache[key] = (versions, value)
+        return value
+
     def load_dimension_data(self, dimension_id: str) -> Dict[str, pd.DataFrame]:
         """
         Load all data files for a specific dimension
@@ -35,13 +111,16 @@ class XRDataLoader:
         Returns:
             Dictionary mapping file names to DataFrames
         """
-        if dimension_id in self.data_cache:
-            return self.data_cache[dimension_id]
-
         dimension = get_dimension_by_id(dimension_id)
         if not dimension:
             raise ValueError(f"Unknown dimension ID: {dimension_id}")
 
+        return self._memoize(
+            ('data', dimension_id), dimension.get_data_paths(),
+            lambda: self._read_dimension_data(dimension)
+        )
+
+    def _read_dimension_data(self, dimension: DimensionConfig) -> Dict[str, pd.DataFrame]:
         data = {}
         for file_path in dimension.get_data_paths():
             if not file_path.exists():
@@ -50,17 +129,13 @@ class XRDataLoader:
 
             file_name = file_path.stem
             try:
-                if file_path.suffix == '.csv':
-                    data[file_name] = pd.read_csv(file_path)
-                elif file_path.suffix == '.txt':
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data[file_name] = f.read()
+                if file_path.suffix in ('.csv', '.txt'):
+                    data[file_name] = self.load_artifact(file_path)
                 else:
                     print(f"⚠️  Warning: Unsupported file type: {file_path}")
             except Exception as e:
                 print(f"❌ Error loading {file_path}: {e}")
 
-        self.data_cache[dimension_id] = data
         return data
 
     def load_dimension_corpus(self, dimension_id: str) -> Union[pd.DataFrame, str]:
@@ -98,30 +173,35 @@ class XRDataLoader:
         Returns:
             List of verified article URLs
         """
-        import re
-
         dimension = get_dimension_by_id(dimension_id)
         if not dimension:
             return []
 
+        return self._memoize(
+            ('sources', dimension_id), dimension.get_source_paths() + dimension.get_data_paths(),
+            lambda: self._read_dimension_sources(dimension)
+        )
+
+    def _read_dimension_sources(self, dimension: DimensionConfig) -> List[str]:
+        import re
+
         sources = []
 
         # Try to load from dedicated source files
         for source_file in dimension.get_source_paths():
             if source_file.exists() and source_file.suffix == '.txt':
                 try:
-                    with open(source_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        # Extract all URLs using regex pattern
-                        # Matches http:// or https:// followed by non-whitespace characters
-                        urls = re.findall(r'https?://[^\s]+', content)
-                        sources.extend(urls)
+                    content = self.load_artifact(source_file)
+                    # Extract all URLs using regex pattern
+                    # Matches http:// or https:// followed by non-whitespace characters
+                    urls = re.findall(r'https?://[^\s]+', content)
+                    sources.extend(urls)
                 except Exception as e:
                     print(f"⚠️  Error reading sources from {source_file}: {e}")
 
         # If no dedicated source file, extract from CSV files
         if not sources:
-            data = self.load_dimension_data(dimension_id)
+            data = self.load_dimension_data(dimension.id)
             for df_name, df in data.items():
                 if isinstance(df, pd.DataFrame):
                     # Look for URL columns
@@ -139,6 +219,12 @@ class XRDataLoader:
         Returns:
             Combined text string suitable for word cloud, sentiment, topic modeling
         """
+        return self._memoize(
+            ('text', dimension_id), get_dimension_by_id(dimension_id).get_data_paths(),
+            lambda: self._build_text_corpus(dimension_id)
+        )
+
+    def _build_text_corpus(self, dimension_id: str) -> str:
         corpus_data = self.load_dimension_corpus(dimension_id)
 
         # If it's already a string (text file)
@@ -171,6 +257,35 @@ class XRDataLoader:
 
         return ""
 
+    def get_documents(self, dimension_id: str, passage_words: int = 25) -> List[str]:
+        """
+        Extract individual documents (one string per record) for a dimension
+
+        Args:
+            dimension_id: ID of the dimension
+            passage_words: Passage length used to split plain-text corpora,
+                which have no record boundaries
+
+        Returns:
+            List of document strings
+        """
+        corpus_data = self.load_dimension_corpus(dimension_id)
+
+        if isinstance(corpus_data, str):
+            words = corpus_data.split()
+            return [
+                ' '.join(words[start:start + passage_words])
+                for start in range(0, len(words), passage_words)
+            ]
+
+        if isinstance(corpus_data, pd.DataFrame):
+            columns = {col.lower(): col for col in corpus_data.columns}
+            for name in ['text', 'content', 'raw_text', 'clean_text', 'description']:
+                if name in columns:
+                    return corpus_data[columns[name]].dropna().astype(str).tolist()
+
+        return []
+
     def load_all_dimensions(self) -> Dict[str, Dict]:
         """
         Load data for all dimensions
@@ -302,6 +417,27 @@ def load_dimension(dimension_id: str) -> Dict:
         'text': loader.get_text_corpus(dimension_id)
     }
 
+def iter_text_chunks(
+    file_path: Path,
+    text_column: str,
+    chunksize: int = 1000
+) -> Iterator[List[str]]:
+    """
+    Stream a CSV corpus as lists of texts without loading the whole file
+
+    Args:
+        file_path: CSV file with one document per row
+        text_column: Column holding the document text
+        chunksize: Documents per chunk
+
+    Yields:
+        Lists of non-empty text strings
+    """
+    for chunk in pd.read_csv(file_path, usecols=[text_column], chunksize=chunksize):
+        texts = chunk[text_column].dropna().astype(str).tolist()
+        if texts:
+            yield texts
+
 def get_all_sources() -> List[str]:
     """Get all verified sources across all dimensions"""
     loader = get_loader()
@@ -0,0 +1,333 @@
+"""
+Shared Document-Term Matrix Cache
+Vectorize a corpus once per (corpus version, vectorizer config) and memory-map it on reuse
+"""
+import inspect
+import threading
+import zipfile
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import joblib
+from scipy import sparse
+
+from model_registry import corpus_fingerprint, params_fingerprint
+
+
+# Default cache location (analysis/cache/dtm)
+DTM_CACHE_ROOT = Path(__file__).parent.parent / "cache" / "dtm"
+
+
+@dataclass
+class CachedDTM:
+    """A document-term matrix with the fitted vectorizer that produced it"""
+    key: str
+    matrix: sparse.csr_matrix
+    vectorizer: object
+
+    @property
+    def terms(self) -> np.ndarray:
+        """Vocabulary in column order"""
+        return self.vectorizer.get_feature_names_out()
+
+
+def _memmap_npz(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Memory-map every array in an uncompressed .npz archive
+
+    np.load() ignores mmap_mode for .npz files, so the offset of each
+    stored .npy member is located from its zip local header and mapped
+    directly. Compressed archives fall back to a regular load.
+    """
+    header_readers = {
+        (1, 0): np.lib.format.read_array_header_1_0,
+        (2, 0): np.lib.format.read_array_header_2_0
+    }
+
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as raw:
+        for info in archive.infolist():
+            # Local header: 30 fixed bytes, then file name and extra field
+            raw.seek(info.header_offset + 26)
+            name_len, extra_len = np.frombuffer(raw.read(4), dtype='<u2')
+            raw.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+
+            version = np.lib.format.read_magic(raw) if info.compress_type == zipfile.ZIP_STORED else None
+            if version not in header_readers:
+                with np.load(path, allow_pickle=False) as npz:
+                    return {name: npz[name] for name in npz.files}
+
+            shape, fortran_order, dtype = header_readers[version](raw)
+            name = info.filename[:-len('.npy')]
+
+            if 0 in shape:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                # Copy-on-write: pages load lazily, and estimators that need
+                # writable buffers (e.g. KMeans' Cython loops) get private copies
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode='c', offset=raw.tell(),
+                    shape=shape, order='F' if fortran_order else 'C'
+                )
+    return arrays
+
+
+@lru_cache(maxsize=None)
+def _code_source(obj) -> str:
+    """Source of a class or function (qualified name if the source is unavailable)"""
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return getattr(obj, '__qualname__', repr(obj))
+
+
+def preprocess_fingerprint(preprocess: Optional[Callable[[str], str]]) -> Optional[str]:
+    """
+    Identity of a preprocessing callable: its code and, for a bound method, its object's settings
+
+    For TextPreprocessor.preprocess this covers the cleaning rules (class
+    source) and the stopword set, so changing either yields a new key.
+    """
+    if preprocess is None:
+        return None
+
+    owner = getattr(preprocess, '__self__', None)
+    settings = {}
+    if owner is not None:
+        settings = {
+            name: sorted(value) if isinstance(value, (set, frozenset)) else value
+            for name, value in vars(owner).items()
+        }
+    return params_fingerprint({
+        'callable': getattr(preprocess, '__qualname__', None),
+        'code': _code_source(type(owner) if owner is not None else preprocess),
+        'settings': settings
+    })
+
+
+def _load_csr(path: Path, mmap: bool = True) -> sparse.csr_matrix:
+    """Load a CSR matrix written by sparse.save_npz (memory-mapped if possible)"""
+    if not mmap:
+        return sparse.load_npz(path).tocsr()
+
+    arrays = _memmap_npz(path)
+    matrix = sparse.csr_matrix(
+        (arrays['data'], arrays['indices'], arrays['indptr']),
+        shape=tuple(int(n) for n in arrays['shape']),
+        copy=False
+    )
+    # Saved in canonical form; flag it so scipy never re-sorts the mapped arrays
+    matrix.has_canonical_format = True
+    return matrix
+
+
+class DTMCache:
+    """File-backed cache of vectorized corpora"""
+
+    def __init__(self, root: Optional[Path] = None, mmap: bool = True, max_matrices: int = 16):
+        """
+        Initialize cache
+
+        Args:
+            root: Directory holding cached matrices
+            mmap: Memory-map matrices on load instead of reading them into RAM
+            max_matrices: Matrices kept in memory before the least recently used is dropped
+                (it stays on disk and is mapped again on the next request)
+        """
+        self.root = Path(root) if root else DTM_CACHE_ROOT
+        self.mmap = mmap
+        self.max_matrices = max_matrices
+        self._lock = threading.Lock()
+        self._loaded: "OrderedDict[str, CachedDTM]" = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        texts: List[str],
+        vectorizer,
+        preprocess: Optional[Callable[[str], str]] = None,
+        version: Optional[str] = None
+    ) -> str:
+        """
+        Cache key: <corpus version>-<vectorizer config>
+
+        Args:
+            texts: Raw documents (fingerprinted unless version is given)
+            vectorizer: Unfitted vectorizer; only its parameters matter
+            preprocess: Per-document preprocessing applied before vectorizing
+            version: Explicit corpus version (e.g. data file mtime/size stamp)
+        """
+        config = {
+            'vectorizer': type(vectorizer).__name__,
+            'params': vectorizer.get_params(),
+            'preprocess': preprocess_fingerprint(preprocess)
+        }
+        return f"{version or corpus_fingerprint(texts)}-{params_fingerprint(config)}"
+
+    def _remember(self, cached: CachedDTM):
+        """Keep as most recent and drop beyond max_matrices (caller holds the lock)"""
+        self._loaded[cached.key] = cached
+        self._loaded.move_to_end(cached.key)
+        while len(self._loaded) > self.max_matrices:
+            self._loaded.popitem(last=False)
+
+    def _paths(self, key: str):
+        return self.root / f"{key}.npz", self.root / f"{key}.vectorizer.joblib"
+
+    def load(self, key: str) -> Optional[CachedDTM]:
+        """
+        Load a cached matrix by key
+
+        Returns:
+            CachedDTM, or None if the key is not cached
+        """
+        with self._lock:
+            if key in self._loaded:
+                self._loaded.move_to_end(key)
+                return self._loaded[key]
+
+            matrix_path, vectorizer_path = self._paths(key)
+            if not (matrix_path.exists() and vectorizer_path.exists()):
+                return None
+
+            cached = CachedDTM(key, _load_csr(matrix_path, self.mmap), joblib.load(vectorizer_path))
+            self._remember(cached)
+            return cached
+
+    def get_or_build(
+        self,
+        texts: List[str],
+        vectorizer,
+        preprocess: Optional[Callable[[str], str]] = None,
+        version: Optional[str] = None
+    ) -> CachedDTM:
+        """
+        Cached document-term matrix for a corpus, vectorizing on a miss
+
+        Args:
+            texts: Raw documents
+            vectorizer: Unfitted vectorizer (fitted on a miss)
+            preprocess: Optional per-document preprocessing
+            version: Explicit corpus version instead of a content fingerprint
+
+        Returns:
+            CachedDTM with CSR matrix and fitted vectorizer
+        """
+        texts = ["" if text is None else str(text) for text in texts]
+        key = self.make_key(texts, vectorizer, preprocess, version)
+
+        cached = self.load(key)
+        if cached is not None:
+            return cached
+
+        documents = [preprocess(text) for text in texts] if preprocess else texts
+        matrix = sparse.csr_matrix(vectorizer.fit_transform(documents))
+        matrix.sum_duplicates()  # canonical (sorted, deduplicated) before it is mapped
+
+        matrix_path, vectorizer_path = self._paths(key)
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+            # Uncompressed so the arrays can be memory-mapped on load
+            tmp_matrix = matrix_path.with_suffix('.tmp.npz')
+            sparse.save_npz(tmp_matrix, matrix, compressed=False)
+            tmp_matrix.replace(matrix_path)
+
+            tmp_vectorizer = vectorizer_path.with_suffix('.tmp')
+            joblib.dump(vectorizer, tmp_vectorizer)
+            tmp_vectorizer.replace(vectorizer_path)
+
+            cached = CachedDTM(key, matrix, vectorizer)
+            self._remember(cached)
+
+        return cached
+
+    def clear(self):
+        """Delete all cached matrices"""
+        with self._lock:
+            self._loaded.clear()
+            if self.root.exists():
+                for path in self.root.glob("*"):
+                    path.unlink()
+
+
+def term_frequencies(matrix, terms, n: Optional[int] = 20) -> pd.DataFrame:
+    """
+    Corpus-wide term counts from a document-term matrix
+
+    Args:
+        matrix: Sparse (n_docs, n_terms) count matrix
+        terms: Vocabulary in column order
+        n: Number of top terms to return (None = all)
+
+    Returns:
+        DataFrame with Word, Frequency sorted by frequency (ties alphabetical)
+    """
+    counts = np.asarray(matrix.sum(axis=0)).ravel()
+    terms = np.asarray(terms)
+
+    if n is not None and n < counts.size:
+        top = np.argpartition(-counts, n - 1)[:n]
+        # Keep every term tied with the n-th count so the tie-break is stable
+        top = np.flatnonzero(counts >= counts[top].min())
+    else:
+        top = np.arange(counts.size)
+
+    order = np.lexsort((terms[top], -counts[top]))[:n]
+    return pd.DataFrame({
+        'Word': terms[top][order],
+        'Frequency': counts[top][order].astype(int)
+    })
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+_global_dtm_cache = None
+
+def get_dtm_cache() -> DTMCache:
+    """Get global DTM cache instance (singleton)"""
+    global _global_dtm_cache
+    if _global_dtm_cache is None:
+        _global_dtm_cache = DTMCache()
+    return _global_dtm_cache
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from sklearn.feature_extraction.text import CountVectorizer
+    from data_loader import load_dimension
+
+    print("=" * 70)
+    print("DTM CACHE - TEST")
+    print("=" * 70)
+
+    demo_texts = load_dimension('scalability')['corpus']['content'].astype(str).tolist()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        built = DTMCache(Path(cache_dir)).get_or_build(demo_texts, CountVectorizer(stop_words='english'))
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        loaded = DTMCache(Path(cache_dir)).get_or_build(demo_texts, CountVectorizer(stop_words='english'))
+        load_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n✅ Matrix: {built.matrix.shape[0]} docs x {built.matrix.shape[1]} terms, {built.matrix.nnz:,} non-zeros")
+        base = loaded.matrix.data
+        while base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        print(f"✅ Memory-mapped on reload: {base is not None}")
+        print(f"✅ Identical: {(built.matrix != loaded.matrix).nnz == 0}")
+        print(f"⏱️  Build: {build_ms:.1f} ms, cached load: {load_ms:.1f} ms")
+        print(f"\n{term_frequencies(loaded.matrix, loaded.terms, n=5).to_string(index=False)}")
@@ -0,0 +1,263 @@
+"""
+Dynamic Topic Modeling
+Topics over time: one LDA per time window, warm-started from the previous window
+"""
+import copy
+import os
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from sklearn.decomposition import LatentDirichletAllocation
+from sklearn.feature_extraction.text import CountVectorizer
+
+from dtm_cache import get_dtm_cache
+from lda_planner import plan_for_matrix
+from topic_coherence import top_word_indices
+
+
+# ============================================================================
+# WINDOW CHAIN WORKERS
+# ============================================================================
+
+# Document-term matrix shared by chain worker processes (set once per worker)
+_chain_doc_term_matrix = None
+
+def _init_chain_worker(doc_term_matrix):
+    """Process-pool initializer: receive the shared matrix once per worker"""
+    global _chain_doc_term_matrix
+    _chain_doc_term_matrix = doc_term_matrix
+
+def warm_start_update(
+    model: LatentDirichletAllocation,
+    doc_term_matrix,
+    passes: int = 5
+) -> LatentDirichletAllocation:
+    """
+    Adapt a fitted LDA to a new window without refitting from scratch
+
+    The copy starts from the previous window's topic-word distribution and
+    takes a few online variational Bayes passes over the new documents, so
+    topics keep their identity while their keywords drift.
+
+    Args:
+        model: LDA fitted on the previous window (left unchanged)
+        doc_term_matrix: New window's documents over the same vocabulary
+        passes: Online passes over the new window
+
+    Returns:
+        Updated copy of the model
+    """
+    model = copy.deepcopy(model)
+    # Treat the window as the whole corpus, and restart the learning-rate
+    # schedule so every window adapts by the same amount
+    model.total_samples = doc_term_matrix.shape[0]
+    model.n_batch_iter_ = 1
+    for _ in range(passes):
+        model.partial_fit(doc_term_matrix)
+    return model
+
+def _fit_window_chain(task: Dict) -> List[Dict]:
+    """Fit the windows of one group in time order, each warm-started from the last"""
+    doc_term_matrix = _chain_doc_term_matrix
+
+    model = None
+    results = []
+    for window, rows in task['windows']:
+        window_matrix = doc_term_matrix[rows]
+
+        start = time.perf_counter()
+        if model is None:
+            # One core per chain: parallelism comes from the process pool
+            plan = plan_for_matrix(window_matrix, task['n_topics'], cores=1)
+            model = LatentDirichletAllocation(
+                n_components=task['n_topics'],
+                random_state=task['random_state'],
+                **plan.lda_kwargs()
+            ).fit(window_matrix)
+        else:
+            model = warm_start_update(model, window_matrix, task['passes'])
+        fit_seconds = time.perf_counter() - start
+
+        results.append({
+            'group': task['group'],
+            'window': window,
+            'n_documents': len(rows),
+            'prevalence': model.transform(window_matrix).mean(axis=0),
+            'top_words': top_word_indices(model.components_, task['n_top_words']),
+            'fit_seconds': fit_seconds,
+            'warm_start': len(results) > 0
+        })
+
+    return results
+
+
+# ============================================================================
+# DYNAMIC TOPIC MODEL
+# ============================================================================
+
+def keyword_drift(top_words: pd.Series) -> pd.Series:
+    """
+    Jaccard similarity of each topic's keywords with the previous window
+
+    Args:
+        top_words: Keyword lists of one topic in time order
+
+    Returns:
+        Series aligned with top_words (NaN for the first window)
+    """
+    previous = top_words.shift(1)
+    return pd.Series([
+        np.nan if not isinstance(before, list)
+        else len(set(now) & set(before)) / len(set(now) | set(before))
+        for now, before in zip(top_words, previous)
+    ], index=top_words.index)
+
+
+def fit_dynamic_topics(
+    texts: List[str],
+    dates,
+    groups=None,
+    n_topics: int = 3,
+    freq: str = 'M',
+    passes: int = 5,
+    n_top_words: int = 10,
+    max_features: int = 1000,
+    random_state: int = 42,
+    max_workers: Optional[int] = None
+) -> Dict:
+    """
+    Fit a topic model per time window, warm-started window to window
+
+    The corpus is vectorized once, so every window shares one vocabulary.
+    Windows of a group form a chain: the first window is fitted normally,
+    later windows start from the previous window's topics. Chains of
+    different groups are independent and run in parallel processes.
+
+    Args:
+        texts: List of text documents
+        dates: Date per document (anything pd.to_datetime accepts)
+        groups: Optional group per document (e.g. category); one chain per group
+        n_topics: Number of topics per window
+        freq: Window length as a pandas period alias ('M' = month, 'W' = week)
+        passes: Online passes when warm-starting a window
+        n_top_words: Keywords per topic
+        max_features: Maximum vocabulary size
+        random_state: Random seed for reproducibility
+        max_workers: Worker processes (default: one per chain; 1 = in-process)
+
+    Returns:
+        Dictionary with 'prevalence' (group, window, n_documents, topic_id,
+        topic_label, prevalence), 'drift' (group, window, topic_id, top_words,
+        jaccard_to_previous, new_words) and 'windows' (group, window,
+        n_documents, warm_start, fit_seconds)
+    """
+    frame = pd.DataFrame({
+        'text': ["" if text is None else str(text) for text in texts],
+        'window': pd.to_datetime(pd.Series(list(dates))).dt.to_period(freq).astype(str),
+        'group': 'all' if groups is None else pd.Series(list(groups)).astype(str)
+    })
+
+    cached = get_dtm_cache().get_or_build(frame['text'].tolist(), CountVectorizer(
+        max_df=0.85,
+        min_df=2,
+        stop_words='english',
+        max_features=max_features
+    ))
+    terms = cached.terms
+
+    tasks = [
+        {
+            'group': group,
+            'windows': [
+                (window, rows.to_numpy())
+                for window, rows in group_frame.groupby('window', sort=True).groups.items()
+            ],
+            'n_topics': n_topics,
+            'random_state': random_state,
+            'passes': passes,
+            'n_top_words': min(n_top_words, len(terms))
+        }
+        for group, group_frame in frame.reset_index(drop=True).groupby('group', sort=True)
+    ]
+
+    max_workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+    if max_workers <= 1:
+        _init_chain_worker(cached.matrix)
+        chains = [_fit_window_chain(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_chain_worker,
+            initargs=(cached.matrix,)
+        ) as executor:
+            chains = list(executor.map(_fit_window_chain, tasks))
+
+    results = [result for chain in chains for result in chain]
+
+    windows = pd.DataFrame([
+        {key: result[key] for key in ('group', 'window', 'n_documents', 'warm_start', 'fit_seconds')}
+        for result in results
+    ])
+
+    topics = pd.DataFrame([
+        {
+            'group': result['group'],
+            'window': result['window'],
+            'n_documents': result['n_documents'],
+            'topic_id': topic_id,
+            'topic_label': ', '.join(terms[result['top_words'][topic_id][:3]]),
+            'prevalence': float(result['prevalence'][topic_id]),
+            'top_words': terms[result['top_words'][topic_id]].tolist()
+        }
+        for result in results
+        for topic_id in range(n_topics)
+    ])
+
+    by_topic = topics.groupby(['group', 'topic_id'], sort=False)['top_words']
+    topics['jaccard_to_previous'] = by_topic.transform(keyword_drift)
+    previous_words = by_topic.shift(1)
+    topics['new_words'] = [
+        [] if not isinstance(before, list) else [word for word in now if word not in before]
+        for now, before in zip(topics['top_words'], previous_words)
+    ]
+
+    return {
+        'prevalence': topics[['group', 'window', 'n_documents', 'topic_id', 'topic_label', 'prevalence']],
+        'drift': topics[['group', 'window', 'topic_id', 'top_words', 'jaccard_to_previous', 'new_words']],
+        'windows': windows
+    }
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    from data_loader import load_dimension
+
+    print("=" * 70)
+    print("DYNAMIC TOPICS - TEST")
+    print("=" * 70)
+
+    corpus = load_dimension('scalability')['corpus']
+
+    start = time.perf_counter()
+    dynamic = fit_dynamic_topics(corpus['content'].astype(str).tolist(), corpus['date'], max_workers=1)
+    print(f"\n⏱️  Monthly chain: {time.perf_counter() - start:.2f} s")
+    print(dynamic['windows'].round(3).to_string(index=False))
+
+    prevalence = dynamic['prevalence'].pivot(index='window', columns='topic_id', values='prevalence')
+    print(f"\n✅ Topic prevalence by month:\n{(prevalence * 100).round(1).to_string()}")
+
+    drift = dynamic['drift'].dropna(subset=['jaccard_to_previous'])
+    print(f"\n✅ Mean keyword overlap with previous month: {drift['jaccard_to_previous'].mean():.2f}")
+
+    start = time.perf_counter()
+    by_category = fit_dynamic_topics(
+        corpus['content'].astype(str).tolist(), corpus['date'], groups=corpus['category']
+    )
+    print(f"\n⏱️  Per-category chains ({by_category['windows']['group'].nunique()} in parallel): "
+          f"{time.perf_counter() - start:.2f} s")
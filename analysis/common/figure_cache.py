@@ -0,0 +1,212 @@
+"""
+Rendered Figure Cache
+Matplotlib figures rendered once per input fingerprint and shared across sessions
+"""
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Union
+
+import numpy as np
+
+
+def fingerprint(**inputs) -> str:
+    """
+    Stable hash of a figure's inputs
+
+    Args:
+        **inputs: JSON-serializable values (numpy scalars/arrays via str())
+
+    Returns:
+        16 hex characters
+    """
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class FigureCache:
+    """
+    Thread-safe LRU cache of rendered figures (SVG text or PNG bytes)
+
+    Keys are (figure name, input fingerprint, format): a figure is laid
+    out and rasterized once per distinct input, then every rerun and
+    every session reuses the stored output.
+    """
+
+    def __init__(self, max_figures: int = 64):
+        """
+        Initialize cache
+
+        Args:
+            max_figures: Rendered figures kept before the least recently used is evicted
+        """
+        self.max_figures = max_figures
+        self._figures: "OrderedDict[tuple, Union[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.renders = 0
+
+    @staticmethod
+    def _serialize(fig, fmt: str, dpi: int) -> Union[str, bytes]:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+        data = buffer.getvalue()
+        return data.decode('utf-8') if fmt == 'svg' else data
+
+    def get_or_render(
+        self,
+        name: str,
+        render: Callable,
+        fmt: str = 'svg',
+        dpi: int = 100,
+        **inputs
+    ) -> Union[str, bytes]:
+        """
+        Rendered figure for these inputs, drawing it only on a miss
+
+        Args:
+            name: Figure identity (e.g. 'synthesis_readiness')
+            render: Callable taking **inputs and returning a matplotlib Figure;
+                use matplotlib.figure.Figure rather than pyplot, which is not thread-safe
+            fmt: 'svg' (text, crisp at any width) or 'png' (bytes)
+            dpi: Resolution for raster output
+            **inputs: Everything the figure depends on; hashed into the key
+
+        Returns:
+            SVG markup (str) or PNG bytes, ready for st.image()
+        """
+        key = (name, fingerprint(**inputs), fmt, dpi)
+        with self._lock:
+            if key in self._figures:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return self._figures[key]
+
+        # Render outside the lock: concurrent first visits may both draw, the result is identical
+        output = self._serialize(render(**inputs), fmt, dpi)
+
+        with self._lock:
+            self.renders += 1
+            self._figures[key] = output
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.max_figures:
+                self._figures.popitem(last=False)
+        return output
+
+    def stats(self) -> Dict:
+        """Cached figures, hits and renders"""
+        with self._lock:
+            return {'figures': len(self._figures), 'hits': self.hits, 'renders': self.renders}
+
+    def clear(self):
+        """Drop all rendered figures"""
+        with self._lock:
+            self._figures.clear()
+
+
+# ============================================================================
+# DASHBOARD FIGURES
+# ============================================================================
+
+def render_readiness_figure(dimensions_short: List[str], scores: List[float], average_score: float):
+    """Bar + radar chart of the readiness scores"""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(14, 5))
+
+    # Bar chart
+    ax1 = fig.add_subplot(121)
+    colors_list = ['#00C9A7' if s >= 80 else '#FFC107' if s >= 60 else '#DC3545' for s in scores]
+
+    ax1.barh(dimensions_short, scores, color=colors_list, alpha=0.8, edgecolor='black')
+    ax1.axvline(x=average_score, color='red', linestyle='--', linewidth=2, label=f'Average: {average_score:.0f}%')
+    ax1.set_xlabel('Readiness Score (%)', fontweight='bold')
+    ax1.set_title('Dimension Readiness Scores', fontweight='bold', fontsize=14)
+    ax1.legend()
+    ax1.grid(axis='x', alpha=0.3)
+
+    # Radar chart
+    angles = np.linspace(0, 2 * np.pi, len(scores), endpoint=False).tolist()
+    scores_radar = scores + [scores[0]]  # Close the polygon
+    angles += angles[:1]
+
+    ax2 = fig.add_subplot(122, projection='polar')
+    ax2.plot(angles, scores_radar, 'o-', linewidth=2, color='#0066CC')
+    ax2.fill(angles, scores_radar, alpha=0.25, color='#00C9A7')
+    ax2.set_xticks(angles[:-1])
+    ax2.set_xticklabels(dimensions_short, size=9)
+    ax2.set_ylim(0, 100)
+    ax2.set_yticks([20, 40, 60, 80, 100])
+    ax2.set_title('Five-Dimension Radar', fontweight='bold', fontsize=14, pad=20)
+    ax2.grid(True)
+
+    fig.tight_layout()
+    return fig
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+_global_figure_cache = None
+
+def get_figure_cache() -> FigureCache:
+    """Get global rendered-figure cache instance (singleton)"""
+    global _global_figure_cache
+    if _global_figure_cache is None:
+        _global_figure_cache = FigureCache()
+    return _global_figure_cache
+
+def readiness_figure(dimensions: List, average_score: float) -> str:
+    """
+    Synthesis page readiness chart as SVG (drawn only when the scores change)
+
+    Args:
+        dimensions: DimensionConfig objects (e.g. ALL_DIMENSIONS)
+        average_score: Overall readiness average
+
+    Returns:
+        SVG markup for st.image()
+    """
+    return get_figure_cache().get_or_render(
+        'synthesis_readiness',
+        render_readiness_figure,
+        dimensions_short=[dim.name.split()[-1] if len(dim.name.split()) > 2 else dim.name for dim in dimensions],
+        scores=[dim.readiness_score for dim in dimensions],
+        average_score=average_score
+    )
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    def render_bars(labels, values):
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(8, 4))
+        ax = fig.add_subplot(111)
+        ax.barh(labels, values)
+        return fig
+
+    print("=" * 70)
+    print("FIGURE CACHE - TEST")
+    print("=" * 70)
+
+    cache = FigureCache()
+    inputs = {'labels': ['Maturity', 'Scalability'], 'values': [80, 75]}
+
+    start = time.perf_counter()
+    svg = cache.get_or_render('bars', render_bars, **inputs)
+    print(f"\n⏱️  First render: {(time.perf_counter() - start) * 1000:.0f} ms ({len(svg) / 1e3:.0f} KB SVG)")
+
+    start = time.perf_counter()
+    assert cache.get_or_render('bars', render_bars, **inputs) is svg
+    print(f"⏱️  Cached: {(time.perf_counter() - start) * 1000:.3f} ms")
+
+    cache.get_or_render('bars', render_bars, labels=inputs['labels'], values=[80, 90])
+    print(f"✅ New inputs re-render: {cache.stats()}")
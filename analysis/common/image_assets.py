@@ -0,0 +1,331 @@
+"""
+Image Asset Variants
+Downscaled WebP/PNG renditions of large analytics images, served from memory
+
+The pipelines save word clouds and charts at 300 dpi (up to ~3800 px wide,
+~2 MB). Pages show them at most 1440 px wide, so build_variants() writes
+smaller renditions next to each image once, and get_image() serves the
+variant that fits the layout.
+
+With server.enableStaticServing (see .streamlit/config.toml), image_html()
+publishes the chosen rendition to dashboard/static/img/ and links it by URL,
+so browsers download each image version once and cache it; otherwise the
+bytes are inlined as a data URI.
+"""
+import base64
+import hashlib
+import html
+import io
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, features
+
+from data_loader import get_loader
+
+
+VARIANT_DIR = "_variants"  # next to the source image
+VARIANT_WIDTHS = (480, 960, 1440)
+FULL_WIDTH = 1440  # wide page layout
+COLUMN_WIDTH = 960  # half/two-thirds columns
+
+# WebP is ~4x smaller than PNG for word clouds; PNG is the fallback when Pillow lacks a WebP encoder
+VARIANT_FORMATS = ('webp', 'png') if features.check('webp') else ('png',)
+MIME_TYPES = {'webp': 'image/webp', 'png': 'image/png'}
+
+# Streamlit serves <main script folder>/static/ at app/static/ (dashboard/app.py -> dashboard/static)
+STATIC_IMAGE_DIR = Path(__file__).resolve().parents[2] / "dashboard" / "static" / "img"
+STATIC_IMAGE_URL = "app/static/img"
+
+# Encoded data URIs: variant path -> (cached bytes object, data URI)
+_uri_cache: Dict[Path, tuple] = {}
+# Published static copies: variant path -> (cached bytes object, URL)
+_url_cache: Dict[Path, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def variant_path(source: Path, width: int, fmt: str) -> Path:
+    """Location of one rendition of a source image"""
+    source = Path(source)
+    return source.parent / VARIANT_DIR / f"{source.stem}_w{width}.{fmt}"
+
+
+def _rejected_marker(variant: Path) -> Path:
+    """Empty file recording that a rendition was not smaller than its source"""
+    return variant.with_name(variant.name + ".skip")
+
+
+def _is_current(variant: Path, source: Path) -> bool:
+    """True if the variant exists and is not older than its source"""
+    return variant.exists() and variant.stat().st_mtime_ns >= source.stat().st_mtime_ns
+
+
+def build_variants(
+    source: Path,
+    widths: Tuple[int, ...] = VARIANT_WIDTHS,
+    formats: Tuple[str, ...] = VARIANT_FORMATS,
+    force: bool = False
+) -> List[Dict]:
+    """
+    Write downscaled renditions of an image (skipping ones already current)
+
+    Widths above the source width are capped at it, which gives a
+    same-size WebP copy of narrow images. Renditions that would not be
+    smaller than the source are not written: the original is served
+    instead, and a marker file keeps them from being re-encoded on the
+    next run.
+
+    Args:
+        source: PNG to downscale
+        widths: Target widths in pixels
+        formats: Output formats ('webp', 'png')
+        force: Rewrite variants even if they are newer than the source
+
+    Returns:
+        One dict per variant: width, height, format, file (relative to the source folder), bytes
+    """
+    source = Path(source)
+    source_bytes = source.stat().st_size
+    variants = []
+
+    with Image.open(source) as image:
+        image.load()
+        for width in sorted({min(width, image.width) for width in widths}):
+            height = round(image.height * width / image.width)
+            resized = None
+
+            for fmt in formats:
+                path = variant_path(source, width, fmt)
+                rejected = _rejected_marker(path)
+                if not force and _is_current(rejected, source):
+                    continue
+
+                if force or not _is_current(path, source):
+                    if resized is None:
+                        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                    buffer = io.BytesIO()
+                    if fmt == 'webp':
+                        resized.save(buffer, 'WEBP', quality=85, method=6)
+                    else:
+                        resized.save(buffer, 'PNG', optimize=True)
+
+                    path.parent.mkdir(exist_ok=True)
+                    if buffer.tell() >= source_bytes:
+                        path.unlink(missing_ok=True)
+                        rejected.touch()
+                        continue
+                    path.write_bytes(buffer.getvalue())
+                    rejected.unlink(missing_ok=True)
+
+                variants.append({
+                    'width': width,
+                    'height': height,
+                    'format': fmt,
+                    'file': path.relative_to(source.parent).as_posix(),
+                    'bytes': path.stat().st_size
+                })
+
+    return variants
+
+
+def current_variants(source: Path, fmt: str) -> Dict[int, Path]:
+    """Renditions of a source in one format that are not older than it, by width"""
+    source = Path(source)
+    variants = {}
+    for path in (source.parent / VARIANT_DIR).glob(f"{source.stem}_w*.{fmt}"):
+        width = path.stem[len(source.stem) + 2:]
+        if width.isdigit() and _is_current(path, source):
+            variants[int(width)] = path
+    return variants
+
+
+def pick_variant(
+    source: Path,
+    width: int = FULL_WIDTH,
+    fmt: Optional[str] = None,
+    variants: Optional[List[Dict]] = None
+) -> Path:
+    """
+    Best file to serve at a display width
+
+    The narrowest rendition at least `width` wide, or the largest one when
+    the source itself is narrower than `width`. Falls back to the source
+    when no suitable rendition exists.
+
+    Args:
+        source: Original image
+        width: Display width in pixels
+        fmt: Rendition format (default: first of VARIANT_FORMATS that exists)
+        variants: Renditions recorded by build_variants() (e.g. in an artifact
+            manifest); without them, files newer than the source are used
+    """
+    source = Path(source)
+    by_width = {}
+    for candidate in ([fmt] if fmt else VARIANT_FORMATS):
+        if variants is None:
+            by_width = current_variants(source, candidate)
+        else:
+            by_width = {
+                variant['width']: source.parent / variant['file'] for variant in variants
+                if variant['format'] == candidate and (source.parent / variant['file']).exists()
+            }
+        if by_width:
+            break
+    variants = by_width
+    if not variants:
+        return source
+
+    wide_enough = [w for w in variants if w >= width]
+    if wide_enough:
+        return variants[min(wide_enough)]
+    with Image.open(source) as image:  # reads the header only
+        source_width = image.width
+    widest = max(variants)
+    return variants[widest] if widest >= source_width else source
+
+
+def get_image(
+    source: Path,
+    width: int = FULL_WIDTH,
+    fmt: Optional[str] = None,
+    variants: Optional[List[Dict]] = None
+) -> Tuple[bytes, str]:
+    """
+    Encoded bytes of the rendition to serve (read once per file version)
+
+    Returns:
+        (bytes, mime type)
+    """
+    path = pick_variant(source, width, fmt, variants)
+    return get_loader().load_artifact(path), MIME_TYPES.get(path.suffix.lstrip('.'), 'image/png')
+
+
+def image_data_uri(source: Path, width: int = FULL_WIDTH, variants: Optional[List[Dict]] = None) -> str:
+    """Data URI of the rendition to serve, encoded once per file version"""
+    path = pick_variant(source, width, variants=variants)
+    data = get_loader().load_artifact(path)
+    mime_type = MIME_TYPES.get(path.suffix.lstrip('.'), 'image/png')
+
+    with _cache_lock:
+        cached = _uri_cache.get(path)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+
+    uri = f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+    with _cache_lock:
+        _uri_cache[path] = (data, uri)
+    return uri
+
+
+def static_image_url(path: Path) -> str:
+    """
+    Browser-cacheable URL of an image file, published to STATIC_IMAGE_DIR once per file version
+
+    Copies are named by content hash. The ?v= query makes the static file
+    handler send a long Cache-Control max-age, so a browser fetches each
+    version once instead of receiving it inline on every rerun.
+    """
+    path = Path(path)
+    data = get_loader().load_artifact(path)
+
+    with _cache_lock:
+        cached = _url_cache.get(path)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    name = f"{digest}{path.suffix}"
+    target = STATIC_IMAGE_DIR / name
+    if not target.exists():
+        STATIC_IMAGE_DIR.mkdir(parents=True, exist_ok=True)
+        partial = target.with_name(f".{name}.{threading.get_ident()}.tmp")  # sessions may publish concurrently
+        partial.write_bytes(data)
+        partial.replace(target)
+
+    url = f"{STATIC_IMAGE_URL}/{name}?v={digest}"
+    with _cache_lock:
+        _url_cache[path] = (data, url)
+    return url
+
+
+def static_serving_enabled() -> bool:
+    """True if Streamlit serves app static files (server.enableStaticServing)"""
+    try:
+        from streamlit import config
+    except ImportError:
+        return False
+    return bool(config.get_option("server.enableStaticServing"))
+
+
+def image_html(
+    source: Path,
+    alt: str = "",
+    width: int = FULL_WIDTH,
+    variants: Optional[List[Dict]] = None,
+    inline: Optional[bool] = None
+) -> str:
+    """
+    <picture>/<img> tag for st.markdown(..., unsafe_allow_html=True)
+
+    st.image() decodes every image and re-encodes anything that is not
+    JPEG/PNG/GIF on each render; a tag ships the pre-built WebP bytes as
+    they are, with the PNG rendition as fallback for browsers without WebP.
+
+    Args:
+        inline: Embed a data URI instead of linking static files
+            (default: only when static serving is disabled)
+    """
+    alt = html.escape(alt, quote=True)
+    style = "width: 100%; height: auto;"
+    if inline is None:
+        inline = not static_serving_enabled()
+    if inline:
+        return f"<img src='{image_data_uri(source, width, variants)}' alt='{alt}' style='{style}'>"
+
+    fallback = pick_variant(source, width, 'png', variants)
+    tag = f"<img src='{static_image_url(fallback)}' alt='{alt}' style='{style}'>"
+    webp = pick_variant(source, width, 'webp', variants) if 'webp' in VARIANT_FORMATS else None
+    if webp is None or webp.suffix != '.webp':
+        return tag
+    return f"<picture><source srcset='{static_image_url(webp)}' type='image/webp'>{tag}</picture>"
+
+
+# ============================================================================
+# PIPELINE ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # python image_assets.py [--force] [image.png ...]  (default: every manifest image)
+    sources = [Path(arg) for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not sources:
+        from artifact_manifest import get_manifest
+        from dimensions import ALL_DIMENSIONS
+        for dimension in ALL_DIMENSIONS:
+            manifest = get_manifest(dimension.id)
+            sources.extend(
+                manifest.path(role) for role, entry in manifest.entries.items()
+                if entry['kind'] == 'png' and manifest.has(role)
+            )
+
+    print("=" * 70)
+    print("IMAGE ASSET VARIANTS")
+    print("=" * 70)
+
+    for source in sources:
+        variants = build_variants(source, force="--force" in sys.argv[1:])
+        original = source.stat().st_size
+        print(f"\n✅ {source.name} ({original / 1e6:.2f} MB)")
+        for variant in variants:
+            print(f"   {variant['file']:55s} {variant['bytes'] / 1e3:7.1f} KB "
+                  f"({original / variant['bytes']:.0f}x smaller)")
+
+        start = time.perf_counter()
+        image_data_uri(source)
+        first = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        image_data_uri(source)
+        print(f"⏱️  Serve {FULL_WIDTH}px: first {first:.1f} ms, cached {(time.perf_counter() - start) * 1000:.3f} ms")
@@ -0,0 +1,249 @@
+"""
+Joint Cross-Dimension Topic Model
+One topic model over the union of all dimension corpora, with dimension as a document attribute
+
+Run this module (or export_static_dashboard.py) to fit and register the
+model; the Synthesis page only loads it.
+"""
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+from data_loader import XRDataLoader, get_loader
+from dimensions import ALL_DIMENSIONS, get_dimension_by_id
+from sentiment_stats import dataset_version
+from model_registry import ModelRegistry
+from text_analytics import TopicModeler
+
+
+JOINT_MODEL_NAME = 'joint_dimensions'
+
+# Process-wide cache: (data version, n_topics, engine) -> joint topic results
+_joint_cache: Dict[tuple, Dict] = {}
+_cache_lock = threading.Lock()
+
+
+def data_version(dimension_ids: Optional[List[str]] = None) -> str:
+    """
+    Combined version stamp of every data file behind the given dimensions
+
+    Returns:
+        Version string that changes when any underlying file changes
+    """
+    dimension_ids = dimension_ids or [dim.id for dim in ALL_DIMENSIONS]
+    stamps = [
+        dataset_version(path)
+        for dimension_id in dimension_ids
+        for path in get_dimension_by_id(dimension_id).get_data_paths()
+    ]
+    return '|'.join(stamps)
+
+
+def build_union_corpus(
+    loader: Optional[XRDataLoader] = None,
+    dimension_ids: Optional[List[str]] = None,
+    deduplicate: bool = True
+) -> pd.DataFrame:
+    """
+    Stack the documents of several dimensions into one corpus
+
+    Args:
+        loader: Data loader (default: global loader)
+        dimension_ids: Dimensions to include (default: all)
+        deduplicate: Drop repeated documents within a dimension so templated
+            corpora do not dominate the shared topics
+
+    Returns:
+        DataFrame with dimension_id, dimension_name, text
+    """
+    loader = loader or get_loader()
+    dimension_ids = dimension_ids or [dim.id for dim in ALL_DIMENSIONS]
+
+    frames = []
+    for dimension_id in dimension_ids:
+        texts = pd.Series(loader.get_documents(dimension_id), dtype='string').str.strip()
+        texts = texts[texts.str.len() > 0]
+        if deduplicate:
+            texts = texts.drop_duplicates()
+
+        frames.append(pd.DataFrame({
+            'dimension_id': dimension_id,
+            'dimension_name': get_dimension_by_id(dimension_id).name,
+            'text': texts.to_numpy(dtype=object)
+        }))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def topic_prevalence(doc_topics: np.ndarray, groups: pd.Series) -> pd.DataFrame:
+    """
+    Mean topic proportions per group (e.g. per dimension)
+
+    Args:
+        doc_topics: Doc-topic matrix of shape (n_documents, n_topics)
+        groups: Group label per document
+
+    Returns:
+        DataFrame (groups x topics) whose rows sum to 1
+    """
+    codes, uniques = pd.factorize(groups, sort=False)
+    membership = np.zeros((len(uniques), len(codes)))
+    membership[codes, np.arange(len(codes))] = 1.0
+
+    prevalence = (membership @ doc_topics) / membership.sum(axis=1, keepdims=True)
+    return pd.DataFrame(prevalence, index=pd.Index(uniques, name=groups.name))
+
+
+def theme_overlap(prevalence: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pairwise theme overlap between groups (Bhattacharyya coefficient)
+
+    1.0 means identical topic mixtures, 0.0 means no shared topics.
+
+    Returns:
+        Symmetric DataFrame (groups x groups)
+    """
+    root = np.sqrt(prevalence.to_numpy())
+    return pd.DataFrame(root @ root.T, index=prevalence.index, columns=prevalence.index)
+
+
+def summarize_joint_model(modeler: TopicModeler, corpus: pd.DataFrame) -> Dict:
+    """
+    Per-dimension summary of a joint topic model
+
+    Returns:
+        Dictionary with topic labels, prevalence (dimension x topic),
+        overlap (dimension x dimension), document counts, and the modeler
+    """
+    labels = modeler.get_topic_labels()
+    doc_topics = modeler.transform(corpus['text'].tolist())
+    prevalence = topic_prevalence(doc_topics, corpus['dimension_name'])
+    prevalence.columns = [labels[topic_id] for topic_id in prevalence.columns]
+
+    return {
+        'labels': labels,
+        'prevalence': prevalence,
+        'overlap': theme_overlap(prevalence),
+        'n_documents': corpus['dimension_name'].value_counts(sort=False).to_dict(),
+        'modeler': modeler
+    }
+
+
+def fit_joint_model(
+    corpus: pd.DataFrame,
+    n_topics: int = 6,
+    engine: str = 'lda',
+    random_state: int = 42,
+    registry: Optional[ModelRegistry] = None
+) -> Dict:
+    """
+    Fit one topic model on the union corpus and summarize it per dimension
+
+    The fitted model is kept in the model registry, so the same corpus
+    is only fitted once across restarts.
+
+    Args:
+        corpus: Output of build_union_corpus()
+        n_topics: Number of shared topics
+        engine: Topic engine (see topic_engines)
+        random_state: Random seed for reproducibility
+        registry: Model registry to load from and save to (default: shared registry)
+
+    Returns:
+        Dictionary as returned by summarize_joint_model()
+    """
+    modeler = TopicModeler.load_or_fit(
+        JOINT_MODEL_NAME, corpus['text'].tolist(), n_topics=n_topics, random_state=random_state,
+        registry=registry, engine=engine
+    )
+    return summarize_joint_model(modeler, corpus)
+
+
+def load_joint_model(
+    corpus: pd.DataFrame,
+    n_topics: int = 6,
+    engine: str = 'lda',
+    random_state: int = 42,
+    registry: Optional[ModelRegistry] = None
+) -> Optional[Dict]:
+    """
+    Summary of the registered joint model for this corpus, without fitting
+
+    Returns:
+        Dictionary as returned by summarize_joint_model(), or None if
+        fit_joint_model() has not been run on this corpus yet
+    """
+    modeler = TopicModeler.find_registered(
+        JOINT_MODEL_NAME, corpus['text'].tolist(), n_topics=n_topics, random_state=random_state,
+        registry=registry, engine=engine
+    )
+    return summarize_joint_model(modeler, corpus) if modeler is not None else None
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+def get_joint_topics(
+    n_topics: int = 6,
+    engine: str = 'lda',
+    version: Optional[str] = None,
+    fit: bool = True
+) -> Optional[Dict]:
+    """
+    Joint topic results for all dimensions, computed once per data version
+
+    Args:
+        n_topics: Number of shared topics
+        engine: Topic engine (see topic_engines)
+        version: Data version stamp (default: data_version())
+        fit: Fit and register the model if it is missing; dashboard pages pass
+            False and rely on the pipeline (python joint_topics.py) having built it
+
+    Returns:
+        Dictionary as returned by fit_joint_model(), or None if fit is False
+        and the model has not been built for the current data
+    """
+    key = (version or data_version(), n_topics, engine)
+    with _cache_lock:
+        if key in _joint_cache:
+            return _joint_cache[key]
+
+    corpus = build_union_corpus()
+    if fit:
+        result = fit_joint_model(corpus, n_topics=n_topics, engine=engine)
+    else:
+        result = load_joint_model(corpus, n_topics=n_topics, engine=engine)
+        if result is None:
+            return None  # not cached: picked up once the pipeline has built it
+
+    with _cache_lock:
+        _joint_cache[key] = result
+    return result
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("JOINT CROSS-DIMENSION TOPICS - TEST")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    joint = get_joint_topics()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n✅ Documents per dimension: {joint['n_documents']}")
+    print(f"✅ Shared themes: {list(joint['labels'].values())}")
+    print(f"\n{(joint['prevalence'] * 100).round(1).to_string()}")
+    print(f"\n{joint['overlap'].round(2).to_string()}")
+    print(f"\n⏱️  First call: {elapsed:.2f} s")
+
+    start = time.perf_counter()
+    get_joint_topics()
+    print(f"⏱️  Cached call: {(time.perf_counter() - start) * 1000:.3f} ms")
@@ -0,0 +1,136 @@
+"""
+LDA Execution Planner
+Chooses learning method, parallelism, batch size and iteration budget from corpus size and cores
+"""
+import os
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+
+
+# Per-iteration E-step cost proxy (non-zeros x topics) below which one process is fastest:
+# joblib worker start-up and result transfer outweigh the split work
+SINGLE_PROCESS_WORK = 2_000_000
+
+# Corpora up to this size fit in one batch E-step; larger ones use online mini-batches
+BATCH_MAX_DOCUMENTS = 5_000
+
+# Worker cap inside the Streamlit server, whose CPUs are shared by all sessions
+INTERACTIVE_MAX_JOBS = 2
+
+# Iteration caps; early stopping (evaluate_every / perp_tol) usually ends fits sooner
+BATCH_MAX_ITER = 30
+ONLINE_MAX_ITER = 10  # passes over a large corpus; each pass makes many mini-batch updates
+
+
+@dataclass
+class LDAPlan:
+    """Execution settings for one LatentDirichletAllocation fit"""
+    learning_method: str
+    n_jobs: int
+    batch_size: int
+    max_iter: int
+    evaluate_every: int
+    perp_tol: float
+    reason: str
+
+    def lda_kwargs(self) -> Dict:
+        """Keyword arguments for LatentDirichletAllocation"""
+        kwargs = asdict(self)
+        kwargs.pop('reason')
+        return kwargs
+
+
+def available_cores() -> int:
+    """CPU cores this process may run on (respects affinity / container limits)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        return os.cpu_count() or 1
+
+
+def running_in_streamlit() -> bool:
+    """True when called from inside a running Streamlit app"""
+    try:
+        from streamlit import runtime
+        return runtime.exists()
+    except ImportError:
+        return False
+
+
+def plan_lda_fit(
+    n_documents: int,
+    n_nonzero: int,
+    n_topics: int,
+    cores: Optional[int] = None,
+    interactive: Optional[bool] = None,
+    learning_method: Optional[str] = None,
+    max_iter: Optional[int] = None
+) -> LDAPlan:
+    """
+    Plan an LDA fit from the size of its document-term matrix
+
+    Args:
+        n_documents: Rows of the document-term matrix
+        n_nonzero: Non-zero entries of the document-term matrix
+        n_topics: Number of topics
+        cores: Cores available to this fit (default: detected)
+        interactive: Running inside the dashboard server (default: detected)
+        learning_method: Force 'batch' or 'online' instead of choosing
+        max_iter: Iteration cap (default: BATCH_MAX_ITER / ONLINE_MAX_ITER)
+
+    Returns:
+        LDAPlan
+    """
+    cores = max(1, cores or available_cores())
+    if interactive is None:
+        interactive = running_in_streamlit()
+
+    work = n_nonzero * n_topics
+    if work < SINGLE_PROCESS_WORK:
+        n_jobs = 1
+        reason = "small corpus: single process"
+    else:
+        n_jobs = min(cores, max(1, work // SINGLE_PROCESS_WORK))
+        reason = f"{n_jobs} worker(s) for {work:,} cells of work per pass"
+        if interactive and n_jobs > INTERACTIVE_MAX_JOBS:
+            n_jobs = INTERACTIVE_MAX_JOBS
+            reason += f", capped at {INTERACTIVE_MAX_JOBS} inside Streamlit"
+
+    if learning_method is None:
+        learning_method = 'batch' if n_documents <= BATCH_MAX_DOCUMENTS else 'online'
+
+    # Online mini-batches are split across workers, so keep every worker busy
+    batch_size = min(max(n_documents, 1), max(128, 256 * n_jobs))
+
+    return LDAPlan(
+        learning_method=learning_method,
+        n_jobs=n_jobs,
+        batch_size=batch_size,
+        max_iter=max_iter or (BATCH_MAX_ITER if learning_method == 'batch' else ONLINE_MAX_ITER),
+        evaluate_every=5,
+        perp_tol=0.1,
+        reason=f"{learning_method} learning; {reason}"
+    )
+
+
+def plan_for_matrix(doc_term_matrix, n_topics: int, **kwargs) -> LDAPlan:
+    """Plan an LDA fit for a (sparse) document-term matrix"""
+    n_nonzero = doc_term_matrix.nnz if hasattr(doc_term_matrix, 'nnz') else int((doc_term_matrix != 0).sum())
+    return plan_lda_fit(doc_term_matrix.shape[0], n_nonzero, n_topics, **kwargs)
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("LDA PLANNER - TEST")
+    print("=" * 70)
+    print(f"\nCores available: {available_cores()}")
+
+    for n_documents, n_nonzero in [(19, 153), (600, 8_960), (20_000, 1_500_000), (200_000, 15_000_000)]:
+        for interactive in (False, True):
+            plan = plan_lda_fit(n_documents, n_nonzero, n_topics=5, cores=16, interactive=interactive)
+            mode = "dashboard" if interactive else "batch job"
+            print(f"✅ {n_documents:>7,} docs ({mode:9s}): {plan.reason}; batch_size={plan.batch_size}, max_iter={plan.max_iter}")
@@ -0,0 +1,257 @@
+"""
+Fitted Topic Model Cache
+In-memory LRU of fitted LDA models keyed by (corpus key, n_topics), with background prefetch
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from sklearn.decomposition import LatentDirichletAllocation
+
+from lda_planner import plan_for_matrix
+from topic_coherence import top_word_indices
+
+
+class LDAModelCache:
+    """
+    Thread-safe LRU cache of fitted LDA models
+
+    Keys are (corpus key, n_topics, random_state); the corpus key is the
+    DTM cache key, so it covers both the corpus content and the vectorizer
+    settings. A fit already in progress (e.g. from prefetch()) is shared
+    with later callers instead of being started again.
+    """
+
+    def __init__(self, max_models: int = 16, prefetch_workers: int = 1):
+        """
+        Initialize cache
+
+        Args:
+            max_models: Fitted models kept before the least recently used is evicted
+            prefetch_workers: Background threads used by prefetch()
+        """
+        self.max_models = max_models
+        self.prefetch_workers = prefetch_workers
+        self._models: "OrderedDict[tuple, LatentDirichletAllocation]" = OrderedDict()
+        self._inflight: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _fit(doc_term_matrix, n_topics: int, random_state: int) -> LatentDirichletAllocation:
+        plan = plan_for_matrix(doc_term_matrix, n_topics)
+        return LatentDirichletAllocation(
+            n_components=n_topics,
+            random_state=random_state,
+            **plan.lda_kwargs()
+        ).fit(doc_term_matrix)
+
+    def _store(self, key: tuple, model: LatentDirichletAllocation):
+        """Insert as most recent and evict beyond max_models (caller holds the lock)"""
+        self._models[key] = model
+        self._models.move_to_end(key)
+        while len(self._models) > self.max_models:
+            self._models.popitem(last=False)
+
+    def get(self, corpus_key: str, n_topics: int, random_state: int = 42) -> Optional[LatentDirichletAllocation]:
+        """Cached model, or None (does not wait for in-flight fits)"""
+        key = (corpus_key, n_topics, random_state)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+            return model
+
+    def is_cached(self, corpus_key: str, n_topics: int, random_state: int = 42) -> bool:
+        """True when the model can be returned without fitting or waiting"""
+        with self._lock:
+            return (corpus_key, n_topics, random_state) in self._models
+
+    def _claim(self, key: tuple):
+        """
+        Cached model, the in-flight future for it, or a new future the caller must fulfil
+
+        Returns:
+            (model, future, owner) - exactly one of model/future is set
+        """
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key], None, False
+            if key in self._inflight:
+                self.hits += 1
+                return None, self._inflight[key], False
+
+            self.misses += 1
+            future = Future()
+            self._inflight[key] = future
+            return None, future, True
+
+    def _fulfil(self, key: tuple, future: Future, doc_term_matrix, n_topics: int, random_state: int):
+        """Fit a claimed key and publish the result (or the error) to all waiters"""
+        try:
+            model = self._fit(doc_term_matrix, n_topics, random_state)
+        except Exception as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._store(key, model)
+            self._inflight.pop(key, None)
+        future.set_result(model)
+        return model
+
+    def get_or_fit(
+        self,
+        corpus_key: str,
+        doc_term_matrix,
+        n_topics: int,
+        random_state: int = 42
+    ) -> LatentDirichletAllocation:
+        """
+        Fitted model for a corpus and topic count, fitting on a miss
+
+        Args:
+            corpus_key: Identity of the corpus + vectorizer (e.g. CachedDTM.key)
+            doc_term_matrix: Matrix to fit on when the model is not cached
+            n_topics: Number of topics
+            random_state: Random seed for reproducibility
+
+        Returns:
+            Fitted LatentDirichletAllocation
+        """
+        key = (corpus_key, n_topics, random_state)
+        model, future, owner = self._claim(key)
+        if model is not None:
+            return model
+        if not owner:
+            return future.result()
+        return self._fulfil(key, future, doc_term_matrix, n_topics, random_state)
+
+    def prefetch(
+        self,
+        corpus_key: str,
+        doc_term_matrix,
+        n_topics_range: Iterable[int] = range(2, 9),
+        random_state: int = 42
+    ) -> List[Future]:
+        """
+        Fit models for a range of topic counts in the background
+
+        Topic counts already cached or being fitted are skipped, so calling
+        this on every page render is cheap.
+
+        Returns:
+            Futures of the fits that were started
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.prefetch_workers, thread_name_prefix="lda-prefetch"
+                )
+
+        started = []
+        for n_topics in n_topics_range:
+            key = (corpus_key, n_topics, random_state)
+            model, future, owner = self._claim(key)
+            if owner:
+                self._executor.submit(
+                    self._fulfil_quietly, key, future, doc_term_matrix, n_topics, random_state
+                )
+                started.append(future)
+        return started
+
+    def _fulfil_quietly(self, *args):
+        """Background fit; errors surface through the future, not the worker thread"""
+        try:
+            self._fulfil(*args)
+        except Exception:
+            pass
+
+    def stats(self) -> Dict:
+        """Cache size, in-flight fits, hits and misses"""
+        with self._lock:
+            return {
+                'models': len(self._models),
+                'inflight': len(self._inflight),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+    def clear(self):
+        """Drop all cached models (in-flight fits still complete)"""
+        with self._lock:
+            self._models.clear()
+
+
+def top_words(model, terms, n_words: int = 10) -> List[List[str]]:
+    """
+    Top words of each topic of a fitted model (display only, no refit)
+
+    Args:
+        model: Fitted model with components_ (n_topics, n_words)
+        terms: Vocabulary in column order
+        n_words: Words per topic
+
+    Returns:
+        One list of words per topic, highest weight first
+    """
+    terms = np.asarray(terms)
+    return [terms[row].tolist() for row in top_word_indices(model.components_, n_words)]
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+_global_model_cache = None
+
+def get_model_cache() -> LDAModelCache:
+    """Get global fitted-model cache instance (singleton)"""
+    global _global_model_cache
+    if _global_model_cache is None:
+        _global_model_cache = LDAModelCache()
+    return _global_model_cache
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+    from sklearn.feature_extraction.text import CountVectorizer
+    from data_loader import load_dimension
+    from dtm_cache import get_dtm_cache
+
+    print("=" * 70)
+    print("FITTED MODEL CACHE - TEST")
+    print("=" * 70)
+
+    texts = load_dimension('scalability')['corpus']['content'].astype(str).tolist()
+    cached = get_dtm_cache().get_or_build(texts, CountVectorizer(max_df=0.95, min_df=2, stop_words='english'))
+    cache = LDAModelCache()
+
+    start = time.perf_counter()
+    cache.get_or_fit(cached.key, cached.matrix, n_topics=4)
+    print(f"\n⏱️  First fit (n_topics=4): {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    start = time.perf_counter()
+    model = cache.get_or_fit(cached.key, cached.matrix, n_topics=4)
+    print(f"⏱️  Cached (n_topics=4): {(time.perf_counter() - start) * 1000:.3f} ms")
+
+    start = time.perf_counter()
+    for future in cache.prefetch(cached.key, cached.matrix):
+        future.result()
+    print(f"⏱️  Background prefetch of 2-8: {time.perf_counter() - start:.2f} s")
+
+    for n_words in (5, 10):
+        print(f"✅ {n_words} words, no refit: {top_words(model, cached.terms, n_words)[0]}")
+    print(f"✅ Stats: {cache.stats()}")
@@ -0,0 +1,233 @@
+"""
+Persisted Topic Model Registry
+Stores fitted vectorizers and topic models keyed by corpus fingerprint and hyperparameters
+"""
+import copy
+import hashlib
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import joblib
+
+
+# Default registry location (analysis/models)
+MODELS_ROOT = Path(__file__).parent.parent / "models"
+
+REGISTRY_INDEX = "registry.json"
+
+
+def corpus_fingerprint(texts: Iterable[str]) -> str:
+    """
+    Stable fingerprint of a corpus (order-sensitive)
+
+    Returns:
+        16-character hex digest
+    """
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(str(text if text is not None else "").encode('utf-8'))
+        digest.update(b"\x1e")  # record separator keeps ['ab', 'c'] != ['a', 'bc']
+    return digest.hexdigest()[:16]
+
+
+def params_fingerprint(params: Dict) -> str:
+    """
+    Stable fingerprint of a hyperparameter dictionary
+
+    Returns:
+        12-character hex digest
+    """
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+
+
+class ModelRegistry:
+    """Small file-based registry of fitted topic models"""
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Initialize registry
+
+        Args:
+            root: Directory holding model files and the registry index
+        """
+        self.root = Path(root) if root else MODELS_ROOT
+        self._lock = threading.Lock()
+        self._loaded = {}  # key -> private artifact copy (process-wide reuse of loaded models)
+
+    @staticmethod
+    def make_key(name: str, corpus_fp: str, params: Dict) -> str:
+        """Registry key: <name>-<corpus fingerprint>-<params fingerprint>"""
+        return f"{name}-{corpus_fp}-{params_fingerprint(params)}"
+
+    def _index_path(self) -> Path:
+        return self.root / REGISTRY_INDEX
+
+    def _read_index(self) -> Dict[str, Dict]:
+        index_path = self._index_path()
+        if not index_path.exists():
+            return {}
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_index(self, index: Dict[str, Dict]):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path().with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        tmp_path.replace(self._index_path())
+
+    def save(
+        self,
+        name: str,
+        artifact: Dict,
+        corpus_fp: str,
+        params: Dict,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """
+        Persist a fitted model artifact
+
+        Args:
+            name: Logical model name (e.g. 'scalability')
+            artifact: Dictionary of fitted objects (vectorizer, topic model, ...)
+            corpus_fp: Fingerprint of the training corpus
+            params: Hyperparameters used for fitting
+            metadata: Extra JSON-serializable info (doc counts, source script, ...)
+
+        Returns:
+            Registry key of the saved model
+        """
+        key = self.make_key(name, corpus_fp, params)
+        model_file = f"{key}.joblib"
+
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            joblib.dump(artifact, self.root / model_file, compress=3)
+
+            index = self._read_index()
+            index[key] = {
+                'name': name,
+                'corpus_fingerprint': corpus_fp,
+                'params': params,
+                'file': model_file,
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'metadata': metadata or {}
+            }
+            self._write_index(index)
+            self._loaded[key] = copy.deepcopy(artifact)  # later changes by the caller stay out of the cache
+
+        return key
+
+    def load(self, key: str) -> Optional[Dict]:
+        """
+        Load a model artifact by registry key
+
+        Each call returns its own copy, so updating a loaded model (e.g.
+        TopicModeler.update) never changes what the next caller gets.
+
+        Returns:
+            Artifact dictionary, or None if the key is unknown
+        """
+        with self._lock:
+            if key in self._loaded:
+                return copy.deepcopy(self._loaded[key])
+
+            entry = self._read_index().get(key)
+            if entry is None:
+                return None
+
+            model_path = self.root / entry['file']
+            if not model_path.exists():
+                return None
+
+            artifact = joblib.load(model_path)
+            self._loaded[key] = artifact
+            return copy.deepcopy(artifact)
+
+    def find(self, name: str, corpus_fp: str, params: Dict) -> Optional[Dict]:
+        """Load the model matching an exact (name, corpus, params) combination"""
+        return self.load(self.make_key(name, corpus_fp, params))
+
+    def latest(self, name: str) -> Optional[str]:
+        """
+        Key of the most recently saved model with the given name
+
+        Returns:
+            Registry key or None
+        """
+        entries = self.list_models(name)
+        return entries[0]['key'] if entries else None
+
+    def list_models(self, name: Optional[str] = None) -> List[Dict]:
+        """
+        List registry entries, newest first
+
+        Args:
+            name: Optional filter on model name
+        """
+        with self._lock:
+            index = self._read_index()
+
+        entries = [
+            dict(entry, key=key)
+            for key, entry in index.items()
+            if name is None or entry['name'] == name
+        ]
+        return sorted(entries, key=lambda e: e['created_at'], reverse=True)
+
+    def remove(self, key: str) -> bool:
+        """Delete a model from the registry"""
+        with self._lock:
+            index = self._read_index()
+            entry = index.pop(key, None)
+            if entry is None:
+                return False
+
+            model_path = self.root / entry['file']
+            if model_path.exists():
+                model_path.unlink()
+            self._write_index(index)
+            self._loaded.pop(key, None)
+            return True
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+_global_registry = None
+
+def get_registry() -> ModelRegistry:
+    """Get global model registry instance (singleton)"""
+    global _global_registry
+    if _global_registry is None:
+        _global_registry = ModelRegistry()
+    return _global_registry
+
+def register_fitted_model(
+    name: str,
+    vectorizer,
+    topic_model,
+    texts: List[str],
+    params: Dict,
+    metadata: Optional[Dict] = None
+) -> str:
+    """
+    Register a raw (vectorizer, topic model) pair fitted outside TopicModeler
+
+    Used by the batch LDA scripts so their models are kept alongside
+    the keyword CSV/JSON outputs.
+
+    Returns:
+        Registry key
+    """
+    artifact = {
+        'vectorizer': vectorizer,
+        'topic_model': topic_model,
+        'params': params
+    }
+    return get_registry().save(name, artifact, corpus_fingerprint(texts), params, metadata)
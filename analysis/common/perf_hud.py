@@ -0,0 +1,225 @@
+"""
+Page Performance HUD
+Opt-in per-section timings for dashboard pages, shown in the sidebar and logged to JSONL
+
+Enable with ?perf=1 in the page URL (sticks for the browser session, ?perf=0
+turns it off) or for every session with XR_DASHBOARD_PERF=1. When disabled,
+checkpoints are no-ops and nothing is written.
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+
+PERF_ENV_VAR = "XR_DASHBOARD_PERF"
+PERF_QUERY_PARAM = "perf"
+
+# Default log location (analysis/cache/perf, not versioned)
+PERF_LOG_PATH = Path(__file__).parent.parent / "cache" / "perf" / "page_timings.jsonl"
+
+_log_lock = threading.Lock()
+
+
+class PageTimer:
+    """
+    Lap timer over the sections of one page run
+
+    checkpoint(name) closes the running section and starts the next, so
+    a Streamlit script is instrumented with one line at each section
+    banner instead of re-indenting it under context managers.
+    """
+
+    def __init__(
+        self,
+        page: str,
+        enabled: bool = True,
+        session_id: Optional[str] = None,
+        log_path: Optional[Path] = None
+    ):
+        """
+        Initialize timer (the page clock starts here)
+
+        Args:
+            page: Page name used in the HUD and the log
+            enabled: False makes every method a no-op
+            session_id: Streamlit session the run belongs to
+            log_path: JSONL file to append to (default: PERF_LOG_PATH)
+        """
+        self.page = page
+        self.enabled = enabled
+        self.session_id = session_id
+        self.log_path = Path(log_path) if log_path else PERF_LOG_PATH
+        self.sections: Dict[str, float] = {}  # milliseconds, in page order
+        self._current: Optional[str] = None
+        self._section_start = 0.0
+        self._page_start = time.perf_counter()
+
+    def _close(self, now: float):
+        if self._current is not None:
+            elapsed = (now - self._section_start) * 1000
+            self.sections[self._current] = self.sections.get(self._current, 0.0) + elapsed
+            self._current = None
+
+    def checkpoint(self, name: str):
+        """End the running section and start timing `name`"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._close(now)
+        self._current = name
+        self._section_start = now
+
+    def finish(self) -> Optional[Dict]:
+        """
+        End the running section
+
+        Returns:
+            Log record (timestamp, page, session, sections, total_ms), or None when disabled
+        """
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        self._close(now)
+        return {
+            'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+            'page': self.page,
+            'session': self.session_id,
+            'sections': {name: round(ms, 2) for name, ms in self.sections.items()},
+            'total_ms': round((now - self._page_start) * 1000, 2)
+        }
+
+    def write_log(self, record: Dict):
+        """Append one record to the JSONL log"""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record)
+        with _log_lock:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+
+
+def read_timings(log_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Logged section timings, one row per (page run, section)
+
+    Returns:
+        DataFrame with timestamp, page, session, section, ms, total_ms
+    """
+    log_path = Path(log_path) if log_path else PERF_LOG_PATH
+    rows: List[Dict] = []
+    if log_path.exists():
+        with open(log_path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                for section, ms in record['sections'].items():
+                    rows.append({
+                        'timestamp': record['timestamp'],
+                        'page': record['page'],
+                        'session': record.get('session'),
+                        'section': section,
+                        'ms': ms,
+                        'total_ms': record['total_ms']
+                    })
+    return pd.DataFrame(rows, columns=['timestamp', 'page', 'session', 'section', 'ms', 'total_ms'])
+
+
+def summarize_timings(timings: pd.DataFrame) -> pd.DataFrame:
+    """
+    Where page time goes across logged runs
+
+    Returns:
+        DataFrame per (page, section): runs, sessions, median_ms, p95_ms, max_ms,
+        sorted by p95 so the slowest paths come first
+    """
+    grouped = timings.groupby(['page', 'section'])['ms']
+    summary = pd.DataFrame({
+        'runs': grouped.size(),
+        'sessions': timings.groupby(['page', 'section'])['session'].nunique(),
+        'median_ms': grouped.median(),
+        'p95_ms': grouped.quantile(0.95),
+        'max_ms': grouped.max()
+    })
+    return summary.sort_values('p95_ms', ascending=False).reset_index()
+
+
+# ============================================================================
+# STREAMLIT HELPERS
+# ============================================================================
+
+def perf_enabled() -> bool:
+    """True if timings are on for this session (env flag or ?perf=1)"""
+    if os.environ.get(PERF_ENV_VAR, '').lower() in ('1', 'true', 'yes', 'on'):
+        return True
+
+    import streamlit as st
+    value = st.query_params.get(PERF_QUERY_PARAM)
+    if value is not None:
+        st.session_state['perf_hud'] = value.lower() in ('1', 'true', 'yes', 'on')
+    return st.session_state.get('perf_hud', False)
+
+
+def page_timer(page: str) -> PageTimer:
+    """Timer for the current page run (disabled unless perf_enabled())"""
+    session_id = None
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        session_id = ctx.session_id if ctx else None
+    except ImportError:
+        pass
+    return PageTimer(page, enabled=perf_enabled(), session_id=session_id)
+
+
+def show_perf_hud(timer: PageTimer):
+    """Close the timer, log the run and show the breakdown in the sidebar (call at the end of a page)"""
+    record = timer.finish()
+    if record is None:
+        return
+
+    import streamlit as st
+    try:
+        timer.write_log(record)
+        logged = f"logged to {timer.log_path.name}"
+    except OSError as e:
+        logged = f"log not written: {e}"
+
+    total = record['total_ms']
+    rows = "\n".join(
+        f"| {name} | {ms:,.0f} | {ms / total:.0%} |" for name, ms in record['sections'].items()
+    )
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("### ⏱️ Page Timings")
+        st.markdown(f"| Section | ms | Share |\n|---|---:|---:|\n{rows}")
+        st.caption(f"Total {total:,.0f} ms · {logged}")
+
+
+# ============================================================================
+# LOG SUMMARY
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+
+    # python perf_hud.py [page_timings.jsonl]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    timings = read_timings(Path(args[0]) if args else None)
+
+    print("=" * 70)
+    print("PAGE TIMINGS")
+    print("=" * 70)
+
+    if timings.empty:
+        print(f"\n⚠️  No timings logged yet. Open pages with ?{PERF_QUERY_PARAM}=1 or set {PERF_ENV_VAR}=1")
+        sys.exit(0)
+
+    runs = timings[['timestamp', 'page', 'session']].drop_duplicates()
+    print(f"\n✅ {len(runs)} page runs, {timings['session'].nunique()} sessions\n")
+    print(summarize_timings(timings).round(1).to_string(index=False))
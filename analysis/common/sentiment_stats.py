@@ -0,0 +1,240 @@
+"""
+Uncertainty Estimates for Sentiment Metrics
+Vectorized bootstrap confidence intervals for mean polarity and class shares
+"""
+import threading
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+
+DEFAULT_N_BOOT = 2000
+DEFAULT_CONFIDENCE = 0.95
+
+# Upper bound on resample-matrix cells drawn at once (keeps memory flat on big corpora)
+MAX_RESAMPLE_CELLS = 5_000_000
+
+# Process-wide cache: (dataset_version, metric, ...) -> interval dict
+_interval_cache: Dict[tuple, Dict] = {}
+_cache_lock = threading.Lock()
+
+
+def dataset_version(path: Union[str, Path]) -> str:
+    """
+    Cheap version stamp for a data file (modification time + size)
+
+    Returns:
+        Version string, or 'missing' if the file does not exist
+    """
+    path = Path(path)
+    if not path.exists():
+        return "missing"
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _resample_blocks(n: int, n_boot: int, random_state: int) -> Iterator[np.ndarray]:
+    """
+    Yield bootstrap index matrices of shape (block_rows, n)
+
+    Small samples get a single (n_boot, n) draw; large samples are split
+    into row blocks so the matrix never exceeds MAX_RESAMPLE_CELLS.
+    """
+    rng = np.random.default_rng(random_state)
+    rows_per_block = max(1, min(n_boot, MAX_RESAMPLE_CELLS // max(n, 1)))
+
+    drawn = 0
+    while drawn < n_boot:
+        rows = min(rows_per_block, n_boot - drawn)
+        yield rng.integers(0, n, size=(rows, n))
+        drawn += rows
+
+
+def _percentile_interval(estimate: float, replicates: np.ndarray, confidence: float) -> Dict:
+    """Percentile interval around a point estimate"""
+    alpha = (1.0 - confidence) / 2.0
+    lower, upper = np.quantile(replicates, [alpha, 1.0 - alpha], axis=0)
+    return {
+        'estimate': float(estimate),
+        'lower': float(lower),
+        'upper': float(upper)
+    }
+
+
+def bootstrap_mean_ci(
+    values: Sequence[float],
+    n_boot: int = DEFAULT_N_BOOT,
+    confidence: float = DEFAULT_CONFIDENCE,
+    random_state: int = 42
+) -> Dict:
+    """
+    Bootstrap confidence interval for a mean (e.g. average compound score)
+
+    Args:
+        values: Numeric observations (NaNs are dropped)
+        n_boot: Number of bootstrap resamples
+        confidence: Confidence level (0-1)
+        random_state: Random seed for reproducibility
+
+    Returns:
+        Dictionary with estimate, lower, upper
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+
+    if values.size == 0:
+        return {'estimate': 0.0, 'lower': 0.0, 'upper': 0.0}
+
+    replicates = np.concatenate([
+        values[idx].mean(axis=1)
+        for idx in _resample_blocks(values.size, n_boot, random_state)
+    ])
+    return _percentile_interval(values.mean(), replicates, confidence)
+
+
+def bootstrap_share_ci(
+    labels: Sequence[str],
+    classes: Optional[List[str]] = None,
+    n_boot: int = DEFAULT_N_BOOT,
+    confidence: float = DEFAULT_CONFIDENCE,
+    random_state: int = 42
+) -> Dict[str, Dict]:
+    """
+    Bootstrap confidence intervals for class shares (fractions 0-1)
+
+    Args:
+        labels: Class label per observation (compared case-insensitively)
+        classes: Classes to report (default: positive, neutral, negative)
+        n_boot: Number of bootstrap resamples
+        confidence: Confidence level (0-1)
+        random_state: Random seed for reproducibility
+
+    Returns:
+        Dictionary mapping class name to {estimate, lower, upper}
+    """
+    classes = classes or ['positive', 'neutral', 'negative']
+    labels = pd.Series(labels).dropna().astype(str).str.lower()
+
+    if labels.empty:
+        return {c: {'estimate': 0.0, 'lower': 0.0, 'upper': 0.0} for c in classes}
+
+    # Integer-code the labels against the requested classes (-1 = other)
+    codes = pd.Categorical(labels, categories=classes).codes
+    one_hot = (codes[:, None] == np.arange(len(classes))[None, :]).astype(float)
+
+    replicates = np.concatenate([
+        one_hot[idx].mean(axis=1)
+        for idx in _resample_blocks(len(codes), n_boot, random_state)
+    ])  # shape (n_boot, n_classes)
+
+    estimates = one_hot.mean(axis=0)
+    return {
+        cls: _percentile_interval(estimates[k], replicates[:, k], confidence)
+        for k, cls in enumerate(classes)
+    }
+
+
+def get_sentiment_intervals(
+    sentiment_df: pd.DataFrame,
+    score_col: str = 'compound',
+    label_col: str = 'label',
+    version: Optional[str] = None,
+    n_boot: int = DEFAULT_N_BOOT,
+    confidence: float = DEFAULT_CONFIDENCE,
+    random_state: int = 42
+) -> Dict:
+    """
+    Confidence intervals for a pre-computed sentiment table
+
+    Results are cached process-wide per (version, metric) so dashboard
+    pages can show intervals without re-running the bootstrap on every
+    render. Pass version=None to skip caching.
+
+    Args:
+        sentiment_df: DataFrame with one row per scored text
+        score_col: Column with the continuous sentiment score
+        label_col: Column with the sentiment class
+        version: Dataset version stamp (see dataset_version())
+
+    Returns:
+        Dictionary with 'mean' interval, 'shares' intervals per class, 'n', 'confidence'
+    """
+    def cached(metric: str, compute):
+        if version is None:
+            return compute()
+        key = (version, metric, n_boot, confidence, random_state)
+        with _cache_lock:
+            if key in _interval_cache:
+                return _interval_cache[key]
+        result = compute()
+        with _cache_lock:
+            _interval_cache[key] = result
+        return result
+
+    mean_ci = cached(
+        f"mean:{score_col}",
+        lambda: bootstrap_mean_ci(sentiment_df[score_col], n_boot, confidence, random_state)
+    )
+    share_ci = cached(
+        f"shares:{label_col}",
+        lambda: bootstrap_share_ci(sentiment_df[label_col], None, n_boot, confidence, random_state)
+    )
+
+    return {
+        'mean': mean_ci,
+        'shares': share_ci,
+        'n': int(len(sentiment_df)),
+        'confidence': confidence
+    }
+
+
+def format_interval(interval: Dict, scale: float = 1.0, fmt: str = "{:.3f}", confidence: float = DEFAULT_CONFIDENCE) -> str:
+    """
+    Format an interval for display, e.g. '95% CI: 0.112 – 0.298'
+
+    Args:
+        interval: Dictionary with lower/upper
+        scale: Multiplier applied before formatting (100 for percentages)
+        fmt: Format string for each bound
+    """
+    lower = fmt.format(interval['lower'] * scale)
+    upper = fmt.format(interval['upper'] * scale)
+    return f"{confidence:.0%} CI: {lower} – {upper}"
+
+
+def clear_interval_cache():
+    """Drop all cached intervals"""
+    with _cache_lock:
+        _interval_cache.clear()
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("SENTIMENT STATISTICS - TEST")
+    print("=" * 70)
+
+    rng = np.random.default_rng(0)
+    demo = pd.DataFrame({
+        'compound': rng.uniform(-0.5, 0.9, size=19),
+    })
+    demo['label'] = np.where(demo['compound'] >= 0.05, 'positive',
+                             np.where(demo['compound'] <= -0.05, 'negative', 'neutral'))
+
+    start = time.perf_counter()
+    intervals = get_sentiment_intervals(demo, version="demo")
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n✅ Mean compound: {intervals['mean']['estimate']:.3f} ({format_interval(intervals['mean'])})")
+    for cls, ci in intervals['shares'].items():
+        print(f"✅ {cls.title()}: {ci['estimate'] * 100:.1f}% ({format_interval(ci, scale=100, fmt='{:.1f}%')})")
+    print(f"⏱️  First call: {elapsed:.1f} ms")
+
+    start = time.perf_counter()
+    get_sentiment_intervals(demo, version="demo")
+    print(f"⏱️  Cached call: {(time.perf_counter() - start) * 1000:.3f} ms")
@@ -0,0 +1,321 @@
+"""
+Source Index
+Precomputed, searchable index of a dimension's verified source URLs, with paginated display
+"""
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+
+from data_loader import get_loader
+from dimensions import get_dimension_by_id
+from sentiment_stats import dataset_version
+
+
+URL_PATTERN = re.compile(r'https?://[^\s]+')  # same pattern the data loader extracts sources with
+SECTION_PATTERN = re.compile(r'^=+\s*(.+?)\s*=+$')  # ===== MANUFACTURING =====
+RULE_PATTERN = re.compile(r'^[═=─-]{10,}$')  # underline below an ALL-CAPS section title
+TITLE_PATTERN = re.compile(r'^\d+\.\s+(.+)$')  # "3. Ericsson - 5G for Industrial XR"
+
+DEFAULT_PAGE_SIZE = 20
+SEARCH_CACHE_SIZE = 128
+
+# Process-wide cache: (dimension, source file versions) -> SourceIndex
+_index_cache: Dict[tuple, "SourceIndex"] = {}
+_cache_lock = threading.Lock()
+
+
+def url_domain(url: str) -> str:
+    """Host name of a URL without 'www.'"""
+    return urlparse(url).netloc.lower().removeprefix('www.')
+
+
+def collection_label(path: Path) -> str:
+    """Readable name of a source file: XR_08_Sources_Edge_Computing.txt -> Edge Computing"""
+    stem = re.sub(r'^(XR_)?\d+_', '', path.stem)
+    return stem.removeprefix('Sources_').replace('_', ' ').strip()
+
+
+def parse_source_file(text: str, collection: str) -> List[Dict]:
+    """
+    Sources listed in a text file, in file order
+
+    Understands the layouts used by the dimension source files: bare URL
+    lists, "===== SECTION =====" headings, ALL-CAPS titles underlined
+    with a rule, and numbered entries whose title precedes the URL.
+
+    Returns:
+        One dict per URL: url, title, section, collection
+    """
+    rows = []
+    lines = [line.strip() for line in text.splitlines()]
+    section, title = None, None
+
+    for i, line in enumerate(lines):
+        heading = SECTION_PATTERN.match(line)
+        if heading and not RULE_PATTERN.match(line):
+            section, title = heading.group(1).title(), None
+            continue
+        if i + 1 < len(lines) and RULE_PATTERN.match(lines[i + 1]) and line and line == line.upper():
+            section, title = line.title(), None
+            continue
+
+        urls = URL_PATTERN.findall(line)
+        if urls:
+            for url in urls:
+                rows.append({'url': url, 'title': title, 'section': section, 'collection': collection})
+            title = None
+            continue
+
+        numbered = TITLE_PATTERN.match(line)
+        if numbered:
+            title = numbered.group(1)
+
+    return rows
+
+
+class SourceIndex:
+    """
+    Sources of one dimension with a search and pagination interface
+
+    Domains, categories and a lower-cased search text are computed once
+    when the index is built; a search is a single vectorized scan whose
+    result positions are cached, so paging through results only slices.
+    """
+
+    def __init__(self, rows: List[Dict]):
+        """
+        Initialize index
+
+        Args:
+            rows: Dicts with url and optional title, section, collection (duplicates keep the first)
+        """
+        sources = pd.DataFrame(rows, columns=['url', 'title', 'section', 'collection'])
+        sources = sources.drop_duplicates('url').reset_index(drop=True)
+        sources['domain'] = [url_domain(url) for url in sources['url']]
+
+        # Category to filter by: the source file when there are several, else the section heading
+        if sources['collection'].nunique() > 1:
+            sources['category'] = sources['collection']
+        else:
+            sources['category'] = sources['section']
+        sources['category'] = sources['category'].fillna(sources['collection']).fillna("Other")
+
+        self.sources = sources
+        self.domains = sources['domain'].value_counts().rename_axis('domain').reset_index(name='sources')
+        self.categories = sources['category'].value_counts(sort=False)
+        self._text = (
+            sources['url'] + ' ' + sources['title'].fillna('') + ' ' + sources['category']
+        ).str.lower().to_numpy(dtype=str)
+
+        self._searches: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def search(self, query: str = "", category: Optional[str] = None) -> np.ndarray:
+        """
+        Positions of the sources matching every word of `query` (case-insensitive)
+
+        Args:
+            query: Words to find in URL (which contains the domain), title or category
+            category: Only sources in this category (None: all)
+
+        Returns:
+            Integer positions into self.sources, in index order
+        """
+        words = tuple(query.lower().split())
+        key = (words, category)
+        with self._lock:
+            if key in self._searches:
+                self._searches.move_to_end(key)
+                return self._searches[key]
+
+        mask = np.ones(len(self.sources), dtype=bool)
+        if category is not None:
+            mask &= (self.sources['category'] == category).to_numpy()
+        for word in words:
+            mask &= np.char.find(self._text, word) >= 0
+
+        positions = np.flatnonzero(mask)
+        with self._lock:
+            self._searches[key] = positions
+            if len(self._searches) > SEARCH_CACHE_SIZE:
+                self._searches.popitem(last=False)
+        return positions
+
+    def page(self, positions: np.ndarray, page: int, page_size: int = DEFAULT_PAGE_SIZE) -> pd.DataFrame:
+        """
+        One page of search results
+
+        Args:
+            positions: Result of search()
+            page: 1-based page number (clamped to the available pages)
+            page_size: Sources per page
+
+        Returns:
+            DataFrame slice of self.sources with a 'rank' column (1-based result number)
+        """
+        page = min(max(page, 1), page_count(len(positions), page_size))
+        start = (page - 1) * page_size
+        visible = self.sources.iloc[positions[start:start + page_size]].copy()
+        visible.insert(0, 'rank', range(start + 1, start + 1 + len(visible)))
+        return visible
+
+
+def page_count(n_results: int, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    """Number of pages needed for n_results (at least 1)"""
+    return max(1, -(-n_results // page_size))
+
+
+def build_source_index(dimension_id: str) -> SourceIndex:
+    """
+    Parse a dimension's source files into an index
+
+    Dimensions without dedicated source files fall back to the URLs the
+    data loader finds in their data files.
+    """
+    dimension = get_dimension_by_id(dimension_id)
+    loader = get_loader()
+
+    rows = []
+    for path in dimension.get_source_paths():
+        if path.exists() and path.suffix == '.txt':
+            rows.extend(parse_source_file(loader.load_artifact(path), collection_label(path)))
+
+    if not rows:
+        rows = [
+            {'url': url, 'title': None, 'section': None, 'collection': "Data files"}
+            for url in sorted(loader.load_dimension_sources(dimension_id))
+        ]
+    return SourceIndex(rows)
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+def get_source_index(dimension_id: str) -> SourceIndex:
+    """Source index for a dimension, built once per source file version"""
+    dimension = get_dimension_by_id(dimension_id)
+    key = (dimension_id,) + tuple(
+        dataset_version(path) for path in dimension.get_source_paths() + dimension.get_data_paths()
+    )
+    with _cache_lock:
+        if key in _index_cache:
+            return _index_cache[key]
+
+    index = build_source_index(dimension_id)
+
+    with _cache_lock:
+        _index_cache[key] = index
+    return index
+
+
+# ============================================================================
+# STREAMLIT HELPERS
+# ============================================================================
+
+def _markdown_link(row) -> str:
+    title = row['title'] if pd.notna(row['title']) else None  # NaN for rows given without a title
+    label = title or (row['url'][:80] + '...' if len(row['url']) > 80 else row['url'])
+    label = re.sub(r'([\[\]*_`])', r'\\\1', label)
+    url = row['url'].replace('(', '%28').replace(')', '%29')
+    return f"{row['rank']}. **{row['domain']}** - [{label}]({url})"
+
+
+def _reset_page(page_key: str):
+    """Widget callback: a new search or category starts on the first page"""
+    import streamlit as st
+    st.session_state[page_key] = 1
+
+
+def show_source_browser(index: SourceIndex, key: str, page_size: int = DEFAULT_PAGE_SIZE):
+    """
+    Searchable, paginated source list (only the visible page is rendered)
+
+    Args:
+        index: Source index to browse
+        key: Widget key prefix, unique per page
+        page_size: Sources per page
+    """
+    import streamlit as st
+
+    categories = [None] + list(index.categories.index)
+    page_key = f"{key}_page"
+    search_col, category_col = st.columns([3, 2])
+    with search_col:
+        query = st.text_input(
+            "🔍 Search sources", key=f"{key}_query", placeholder="domain, title or URL words",
+            on_change=_reset_page, args=(page_key,)
+        )
+    with category_col:
+        category = st.selectbox(
+            "Category", categories, key=f"{key}_category",
+            format_func=lambda c: f"All ({len(index)})" if c is None else f"{c} ({index.categories[c]})",
+            on_change=_reset_page, args=(page_key,)
+        )
+
+    positions = index.search(query, category)
+    pages = page_count(len(positions), page_size)
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages  # the result set shrank below the current page
+
+    visible = index.page(positions, st.session_state.get(page_key, 1), page_size)
+    if visible.empty:
+        st.info("No sources match the search")
+    else:
+        st.markdown("\n".join(_markdown_link(row) for _, row in visible.iterrows()))
+
+    caption_col, page_col = st.columns([3, 1])
+    with page_col:
+        st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+    with caption_col:
+        shown = f"{visible['rank'].iloc[0]}–{visible['rank'].iloc[-1]}" if not visible.empty else "0"
+        st.caption(
+            f"Showing {shown} of {len(positions)} matching sources · "
+            f"{len(index)} sources from {len(index.domains)} domains"
+        )
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+    from dimensions import ALL_DIMENSIONS
+
+    print("=" * 70)
+    print("SOURCE INDEX - TEST")
+    print("=" * 70)
+
+    for dimension in ALL_DIMENSIONS:
+        start = time.perf_counter()
+        index = get_source_index(dimension.id)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n✅ {dimension.name}: {len(index)} sources, {len(index.domains)} domains, "
+              f"{len(index.categories)} categories ({elapsed:.1f} ms)")
+        print(f"   {dict(index.categories)}")
+
+    rows = [
+        {'url': f"https://site{i % 900}.example.com/article/{i}", 'title': f"Article {i}",
+         'section': None, 'collection': f"Collection {i % 7}"}
+        for i in range(10_000)
+    ]
+    start = time.perf_counter()
+    large = SourceIndex(rows)
+    print(f"\n⏱️  Build 10,000 sources: {(time.perf_counter() - start) * 1000:.0f} ms")
+    start = time.perf_counter()
+    positions = large.search("site12 article")
+    print(f"⏱️  Search: {(time.perf_counter() - start) * 1000:.1f} ms ({len(positions)} matches)")
+    start = time.perf_counter()
+    large.search("site12 article")
+    large.page(positions, 3)
+    print(f"⏱️  Cached search + page: {(time.perf_counter() - start) * 1000:.2f} ms")
@@ -4,14 +4,27 @@ Word Cloud Generation, Sentiment Analysis, Topic Modeling (LDA)
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 import matplotlib.pyplot as plt
 from wordcloud import WordCloud, STOPWORDS
 from textblob import TextBlob
 from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
+from scipy.special import psi
+import os
 import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
 from pathlib import Path
+import joblib
+
+from dtm_cache import get_dtm_cache
+from lda_planner import plan_for_matrix
+from model_registry import ModelRegistry, corpus_fingerprint, get_registry
+from topic_coherence import coherence_scores, npmi_coherence, top_word_indices, umass_coherence
+from topic_engines import get_engine
 
 
 class TextPreprocessor:
@@ -156,11 +169,9 @@ class WordCloudGenerator:
         Returns:
             List of (word, frequency) tuples
         """
-        text = self.preprocessor.preprocess(text)
-        words = text.split()
-        from collections import Counter
-        word_counts = Counter(words)
-        return word_counts.most_common(n)
+        # One-off text: count in memory (ties alphabetical, as in term_frequencies)
+        word_counts = Counter(self.preprocessor.preprocess(text).split())
+        return sorted(word_counts.items(), key=lambda item: (-item[1], item[0]))[:n]
 
 
 class SentimentAnalyzer:
@@ -271,27 +282,127 @@ class SentimentAnalyzer:
         return fig
 
 
+# ============================================================================
+# TOPIC-COUNT SWEEP WORKERS
+# ============================================================================
+
+# Document-term matrix shared by sweep worker processes (set once per worker)
+_sweep_doc_term_matrix = None
+
+def _init_sweep_worker(doc_term_matrix):
+    """Process-pool initializer: receive the shared matrix once per worker"""
+    global _sweep_doc_term_matrix
+    _sweep_doc_term_matrix = doc_term_matrix
+
+def _fit_sweep_config(config: Dict) -> Dict:
+    """Fit one sweep configuration on the shared matrix and score it"""
+    doc_term_matrix = _sweep_doc_term_matrix
+
+    # One core per fit: parallelism comes from the process pool
+    plan = plan_for_matrix(doc_term_matrix, config['n_topics'], cores=1)
+    lda = LatentDirichletAllocation(
+        n_components=config['n_topics'],
+        doc_topic_prior=config['doc_topic_prior'],
+        topic_word_prior=config['topic_word_prior'],
+        random_state=config['random_state'],
+        **plan.lda_kwargs()
+    )
+
+    start = time.perf_counter()
+    lda.fit(doc_term_matrix)
+    fit_seconds = time.perf_counter() - start
+
+    n_top_words = config['n_top_words']
+    return {
+        'n_topics': config['n_topics'],
+        'doc_topic_prior': config['doc_topic_prior'],
+        'topic_word_prior': config['topic_word_prior'],
+        'perplexity': lda.perplexity(doc_term_matrix),
+        'umass_coherence': float(umass_coherence(doc_term_matrix, lda.components_, n_top_words).mean()),
+        'npmi_coherence': float(npmi_coherence(doc_term_matrix, lda.components_, n_top_words).mean()),
+        'fit_seconds': fit_seconds
+    }
+
+
 class TopicModeler:
-    """Topic modeling using Latent Dirichlet Allocation (LDA)"""
+    """Topic modeling using LDA (default), NMF or MiniBatchKMeans (see topic_engines)"""
 
-    def __init__(self, n_topics: int = 5, random_state: int = 42):
+    def __init__(self, n_topics: int = 5, random_state: int = 42, engine: str = 'lda'):
         """
         Initialize topic modeler
 
         Args:
             n_topics: Number of topics to extract
             random_state: Random seed for reproducibility
+            engine: 'lda' (execution planned), 'lda_online', 'lda_batch', 'nmf' or 'kmeans'
         """
         self.n_topics = n_topics
         self.random_state = random_state
+        self.engine = engine
+        self._engine = get_engine(engine)
+        self.max_features = 1000
         self.preprocessor = TextPreprocessor()
         self.vectorizer = None
-        self.lda_model = None
+        self.lda_model = None  # fitted topic model of the selected engine
         self.feature_names = None
+        self.corpus_fingerprint = None
+        self.n_documents_seen = 0
+
+    def get_params(self) -> Dict:
+        """Hyperparameters that identify a fitted model"""
+        return {
+            'n_topics': self.n_topics,
+            'random_state': self.random_state,
+            'max_features': self.max_features,
+            'engine': self.engine
+        }
+
+    def _build_vectorizer(
+        self,
+        vocabulary: Optional[Dict[str, int]] = None,
+        min_df: int = 2,
+        max_df: float = 0.85,
+        max_features: Optional[int] = None
+    ):
+        """Engine's vectorizer (counts or TF-IDF) with the modeler's settings (fixed vocabulary if given)"""
+        vectorizer_class = self._engine.vectorizer_class
+        if vocabulary is not None:
+            return vectorizer_class(vocabulary=vocabulary, stop_words='english')
+
+        return vectorizer_class(
+            max_features=max_features or self.max_features,
+            max_df=max_df,
+            min_df=min_df,
+            stop_words='english'
+        )
+
+    def _build_model(self, doc_term_matrix):
+        """Unfitted estimator of the selected engine, planned for this matrix"""
+        return self._engine.build_model(self.n_topics, self.random_state, doc_term_matrix)
+
+    @property
+    def topic_word_matrix(self) -> np.ndarray:
+        """Topic-word weights of shape (n_topics, n_words)"""
+        if self.lda_model is None:
+            raise ValueError("Model not fitted yet. Call fit() first.")
+        return self._engine.topic_word(self.lda_model)
+
+    def _corpus_dtm(self, texts: List[str], max_features: Optional[int] = None):
+        """Vectorize a corpus through the shared DTM cache (leaves the modeler's fitted state alone)"""
+        return get_dtm_cache().get_or_build(
+            texts, self._build_vectorizer(max_features=max_features), preprocess=self.preprocessor.preprocess
+        )
+
+    def _vectorize_corpus(self, texts: List[str]):
+        """Fit the modeler's vectorizer on a corpus through the shared DTM cache"""
+        cached = self._corpus_dtm(texts)
+        self.vectorizer = cached.vectorizer
+        self.feature_names = cached.terms
+        return cached.matrix
 
     def fit(self, texts: List[str], max_features: int = 1000) -> 'TopicModeler':
         """
-        Fit LDA model on text corpus
+        Fit topic model on text corpus
 
         Args:
             texts: List of text documents
@@ -300,33 +411,326 @@ class TopicModeler:
         Returns:
             Self for method chaining
         """
-        # Preprocess texts
-        processed_texts = [self.preprocessor.preprocess(text) for text in texts]
+        self.max_features = max_features
+        self.corpus_fingerprint = corpus_fingerprint(texts)
+        self.n_documents_seen = len(texts)
 
-        # Vectorize
-        self.vectorizer = CountVectorizer(
-            max_features=max_features,
-            max_df=0.85,
-            min_df=2,
-            stop_words='english'
-        )
+        # Preprocess + vectorize (cached per corpus and vectorizer config)
+        doc_term_matrix = self._vectorize_corpus(texts)
+
+        # Fit topic model
+        self.lda_model = self._build_model(doc_term_matrix)
+
+        self.lda_model.fit(doc_term_matrix)
+
+        return self
+
+    # ------------------------------------------------------------------
+    # Incremental / out-of-core training
+    # ------------------------------------------------------------------
+
+    def update(
+        self,
+        texts: List[str],
+        extend_vocabulary: bool = False,
+        total_samples: Optional[int] = None
+    ) -> 'TopicModeler':
+        """
+        Incrementally update the model with new documents
+
+        Uses online variational Bayes (LDA.partial_fit), so only the new
+        documents are processed. An unfitted modeler is initialized from
+        this batch.
+
+        Args:
+            texts: New text documents
+            extend_vocabulary: Add unseen terms (up to max_features) instead of
+                ignoring them with the frozen vocabulary
+            total_samples: Estimated total corpus size for the online update
+                (defaults to the number of documents seen so far)
+
+        Returns:
+            Self for method chaining
+        """
+        if not self._engine.supports_partial_fit:
+            raise ValueError(f"Engine '{self.engine}' does not support incremental updates")
+
+        processed_texts = [self.preprocessor.preprocess(text) for text in texts]
+        processed_texts = [text for text in processed_texts if text]
+        if not processed_texts:
+            return self
+
+        initialize = self.lda_model is None
+        if initialize:
+            # No max_df cut: a small first batch would drop shared terms (or reject one document)
+            self.vectorizer = self._build_vectorizer(min_df=1, max_df=1.0)
+            self.vectorizer.fit(processed_texts)
+            self.n_documents_seen = 0
+        elif extend_vocabulary:
+            self._extend_vocabulary(processed_texts)
 
-        doc_term_matrix = self.vectorizer.fit_transform(processed_texts)
+        doc_term_matrix = self.vectorizer.transform(processed_texts)
         self.feature_names = self.vectorizer.get_feature_names_out()
+        if initialize:
+            self.lda_model = self._build_model(doc_term_matrix)
+
+        self.n_documents_seen = getattr(self, 'n_documents_seen', 0) + len(processed_texts)
+        self.lda_model.total_samples = total_samples or self.n_documents_seen
+        self.lda_model.partial_fit(doc_term_matrix)
 
-        # Fit LDA
-        self.lda_model = LatentDirichletAllocation(
-            n_components=self.n_topics,
-            random_state=self.random_state,
-            max_iter=20,
-            learning_method='online',
-            n_jobs=-1
+        batch_fp = corpus_fingerprint(texts)
+        self.corpus_fingerprint = (
+            corpus_fingerprint([self.corpus_fingerprint, batch_fp])
+            if self.corpus_fingerprint else batch_fp
         )
+        return self
 
-        self.lda_model.fit(doc_term_matrix)
+    def fit_stream(
+        self,
+        chunks: Iterable[List[str]],
+        extend_vocabulary: bool = True,
+        total_samples: Optional[int] = None
+    ) -> 'TopicModeler':
+        """
+        Fit (or continue fitting) from an iterable of document chunks
+
+        Only one chunk is held in memory at a time, so corpora larger than
+        RAM can be streamed, e.g. from data_loader.iter_text_chunks().
 
+        Args:
+            chunks: Iterable yielding lists of text documents
+            extend_vocabulary: Grow the vocabulary with each chunk; if False the
+                vocabulary is frozen after the first chunk (or existing fit)
+            total_samples: Estimated total corpus size, if known
+
+        Returns:
+            Self for method chaining
+        """
+        for chunk in chunks:
+            self.update(list(chunk), extend_vocabulary=extend_vocabulary, total_samples=total_samples)
         return self
 
+    def _extend_vocabulary(self, processed_texts: List[str]):
+        """Append unseen terms to the vocabulary and grow the topic-word matrix"""
+        capacity = self.max_features - len(self.vectorizer.vocabulary_)
+        if capacity <= 0:
+            return
+
+        chunk_vectorizer = CountVectorizer(stop_words='english')
+        try:
+            chunk_counts = chunk_vectorizer.fit_transform(processed_texts)
+        except ValueError:  # chunk contains only stopwords
+            return
+
+        vocabulary = dict(self.vectorizer.vocabulary_)
+        chunk_terms = chunk_vectorizer.get_feature_names_out()
+        term_totals = np.asarray(chunk_counts.sum(axis=0)).ravel()
+
+        is_new = np.array([term not in vocabulary for term in chunk_terms])
+        if not is_new.any():
+            return
+
+        # Most frequent unseen terms first, capped by remaining capacity
+        new_idx = np.flatnonzero(is_new)
+        new_idx = new_idx[np.argsort(-term_totals[new_idx], kind='stable')][:capacity]
+        for term in chunk_terms[new_idx]:
+            vocabulary[term] = len(vocabulary)
+
+        self.vectorizer = self._build_vectorizer(vocabulary=vocabulary)
+        self.vectorizer.fit([])  # fixed vocabulary: just validates it
+
+        # New columns start from the same gamma prior LDA uses at initialization
+        lda = self.lda_model
+        new_columns = lda.random_state_.gamma(100.0, 0.01, (lda.n_components, len(new_idx)))
+        lda.components_ = np.hstack([lda.components_, new_columns])
+        lda.exp_dirichlet_component_ = np.exp(
+            psi(lda.components_) - psi(lda.components_.sum(axis=1))[:, np.newaxis]
+        )
+        lda.n_features_in_ = lda.components_.shape[1]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_artifact(self) -> Dict:
+        """Fitted state as a dictionary of picklable objects"""
+        if self.lda_model is None:
+            raise ValueError("Model not fitted yet. Call fit() first.")
+
+        return {
+            'model_class': type(self).__name__,
+            'vectorizer': self.vectorizer,
+            'topic_model': self.lda_model,
+            'params': self.get_params(),
+            'corpus_fingerprint': self.corpus_fingerprint,
+            'n_documents_seen': self.n_documents_seen
+        }
+
+    @classmethod
+    def from_artifact(cls, artifact: Dict) -> 'TopicModeler':
+        """Rebuild a fitted modeler from a saved artifact"""
+        params = artifact.get('params', {})
+        modeler = cls(
+            n_topics=params.get('n_topics', artifact['topic_model'].n_components),
+            random_state=params.get('random_state', 42),
+            engine=params.get('engine', 'lda')
+        )
+        modeler.max_features = params.get('max_features', modeler.max_features)
+        modeler.vectorizer = artifact['vectorizer']
+        modeler.lda_model = artifact['topic_model']
+        modeler.feature_names = modeler.vectorizer.get_feature_names_out()
+        modeler.corpus_fingerprint = artifact.get('corpus_fingerprint')
+        modeler.n_documents_seen = artifact.get('n_documents_seen', 0)
+        return modeler
+
+    def save(self, path: Path):
+        """Save fitted vectorizer and topic model to a single file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self.to_artifact(), path, compress=3)
+
+    @classmethod
+    def load(cls, path: Path) -> 'TopicModeler':
+        """Load a modeler saved with save()"""
+        return cls.from_artifact(joblib.load(Path(path)))
+
+    def save_to_registry(
+        self,
+        name: str,
+        registry: Optional[ModelRegistry] = None,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """
+        Register the fitted model under its corpus fingerprint and hyperparameters
+
+        Returns:
+            Registry key
+        """
+        registry = registry or get_registry()
+        return registry.save(
+            name, self.to_artifact(), self.corpus_fingerprint, self.get_params(), metadata
+        )
+
+    @classmethod
+    def find_registered(
+        cls,
+        name: str,
+        texts: List[str],
+        n_topics: int = 5,
+        random_state: int = 42,
+        max_features: int = 1000,
+        registry: Optional[ModelRegistry] = None,
+        engine: str = 'lda'
+    ) -> Optional['TopicModeler']:
+        """
+        Registered model for this exact corpus and hyperparameters, without fitting
+
+        Returns:
+            Fitted TopicModeler, or None if no such model is registered
+        """
+        registry = registry or get_registry()
+        modeler = cls(n_topics=n_topics, random_state=random_state, engine=engine)
+        modeler.max_features = max_features
+
+        artifact = registry.find(name, corpus_fingerprint(texts), modeler.get_params())
+        return cls.from_artifact(artifact) if artifact is not None else None
+
+    @classmethod
+    def load_or_fit(
+        cls,
+        name: str,
+        texts: List[str],
+        n_topics: int = 5,
+        random_state: int = 42,
+        max_features: int = 1000,
+        registry: Optional[ModelRegistry] = None,
+        engine: str = 'lda'
+    ) -> 'TopicModeler':
+        """
+        Load a registered model for this exact corpus and hyperparameters,
+        fitting and registering it on a miss
+
+        Returns:
+            Fitted TopicModeler
+        """
+        registry = registry or get_registry()
+        registered = cls.find_registered(name, texts, n_topics, random_state, max_features, registry, engine)
+        if registered is not None:
+            return registered
+
+        modeler = cls(n_topics=n_topics, random_state=random_state, engine=engine)
+        modeler.fit(texts, max_features=max_features)
+        modeler.save_to_registry(name, registry, metadata={'n_documents': len(texts)})
+        return modeler
+
+    # ------------------------------------------------------------------
+    # Model selection
+    # ------------------------------------------------------------------
+
+    def sweep(
+        self,
+        texts: List[str],
+        n_topics_grid: Iterable[int] = range(2, 9),
+        doc_topic_priors: Iterable[Optional[float]] = (None,),
+        topic_word_priors: Iterable[Optional[float]] = (None,),
+        n_top_words: int = 10,
+        max_features: int = 1000,
+        max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Fit a grid of topic counts and Dirichlet priors in parallel
+
+        The corpus is vectorized once; the document-term matrix is shipped to
+        each worker process a single time and every configuration is fitted
+        against it.
+
+        Args:
+            texts: List of text documents
+            n_topics_grid: Topic counts to try
+            doc_topic_priors: Values for alpha (None = 1 / n_topics)
+            topic_word_priors: Values for eta (None = 1 / n_topics)
+            n_top_words: Top words per topic used for coherence
+            max_features: Maximum vocabulary size
+            max_workers: Worker processes (default: one per core; 1 = in-process)
+
+        Returns:
+            DataFrame with one row per configuration: n_topics, priors,
+            perplexity (lower is better), umass_coherence (closer to 0 is
+            better), npmi_coherence (higher is better), fit_seconds
+        """
+        if not self._engine.supports_partial_fit:
+            raise ValueError(f"sweep() compares LDA perplexity; engine '{self.engine}' is not LDA")
+
+        # Local matrix: a fitted modeler keeps its own vectorizer and vocabulary
+        doc_term_matrix = self._corpus_dtm(texts, max_features).matrix
+
+        configs = [
+            {
+                'n_topics': n_topics,
+                'doc_topic_prior': alpha,
+                'topic_word_prior': eta,
+                'random_state': self.random_state,
+                'n_top_words': min(n_top_words, doc_term_matrix.shape[1])
+            }
+            for n_topics, alpha, eta in product(n_topics_grid, doc_topic_priors, topic_word_priors)
+        ]
+
+        max_workers = max_workers or min(len(configs), os.cpu_count() or 1)
+        if max_workers <= 1:
+            _init_sweep_worker(doc_term_matrix)
+            results = [_fit_sweep_config(config) for config in configs]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_sweep_worker,
+                initargs=(doc_term_matrix,)
+            ) as executor:
+                results = list(executor.map(_fit_sweep_config, configs))
+
+        return pd.DataFrame(results).sort_values(
+            ['n_topics', 'doc_topic_prior', 'topic_word_prior'], na_position='first'
+        ).reset_index(drop=True)
+
     def get_top_words_per_topic(self, n_words: int = 10) -> Dict[int, List[Tuple[str, float]]]:
         """
         Get top words for each topic
@@ -340,13 +744,15 @@ class TopicModeler:
         if self.lda_model is None:
             raise ValueError("Model not fitted yet. Call fit() first.")
 
-        topics = {}
-        for topic_idx, topic in enumerate(self.lda_model.components_):
-            top_indices = topic.argsort()[-n_words:][::-1]
-            top_words = [(self.feature_names[i], topic[i]) for i in top_indices]
-            topics[topic_idx] = top_words
+        components = self.topic_word_matrix
+        top_indices = top_word_indices(components, n_words)
+        top_weights = np.take_along_axis(components, top_indices, axis=1)
+        top_terms = np.asarray(self.feature_names)[top_indices]
 
-        return topics
+        return {
+            topic_idx: list(zip(top_terms[topic_idx].tolist(), top_weights[topic_idx].tolist()))
+            for topic_idx in range(len(components))
+        }
 
     def get_topic_labels(self, n_words: int = 3) -> Dict[int, str]:
         """
@@ -380,7 +786,7 @@ class TopicModeler:
 
         processed_texts = [self.preprocessor.preprocess(text) for text in texts]
         doc_term_matrix = self.vectorizer.transform(processed_texts)
-        return self.lda_model.transform(doc_term_matrix)
+        return self._engine.doc_topic(self.lda_model, doc_term_matrix)
 
     def get_dominant_topic(self, texts: List[str]) -> pd.DataFrame:
         """
@@ -392,20 +798,47 @@ class TopicModeler:
         topic_distributions = self.transform(texts)
         labels = self.get_topic_labels()
 
-        results = []
-        for doc_id, dist in enumerate(topic_distributions):
-            dominant_topic = dist.argmax()
-            confidence = dist[dominant_topic]
-
-            results.append({
-                'document_id': doc_id,
-                'dominant_topic': dominant_topic,
-                'topic_label': labels[dominant_topic],
-                'confidence': confidence,
-                'text_preview': texts[doc_id][:100] if doc_id < len(texts) else ""
-            })
+        dominant_topic = topic_distributions.argmax(axis=1)
+        confidence = topic_distributions.max(axis=1)
 
-        return pd.DataFrame(results)
+        return pd.DataFrame({
+            'document_id': np.arange(len(topic_distributions)),
+            'dominant_topic': dominant_topic,
+            'topic_label': pd.Categorical.from_codes(
+                dominant_topic, categories=[labels[i] for i in range(self.n_topics)]
+            ),
+            'confidence': confidence,
+            'text_preview': pd.Series(texts, dtype='string').fillna('').str.slice(0, 100).to_numpy()
+        })
+
+    def get_coherence(self, texts: List[str], n_top_words: int = 10) -> pd.DataFrame:
+        """
+        UMass and NPMI coherence of each fitted topic on a corpus
+
+        Args:
+            texts: Reference corpus (usually the training texts)
+            n_top_words: Top words per topic to score
+
+        Returns:
+            DataFrame with topic_id, topic_label, umass, npmi
+        """
+        if self.lda_model is None or self.vectorizer is None:
+            raise ValueError("Model not fitted yet. Call fit() first.")
+
+        doc_term_matrix = None
+        if corpus_fingerprint(texts) == self.corpus_fingerprint:
+            # Training corpus: reuse the cached matrix if it has the fitted vocabulary
+            # (not after update(), whose vectorizer settings differ from fit())
+            cached = self._corpus_dtm(texts)
+            if np.array_equal(cached.terms, self.feature_names):
+                doc_term_matrix = cached.matrix
+        if doc_term_matrix is None:
+            processed_texts = [self.preprocessor.preprocess(text) for text in texts]
+            doc_term_matrix = self.vectorizer.transform(processed_texts)
+
+        scores = coherence_scores(doc_term_matrix, self.topic_word_matrix, n_top_words)
+        scores.insert(1, 'topic_label', scores['topic_id'].map(self.get_topic_labels()))
+        return scores
 
     def plot_topics(self, n_words: int = 10, title: str = "Topic Model (LDA)"):
         """Plot top words for each topic"""
@@ -495,6 +928,11 @@ if __name__ == "__main__":
     for topic_id, label in labels.items():
         print(f"   - {label}")
 
+    # Test incremental update
+    print("\n🔄 Testing Incremental Update...")
+    topic_modeler.update(["Edge computing keeps XR rendering latency low for field technicians"], extend_vocabulary=True)
+    print(f"✅ Vocabulary after update: {len(topic_modeler.feature_names)} terms, {topic_modeler.n_documents_seen} documents seen")
+
     print("\n" + "=" * 70)
     print("✅ ALL TEXT ANALYTICS UTILITIES READY")
     print("=" * 70)
@@ -0,0 +1,148 @@
+"""
+Topic Coherence Metrics
+UMass and NPMI coherence for all topics at once from a sparse document-term matrix
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from typing import Tuple
+
+
+def top_word_indices(components: np.ndarray, n_top_words: int = 10) -> np.ndarray:
+    """
+    Column indices of the highest-weighted words per topic
+
+    Args:
+        components: Topic-word matrix of shape (n_topics, n_words)
+        n_top_words: Words to keep per topic
+
+    Returns:
+        Integer array of shape (n_topics, n_top_words), strongest word first
+    """
+    components = np.asarray(components)
+    n_top_words = min(n_top_words, components.shape[1])
+
+    # Partial selection over the whole matrix, then order only the selected words
+    top = np.argpartition(-components, n_top_words - 1, axis=1)[:, :n_top_words]
+    order = np.argsort(-np.take_along_axis(components, top, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(top, order, axis=1)
+
+
+def _top_word_cooccurrence(doc_term_matrix, top_indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Document co-occurrence counts between the top words of every topic
+
+    Only the union of top-word columns is multiplied (X_u^T X_u), so the
+    cost depends on the number of distinct top words, not the vocabulary.
+
+    Returns:
+        (pair_counts, doc_counts) with shapes (n_topics, N, N) and (n_topics, N);
+        pair_counts[k, i, j] = documents containing both word i and word j of topic k
+    """
+    binary = sparse.csr_matrix(doc_term_matrix, copy=True)
+    binary.data = np.ones_like(binary.data, dtype=np.float64)
+
+    columns = np.unique(top_indices)
+    restricted = binary[:, columns]
+    cooccurrence = (restricted.T @ restricted).toarray()
+
+    positions = np.searchsorted(columns, top_indices)
+    pair_counts = cooccurrence[positions[:, :, None], positions[:, None, :]]
+    doc_counts = np.diagonal(pair_counts, axis1=1, axis2=2)
+    return pair_counts, doc_counts
+
+
+def umass_coherence(doc_term_matrix, components: np.ndarray, n_top_words: int = 10) -> np.ndarray:
+    """
+    UMass coherence per topic (Mimno et al., 2011)
+
+    Args:
+        doc_term_matrix: Sparse (n_docs, n_words) count matrix the model was fitted on
+        components: Topic-word matrix of shape (n_topics, n_words)
+        n_top_words: Top words per topic to score
+
+    Returns:
+        Array of shape (n_topics,); values closer to 0 are more coherent
+    """
+    top = top_word_indices(components, n_top_words)
+    pair_counts, doc_counts = _top_word_cooccurrence(doc_term_matrix, top)
+
+    # Pairs (i, j) with i ranked below j: log((D(w_i, w_j) + 1) / D(w_j))
+    rows, cols = np.tril_indices(top.shape[1], k=-1)
+    scores = np.log(
+        (pair_counts[:, rows, cols] + 1.0) / np.maximum(doc_counts[:, cols], 1.0)
+    )
+    return scores.mean(axis=1)
+
+
+def npmi_coherence(doc_term_matrix, components: np.ndarray, n_top_words: int = 10) -> np.ndarray:
+    """
+    Normalized PMI coherence per topic, using documents as the co-occurrence window
+
+    Args:
+        doc_term_matrix: Sparse (n_docs, n_words) count matrix
+        components: Topic-word matrix of shape (n_topics, n_words)
+        n_top_words: Top words per topic to score
+
+    Returns:
+        Array of shape (n_topics,) in [-1, 1]; higher is more coherent
+    """
+    top = top_word_indices(components, n_top_words)
+    pair_counts, doc_counts = _top_word_cooccurrence(doc_term_matrix, top)
+    n_docs = max(doc_term_matrix.shape[0], 1)
+
+    rows, cols = np.triu_indices(top.shape[1], k=1)
+    p_joint = pair_counts[:, rows, cols] / n_docs
+    p_i = doc_counts[:, rows] / n_docs
+    p_j = doc_counts[:, cols] / n_docs
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pmi = np.log(p_joint / (p_i * p_j))
+        npmi = pmi / -np.log(p_joint)
+
+    # Never co-occurring -> -1; always co-occurring (p_joint == 1) -> 1
+    npmi = np.where(p_joint == 0, -1.0, npmi)
+    npmi = np.where(p_joint == 1, 1.0, npmi)
+    return npmi.mean(axis=1)
+
+
+def coherence_scores(doc_term_matrix, components: np.ndarray, n_top_words: int = 10) -> pd.DataFrame:
+    """
+    UMass and NPMI coherence for every topic
+
+    Returns:
+        DataFrame with columns topic_id, umass, npmi
+    """
+    return pd.DataFrame({
+        'topic_id': np.arange(len(components)),
+        'umass': umass_coherence(doc_term_matrix, components, n_top_words),
+        'npmi': npmi_coherence(doc_term_matrix, components, n_top_words)
+    })
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+    from sklearn.decomposition import LatentDirichletAllocation
+
+    print("=" * 70)
+    print("TOPIC COHERENCE - TEST")
+    print("=" * 70)
+
+    rng = np.random.default_rng(0)
+    demo_matrix = sparse.random(5000, 20000, density=0.002, format='csr', random_state=0)
+    demo_matrix.data = rng.integers(1, 5, size=demo_matrix.nnz).astype(float)
+
+    lda = LatentDirichletAllocation(n_components=20, max_iter=5, learning_method='online', random_state=0)
+    lda.fit(demo_matrix)
+
+    start = time.perf_counter()
+    scores = coherence_scores(demo_matrix, lda.components_, n_top_words=10)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"\n✅ Scored {len(scores)} topics over a {demo_matrix.shape[1]:,}-word vocabulary")
+    print(f"✅ Mean UMass: {scores['umass'].mean():.3f}, mean NPMI: {scores['npmi'].mean():.3f}")
+    print(f"⏱️  {elapsed:.1f} ms")
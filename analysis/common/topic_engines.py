@@ -0,0 +1,199 @@
+"""
+Topic Modeling Engines
+Interchangeable topic models behind one interface: LDA (online/batch), NMF and MiniBatchKMeans
+"""
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import NMF, LatentDirichletAllocation
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+from lda_planner import plan_for_matrix
+
+
+class TopicEngine(ABC):
+    """
+    Strategy for one topic-model family
+
+    An engine decides how documents are vectorized, which estimator is
+    fitted, and how the estimator's output maps to doc-topic proportions
+    and topic-word weights.
+    """
+
+    name = 'base'
+    vectorizer_class = CountVectorizer
+    supports_partial_fit = False
+
+    @abstractmethod
+    def build_model(self, n_topics: int, random_state: int, doc_term_matrix):
+        """Unfitted estimator, sized for the matrix it will be fitted on"""
+
+    def doc_topic(self, model, doc_term_matrix) -> np.ndarray:
+        """Doc-topic proportions of shape (n_documents, n_topics), rows summing to 1"""
+        return model.transform(doc_term_matrix)
+
+    def topic_word(self, model) -> np.ndarray:
+        """Topic-word weights of shape (n_topics, n_words)"""
+        return model.components_
+
+
+class LDAEngine(TopicEngine):
+    """Latent Dirichlet Allocation on raw term counts"""
+
+    vectorizer_class = CountVectorizer
+    supports_partial_fit = True
+
+    def __init__(self, learning_method: Optional[str] = None):
+        """
+        Args:
+            learning_method: 'online' (mini-batch variational Bayes), 'batch',
+                or None to let the execution planner choose
+        """
+        self.learning_method = learning_method
+        self.name = 'lda' if learning_method is None else f'lda_{learning_method}'
+
+    def build_model(self, n_topics: int, random_state: int, doc_term_matrix) -> LatentDirichletAllocation:
+        plan = plan_for_matrix(doc_term_matrix, n_topics, learning_method=self.learning_method)
+        return LatentDirichletAllocation(
+            n_components=n_topics,
+            random_state=random_state,
+            **plan.lda_kwargs()
+        )
+
+
+class NMFEngine(TopicEngine):
+    """Non-negative matrix factorization on TF-IDF weights"""
+
+    name = 'nmf'
+    vectorizer_class = TfidfVectorizer
+
+    def build_model(self, n_topics: int, random_state: int, doc_term_matrix) -> NMF:
+        return NMF(
+            n_components=n_topics,
+            init='nndsvda',
+            random_state=random_state,
+            max_iter=400
+        )
+
+    def doc_topic(self, model, doc_term_matrix) -> np.ndarray:
+        weights = model.transform(doc_term_matrix)
+        totals = weights.sum(axis=1, keepdims=True)
+
+        # Documents with no known terms get a uniform distribution
+        uniform = np.full_like(weights, 1.0 / weights.shape[1])
+        return np.divide(weights, totals, out=uniform, where=totals > 0)
+
+
+class MiniBatchKMeansEngine(TopicEngine):
+    """
+    MiniBatchKMeans clustering on TF-IDF weights
+
+    Each cluster is a topic; documents belong to exactly one topic, so
+    doc-topic rows are one-hot.
+    """
+
+    name = 'kmeans'
+    vectorizer_class = TfidfVectorizer
+
+    def build_model(self, n_topics: int, random_state: int, doc_term_matrix) -> MiniBatchKMeans:
+        return MiniBatchKMeans(
+            n_clusters=n_topics,
+            random_state=random_state,
+            batch_size=1024,
+            n_init=3
+        )
+
+    def doc_topic(self, model, doc_term_matrix) -> np.ndarray:
+        labels = model.predict(doc_term_matrix)
+        return np.eye(model.n_clusters)[labels]
+
+    def topic_word(self, model) -> np.ndarray:
+        return model.cluster_centers_
+
+
+ENGINES: Dict[str, TopicEngine] = {
+    engine.name: engine
+    for engine in (LDAEngine(), LDAEngine('online'), LDAEngine('batch'), NMFEngine(), MiniBatchKMeansEngine())
+}
+
+
+def get_engine(name: str) -> TopicEngine:
+    """
+    Look up an engine by name
+
+    Args:
+        name: One of 'lda' (planned), 'lda_online', 'lda_batch', 'nmf', 'kmeans'
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown topic engine '{name}'. Available: {', '.join(ENGINES)}")
+    return ENGINES[name]
+
+
+def benchmark_engines(
+    texts: List[str],
+    n_topics: int = 5,
+    engines: Optional[List[str]] = None,
+    max_features: int = 1000
+) -> pd.DataFrame:
+    """
+    Fit time, peak memory and coherence of each engine on the same corpus
+
+    Args:
+        texts: List of text documents
+        n_topics: Number of topics per model
+        engines: Engine names to compare (default: all)
+        max_features: Maximum vocabulary size
+
+    Returns:
+        DataFrame with engine, fit_seconds, peak_memory_mb, npmi_coherence
+    """
+    # Imported here: text_analytics imports this module
+    from text_analytics import TopicModeler
+    from topic_coherence import npmi_coherence
+
+    rows = []
+    for name in engines or list(ENGINES):
+        modeler = TopicModeler(n_topics=n_topics, engine=name)
+        start = time.perf_counter()
+        modeler.fit(texts, max_features=max_features)
+        fit_seconds = time.perf_counter() - start
+
+        # Separate traced fit: tracemalloc overhead would distort the timing
+        tracemalloc.start()
+        TopicModeler(n_topics=n_topics, engine=name).fit(texts, max_features=max_features)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        doc_term_matrix = modeler.vectorizer.transform(
+            [modeler.preprocessor.preprocess(text) for text in texts]
+        )
+        rows.append({
+            'engine': name,
+            'fit_seconds': fit_seconds,
+            'peak_memory_mb': peak_bytes / 1024 ** 2,
+            'npmi_coherence': float(npmi_coherence(doc_term_matrix, modeler.topic_word_matrix).mean())
+        })
+
+    return pd.DataFrame(rows)
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    from data_loader import load_dimension
+
+    print("=" * 70)
+    print("TOPIC ENGINES - BENCHMARK")
+    print("=" * 70)
+
+    demo_texts = load_dimension('scalability')['corpus']['content'].astype(str).tolist()
+
+    results = benchmark_engines(demo_texts, n_topics=5)
+    print(f"\n✅ {len(demo_texts)} documents, 5 topics\n")
+    print(results.round(3).to_string(index=False))
@@ -0,0 +1,277 @@
+"""
+Topic-Sentiment Analysis
+Sentiment per topic as a topic-weighted projection of document sentiment
+"""
+import threading
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from data_loader import DATA_ROOT, get_loader
+from sentiment_stats import dataset_version
+
+
+# Pre-computed per-document outputs that can be joined, per dimension (paths under DATA_ROOT)
+TOPIC_SENTIMENT_SOURCES: Dict[str, Dict] = {
+    'scalability': {
+        'topics': Path("XR scalability/XR_LDA_Topic_Distribution.csv"),  # Topic_1..Topic_K proportions
+        'sentiment': Path("XR scalability/XR_Sentiment_Analysis_Results.csv"),
+        'join_on': 'record_id',  # row index of the processed master corpus
+        # Topic files written without record_id hold one row per corpus document with text
+        'corpus': Path("XR scalability/XR_Processed_Master_Corpus.csv"),
+        'text_col': 'cleaned_text',
+        'score_col': 'global_sentiment_score',
+        'label_col': 'global_sentiment_class'
+    },
+    'use_cases': {
+        'topics': Path("XR_use_cases/XR_Submission/xr_doc_dominant_topic.csv"),  # dominant_topic only
+        'sentiment': Path("XR_use_cases/XR_Submission/xr_sentiment_output.csv"),
+        'topic_names': Path("XR_use_cases/XR_Submission/xr_topics.json"),
+        'join_on': 'id',
+        'score_col': 'compound',
+        'label_col': 'label'
+    }
+}
+
+# Process-wide cache: (dimension, file versions) -> topic-sentiment table
+_topic_sentiment_cache: Dict[tuple, pd.DataFrame] = {}
+_cache_lock = threading.Lock()
+
+
+def one_hot_topics(dominant_topic: Sequence[int], n_topics: Optional[int] = None) -> np.ndarray:
+    """
+    Doc-topic matrix for hard topic assignments
+
+    Args:
+        dominant_topic: Topic id per document
+        n_topics: Number of topics (default: max id + 1)
+
+    Returns:
+        Array of shape (n_documents, n_topics) with one 1.0 per row
+    """
+    dominant_topic = np.asarray(dominant_topic, dtype=int)
+    n_topics = n_topics or int(dominant_topic.max()) + 1
+    return np.eye(n_topics)[dominant_topic]
+
+
+def topic_sentiment_matrix(
+    doc_topics: np.ndarray,
+    scores: Sequence[float],
+    labels: Optional[Sequence[str]] = None,
+    topic_names: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Topic-weighted sentiment for every topic at once
+
+    With W the (n_documents x n_topics) doc-topic matrix and s the score
+    vector, the topic means are W^T s / W^T 1 and the variances
+    W^T s^2 / W^T 1 - mean^2: two matrix-vector products over the corpus.
+
+    Args:
+        doc_topics: Doc-topic proportions (or one-hot assignments)
+        scores: Sentiment score per document (e.g. VADER compound)
+        labels: Optional sentiment class per document; adds share_<class> columns
+            (documents without a label are left out of the shares)
+        topic_names: Optional display name per topic
+
+    Returns:
+        DataFrame with topic, weight_share, mean_sentiment, std_sentiment,
+        effective_n (Kish effective sample size) and class shares
+    """
+    doc_topics = np.asarray(doc_topics, dtype=float)
+    scores = np.asarray(scores, dtype=float)
+
+    # Documents without a score carry no weight
+    scored = ~np.isnan(scores)
+    doc_topics, scores = doc_topics[scored], scores[scored]
+
+    weights = doc_topics.sum(axis=0)
+    safe_weights = np.where(weights > 0, weights, np.nan)
+
+    mean = (doc_topics.T @ scores) / safe_weights
+    variance = np.clip((doc_topics.T @ scores ** 2) / safe_weights - mean ** 2, 0.0, None)
+
+    table = pd.DataFrame({
+        'topic': topic_names or [f"Topic_{topic_id + 1}" for topic_id in range(doc_topics.shape[1])],
+        'weight_share': weights / weights.sum(),
+        'mean_sentiment': mean,
+        'std_sentiment': np.sqrt(variance),
+        'effective_n': weights ** 2 / (doc_topics ** 2).sum(axis=0)
+    })
+
+    if labels is not None:
+        classes = pd.Series(np.asarray(labels, dtype=object)[scored])
+        labeled = classes.notna().to_numpy()
+        one_hot = pd.get_dummies(classes[labeled].astype(str).str.lower()).astype(float)
+        labeled_weights = doc_topics[labeled].sum(axis=0)
+        shares = (doc_topics[labeled].T @ one_hot.to_numpy()) / np.where(
+            labeled_weights > 0, labeled_weights, np.nan
+        )[:, None]
+        for k, cls in enumerate(one_hot.columns):
+            table[f"share_{cls}"] = shares[:, k]
+
+    return table
+
+
+def attach_corpus_ids(topics: pd.DataFrame, corpus: pd.DataFrame, text_col: str, id_col: str) -> pd.DataFrame:
+    """
+    Recover document ids for a topic table written without them
+
+    The topic script models corpus[text_col].dropna() in corpus order, so
+    row i of the table belongs to the i-th corpus row that has text.
+
+    Raises:
+        ValueError: If the row counts show the table came from another selection
+    """
+    documents = corpus[text_col].dropna()
+    if len(documents) != len(topics):
+        raise ValueError(
+            f"{len(topics)} topic rows but {len(documents)} corpus documents with {text_col}; "
+            f"re-run the topic script so it writes {id_col}"
+        )
+    return topics.assign(**{id_col: documents.index.to_numpy()})
+
+
+def load_topic_sentiment_inputs(dimension_id: str) -> Tuple[np.ndarray, pd.Series, pd.Series, Optional[List[str]]]:
+    """
+    Join a dimension's pre-computed doc-topic and sentiment files
+
+    Returns:
+        (doc_topics, scores, labels, topic_names)
+    """
+    if dimension_id not in TOPIC_SENTIMENT_SOURCES:
+        raise ValueError(
+            f"No joinable topic/sentiment outputs for '{dimension_id}'. "
+            f"Available: {', '.join(TOPIC_SENTIMENT_SOURCES)}"
+        )
+
+    source = TOPIC_SENTIMENT_SOURCES[dimension_id]
+    loader = get_loader()
+    topics = loader.load_artifact(DATA_ROOT / source['topics'])
+    sentiment = loader.load_artifact(DATA_ROOT / source['sentiment'])
+
+    # Rows are matched by document id, never by position: either script may skip documents
+    if source['join_on'] not in topics.columns and 'corpus' in source:
+        corpus = loader.load_artifact(DATA_ROOT / source['corpus'])
+        topics = attach_corpus_ids(topics, corpus, source['text_col'], source['join_on'])
+    joined = topics.merge(sentiment, on=source['join_on'], how='inner', suffixes=('', '_sentiment'))
+
+    topic_names = None
+    if 'topic_names' in source:
+        topics_json = loader.load_artifact(DATA_ROOT / source['topic_names'])
+        topic_names = [topic['topic_name'] for topic in sorted(topics_json, key=lambda t: t['topic_id'])]
+
+    if 'dominant_topic' in joined.columns:
+        doc_topics = one_hot_topics(joined['dominant_topic'], len(topic_names) if topic_names else None)
+    else:
+        doc_topics = joined[[col for col in topics.columns if col.startswith('Topic_')]].to_numpy()
+
+    return doc_topics, joined[source['score_col']], joined[source['label_col']], topic_names
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+
+def get_topic_sentiment(dimension_id: str) -> pd.DataFrame:
+    """
+    Sentiment per topic for a dimension, computed once per data version
+
+    Returns:
+        DataFrame as returned by topic_sentiment_matrix()
+    """
+    source = TOPIC_SENTIMENT_SOURCES.get(dimension_id, {})
+    key = (dimension_id,) + tuple(
+        dataset_version(DATA_ROOT / source[name]) for name in ('topics', 'sentiment', 'topic_names', 'corpus') if name in source
+    )
+    with _cache_lock:
+        if key in _topic_sentiment_cache:
+            return _topic_sentiment_cache[key]
+
+    doc_topics, scores, labels, topic_names = load_topic_sentiment_inputs(dimension_id)
+    table = topic_sentiment_matrix(doc_topics, scores, labels, topic_names)
+
+    with _cache_lock:
+        _topic_sentiment_cache[key] = table
+    return table
+
+
+# ============================================================================
+# STREAMLIT HELPERS
+# ============================================================================
+
+def show_topic_sentiment(dimension_id: str, description: str):
+    """
+    "Sentiment by Topic" section of a dimension page: table plus most/least positive topic
+
+    Args:
+        dimension_id: Dimension with an entry in TOPIC_SENTIMENT_SOURCES
+        description: Sentence introducing the table
+    """
+    import streamlit as st
+
+    st.markdown("---")
+    st.markdown("### 🔀 Sentiment by Topic")
+    try:
+        topic_sentiment = get_topic_sentiment(dimension_id)
+
+        st.markdown(description)
+        display_df = topic_sentiment[['topic', 'weight_share', 'mean_sentiment', 'std_sentiment', 'effective_n']].copy()
+        display_df.columns = ['Topic', 'Share of Corpus', 'Mean Sentiment', 'Std Dev', 'Effective Docs']
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Share of Corpus": st.column_config.ProgressColumn(
+                    "Share of Corpus", format="%.2f", min_value=0.0, max_value=1.0
+                ),
+                "Mean Sentiment": st.column_config.NumberColumn(
+                    "Mean Sentiment",
+                    format="%.3f",
+                    help="Topic-weighted mean compound score (-1 to +1)"
+                ),
+                "Std Dev": st.column_config.NumberColumn("Std Dev", format="%.3f"),
+                "Effective Docs": st.column_config.NumberColumn(
+                    "Effective Docs",
+                    format="%.1f",
+                    help="Effective number of documents behind the topic's mean"
+                )
+            }
+        )
+
+        best = topic_sentiment.loc[topic_sentiment['mean_sentiment'].idxmax()]
+        worst = topic_sentiment.loc[topic_sentiment['mean_sentiment'].idxmin()]
+        st.caption(
+            f"Most positive: **{best['topic']}** ({best['mean_sentiment']:.3f}) · "
+            f"Least positive: **{worst['topic']}** ({worst['mean_sentiment']:.3f})"
+        )
+    except Exception as e:
+        st.warning(f"Topic-sentiment analysis failed: {e}")
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("TOPIC-SENTIMENT - TEST")
+    print("=" * 70)
+
+    for dimension_id in TOPIC_SENTIMENT_SOURCES:
+        start = time.perf_counter()
+        table = get_topic_sentiment(dimension_id)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        print(f"\n✅ {dimension_id} ({elapsed:.1f} ms incl. file reads):")
+        print(table.round(3).to_string(index=False))
+
+    doc_topics = np.random.default_rng(0).dirichlet(np.ones(10), size=1_000_000)
+    scores = np.random.default_rng(1).uniform(-1, 1, size=1_000_000)
+    start = time.perf_counter()
+    topic_sentiment_matrix(doc_topics, scores)
+    print(f"\n⏱️  1,000,000 documents x 10 topics: {(time.perf_counter() - start) * 1000:.0f} ms")
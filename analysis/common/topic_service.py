@@ -0,0 +1,391 @@
+"""
+Topic Inference Service
+Score new documents against a persisted topic model, coalescing requests into micro-batches
+"""
+import json
+import queue
+import threading
+import time
+import numpy as np
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import joblib
+
+from model_registry import ModelRegistry, get_registry
+from text_analytics import TopicModeler
+from topic_engines import get_engine
+
+
+DEFAULT_PORT = 8765
+REQUEST_TIMEOUT = 30.0  # seconds an HTTP request waits for its topics
+
+
+class TopicInferenceService:
+    """
+    Loads a fitted topic model once and serves doc-topic distributions
+
+    Callers submit single documents from any thread. A background worker
+    drains the queue into micro-batches of up to max_batch_size documents,
+    waiting at most max_wait_ms for a batch to fill, so one
+    vectorizer.transform + model.transform call serves many requests.
+    """
+
+    def __init__(
+        self,
+        artifact: Dict,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Initialize service (call start() or use as a context manager)
+
+        Args:
+            artifact: Model artifact (TopicModeler.to_artifact() or a registry entry)
+            max_batch_size: Documents per transform call
+            max_wait_ms: Longest a request waits for its batch to fill
+        """
+        self.modeler = TopicModeler.from_artifact(artifact)
+        self._engine = get_engine(self.modeler.engine)
+
+        # TopicModeler artifacts were fitted on preprocessed text; artifacts from
+        # the batch scripts (register_fitted_model) on their own cleaned text
+        self._preprocess = (
+            self.modeler.preprocessor.preprocess
+            if artifact.get('model_class') == TopicModeler.__name__ else None
+        )
+
+        self.labels = self.modeler.get_topic_labels()
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: queue.Queue = queue.Queue()
+        self._queue_lock = threading.Lock()  # orders submit() against stop()
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._n_documents = 0
+        self._n_batches = 0
+
+    @classmethod
+    def from_registry(
+        cls,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        registry: Optional[ModelRegistry] = None,
+        **kwargs
+    ) -> 'TopicInferenceService':
+        """
+        Service for a registered model
+
+        Args:
+            name: Model name; the most recently saved model is used
+            key: Exact registry key (takes precedence over name)
+            registry: Model registry (default: global registry)
+        """
+        registry = registry or get_registry()
+        key = key or registry.latest(name)
+        artifact = registry.load(key) if key else None
+        if artifact is None:
+            raise ValueError(f"No registered model for name={name!r}, key={key!r}")
+        return cls(artifact, **kwargs)
+
+    @classmethod
+    def from_file(cls, path: Path, **kwargs) -> 'TopicInferenceService':
+        """Service for a model saved with TopicModeler.save()"""
+        return cls(joblib.load(Path(path)), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> 'TopicInferenceService':
+        """Start the batching worker (idempotent)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._stopping.clear()
+            self._worker = threading.Thread(target=self._run, name="topic-inference", daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self):
+        """Finish queued requests and stop the worker"""
+        if self._worker is not None:
+            with self._queue_lock:
+                self._stopping.set()  # no submit() can enqueue after this, so the drain is complete
+            self._worker.join()
+            self._worker = None
+
+    def __enter__(self) -> 'TopicInferenceService':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue one document for inference
+
+        Returns:
+            Future resolving to its topic distribution (array of n_topics);
+            it fails with RuntimeError if the service is stopping
+        """
+        if self._worker is None:
+            raise RuntimeError("Service not started. Call start() first.")
+
+        future = Future()
+        with self._queue_lock:
+            if self._stopping.is_set():
+                future.set_exception(RuntimeError("Service is stopping"))
+            else:
+                self._queue.put(("" if text is None else str(text), future))
+        return future
+
+    def infer(self, texts: List[str], timeout: Optional[float] = None) -> np.ndarray:
+        """
+        Topic distributions for a list of documents (blocking)
+
+        Documents join the shared queue, so concurrent callers share batches.
+
+        Args:
+            texts: Documents to score
+            timeout: Seconds to wait for the whole list; on expiry the
+                documents still queued are cancelled and TimeoutError is raised
+
+        Returns:
+            Array of shape (n_documents, n_topics)
+        """
+        futures = [self.submit(text) for text in texts]
+        if not futures:
+            return np.empty((0, len(self.labels)))
+
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        rows = []
+        try:
+            for future in futures:
+                remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                rows.append(future.result(timeout=remaining))
+        except FutureTimeoutError:
+            for future in futures:
+                future.cancel()  # the worker skips cancelled requests
+            raise
+        return np.vstack(rows)
+
+    def transform_batch(self, texts: List[str]) -> np.ndarray:
+        """One vectorize + transform pass over a batch (no queueing)"""
+        if self._preprocess is not None:
+            texts = [self._preprocess(text) for text in texts]
+        doc_term_matrix = self.modeler.vectorizer.transform(texts)
+        return self._engine.doc_topic(self.modeler.lda_model, doc_term_matrix)
+
+    def stats(self) -> Dict:
+        """Documents served, batches run and mean batch size"""
+        with self._stats_lock:
+            return {
+                'documents': self._n_documents,
+                'batches': self._n_batches,
+                'mean_batch_size': self._n_documents / self._n_batches if self._n_batches else 0.0
+            }
+
+    def _next_batch(self) -> List[tuple]:
+        """Block for one request, then gather more until the batch is full or the wait expires"""
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _serve_batch(self, batch: List[tuple]):
+        """Transform one batch and resolve its futures (requests cancelled by their caller are skipped)"""
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        texts, futures = zip(*batch)
+        try:
+            doc_topics = self.transform_batch(list(texts))
+        except Exception as exc:
+            for future in futures:
+                future.set_exception(exc)
+            return
+
+        for future, row in zip(futures, doc_topics):
+            future.set_result(row)
+
+        with self._stats_lock:
+            self._n_documents += len(batch)
+            self._n_batches += 1
+
+    def _run(self):
+        """Worker loop: drain the queue in micro-batches until stopped and empty"""
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            try:
+                self._serve_batch(batch)
+            except Exception as exc:  # one bad batch must not stop the only worker
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+
+# ============================================================================
+# LOCAL HTTP ENDPOINT
+# ============================================================================
+
+def make_http_server(
+    service: TopicInferenceService,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    request_timeout: float = REQUEST_TIMEOUT
+) -> ThreadingHTTPServer:
+    """
+    Local HTTP front end for a started service
+
+    Endpoints:
+        POST /infer  {"texts": [...]} or {"text": "..."} ->
+                     {"topics": [[...], ...], "dominant_topic": [...], "labels": {...}}
+        GET /health  -> {"status": "ok", "n_topics": ..., "stats": {...}}
+
+    Each connection is handled on its own thread, so concurrent requests
+    are coalesced by the service's batching worker. Malformed bodies get
+    400, a stopped service 503 and requests not served within
+    request_timeout seconds 504.
+    """
+    labels = {str(topic_id): label for topic_id, label in service.labels.items()}
+
+    class InferenceHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status: int, payload: Dict):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path != "/health":
+                self._send_json(404, {"error": f"Unknown path {self.path}"})
+                return
+            self._send_json(200, {"status": "ok", "n_topics": len(labels), "stats": service.stats()})
+
+        def do_POST(self):
+            if self.path != "/infer":
+                self._send_json(404, {"error": f"Unknown path {self.path}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                if length < 0:
+                    raise ValueError("negative Content-Length")  # rfile.read(-1) would wait for EOF
+                request = json.loads(self.rfile.read(length) or b"{}")
+                texts = request["texts"] if "texts" in request else [request["text"]]
+                if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                    raise TypeError("texts must be a list of strings")
+            except (ValueError, KeyError, TypeError):
+                self._send_json(400, {"error": 'Expected JSON body {"texts": [...]} or {"text": "..."}'})
+                return
+
+            try:
+                doc_topics = service.infer(texts, timeout=request_timeout)
+            except FutureTimeoutError:
+                self._send_json(504, {"error": f"Inference did not finish within {request_timeout:g} s"})
+                return
+            except RuntimeError as exc:
+                self._send_json(503, {"error": str(exc)})
+                return
+            self._send_json(200, {
+                "topics": doc_topics.round(6).tolist(),
+                "dominant_topic": doc_topics.argmax(axis=1).tolist() if len(doc_topics) else [],
+                "labels": labels
+            })
+
+        def log_message(self, format, *args):
+            pass  # keep the console quiet at high request rates
+
+    return ThreadingHTTPServer((host, port), InferenceHandler)
+
+
+def serve(
+    name: Optional[str] = None,
+    key: Optional[str] = None,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    **kwargs
+):
+    """Load a registered model and serve it over HTTP until interrupted"""
+    with TopicInferenceService.from_registry(name=name, key=key, **kwargs) as service:
+        server = make_http_server(service, host, port)
+        print(f"Serving {key or name} ({len(service.labels)} topics) on http://{host}:{server.server_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+    from joint_topics import JOINT_MODEL_NAME
+
+    # python topic_service.py --serve [model name] [port]
+    if "--serve" in sys.argv[1:]:
+        args = [arg for arg in sys.argv[1:] if arg != "--serve"]
+        serve(
+            name=args[0] if args else JOINT_MODEL_NAME,
+            port=int(args[1]) if len(args) > 1 else DEFAULT_PORT
+        )
+        sys.exit(0)
+
+    from data_loader import load_dimension
+
+    def timed_request(service, text):
+        """Latency of one submitted document in milliseconds"""
+        start = time.perf_counter()
+        service.submit(text).result()
+        return (time.perf_counter() - start) * 1000
+
+    print("=" * 70)
+    print("TOPIC INFERENCE SERVICE - TEST")
+    print("=" * 70)
+
+    texts = load_dimension('scalability')['corpus']['content'].astype(str).tolist()
+    modeler = TopicModeler(n_topics=5).fit(texts)
+
+    with TopicInferenceService(modeler.to_artifact()) as service:
+        start = time.perf_counter()
+        for text in texts:
+            service.transform_batch([text])
+        single_seconds = time.perf_counter() - start
+
+        # One client thread per document: requests arrive concurrently
+        with ThreadPoolExecutor(max_workers=32) as clients:
+            start = time.perf_counter()
+            latencies = list(clients.map(lambda text: timed_request(service, text), texts))
+            batched_seconds = time.perf_counter() - start
+
+        stats = service.stats()
+        print(f"\n✅ Matches TopicModeler.transform: {np.allclose(service.infer(texts[:20]), modeler.transform(texts[:20]))}")
+        print(f"⏱️  One transform per document: {len(texts) / single_seconds:,.0f} docs/s")
+        print(f"⏱️  Micro-batched: {len(texts) / batched_seconds:,.0f} docs/s "
+              f"(mean batch {stats['mean_batch_size']:.1f}, p99 latency {np.percentile(latencies, 99):.1f} ms)")
+
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Per-Page Render Benchmark
+Cold/warm single-session render times, import time and peak memory for every dashboard page
+
+Every target is measured in a fresh Python process, so "cold" really means
+a new server process: empty module, data and figure caches. Within that
+process the benchmark
+  1. executes the page's top-level imports               -> import_ms
+  2. renders the page once with streamlit's AppTest      -> cold_render_ms
+  3. renders it again --warm-runs times (median)         -> warm_render_ms
+  4. reads the process's peak resident memory            -> peak_rss_mb
+
+Targets are dashboard/pages/2-8 and each view of streamlit_app.py. A
+streamlit_app.py view is reached the way a user reaches it: the default
+view is rendered first (not counted), then the view is selected.
+
+Usage:
+    python benchmark_dashboard_pages.py [--repeat=3] [--warm-runs=5]
+                                        [--only=Maturity,Synthesis]
+                                        [--output=benchmark_results.json]
+                                        [--baseline=benchmark_baseline.json]
+                                        [--tolerance=0.25] [--update-baseline]
+
+Results are compared with the stored baseline; the exit code is 1 when a
+metric regressed by more than the tolerance (and by more than the metric's
+noise floor), so the script can gate merges.
+"""
+import ast
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).parent
+PAGES_DIR = PROJECT_ROOT / "dashboard" / "pages"
+STANDALONE_APP = PROJECT_ROOT / "streamlit_app.py"
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULTS = {
+    'repeat': 3,
+    'warm_runs': 5,
+    'tolerance': 0.25,
+    'timeout': 300.0,
+    'output': "benchmark_results.json",
+    'baseline': "benchmark_baseline.json"
+}
+
+# Metrics compared against the baseline, with the smallest change worth reporting
+METRIC_NOISE_FLOORS = {
+    'import_ms': 150.0,
+    'cold_render_ms': 100.0,
+    'warm_render_ms': 25.0,
+    'peak_rss_mb': 20.0
+}
+
+STANDALONE_VIEWS = [
+    "📊 Executive Summary",
+    "☁️ Word Cloud Analysis",
+    "😊 Sentiment Analysis",
+    "📋 Topic Modeling (LDA)",
+    "🔗 Integrated Analysis",
+    "💡 Managerial Implications"
+]
+
+
+def arg_value(name: str, default=None):
+    """Value of a --name=value command-line flag"""
+    for arg in sys.argv[1:]:
+        if arg.startswith(f"--{name}="):
+            value = arg.split("=", 1)[1]
+            return type(default)(value) if default is not None else value
+    return default
+
+
+def format_metric(value, unit: str, width: int) -> str:
+    """Right-aligned table cell, '-' for a metric that was not measured"""
+    return f"{value:{width}.0f}{unit}" if value is not None else f"{'-':>{width + len(unit)}s}"
+
+
+def benchmark_targets() -> List[Dict]:
+    """Every page and standalone view: name, script and (for views) the sidebar choice"""
+    targets = [
+        {
+            'name': path.stem.split('_', 2)[-1].replace('_', ' '),
+            'script': path.relative_to(PROJECT_ROOT).as_posix(),
+            'view': None
+        }
+        for path in sorted(PAGES_DIR.glob("[2-8]_*.py"))
+    ]
+    targets += [
+        {'name': f"streamlit_app: {view.split(' ', 1)[1]}", 'script': STANDALONE_APP.name, 'view': view}
+        for view in STANDALONE_VIEWS
+    ]
+    return targets
+
+
+# ============================================================================
+# WORKER (one fresh process per target)
+# ============================================================================
+
+def import_statements(script: Path) -> str:
+    """Top-level imports of a script, with the sys.path setup they depend on"""
+    tree = ast.parse(script.read_text(encoding='utf-8'))
+    nodes = [
+        node for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+        or (isinstance(node, ast.Expr) and "sys.path" in ast.unparse(node))
+    ]
+    return "\n".join(ast.unparse(node) for node in nodes)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KB on Linux
+
+
+def run_worker(target: Dict, warm_runs: int) -> Dict:
+    """Measure one target in the current (fresh) process"""
+    from streamlit.testing.v1 import AppTest
+
+    script = PROJECT_ROOT / target['script']
+
+    start = time.perf_counter()
+    exec(compile(import_statements(script), str(script), 'exec'), {'__file__': str(script), '__name__': '__bench__'})
+    import_ms = (time.perf_counter() - start) * 1000
+
+    at = AppTest.from_file(str(script), default_timeout=DEFAULTS['timeout'])
+
+    def render() -> float:
+        start = time.perf_counter()
+        if target['view'] is None:
+            at.run()
+        else:
+            at.sidebar.radio[0].set_value(target['view']).run()
+        return (time.perf_counter() - start) * 1000
+
+    if target['view'] is not None:
+        at.run()  # default view, needed to reach the sidebar
+    cold_render_ms = render()
+    warm = [render() for _ in range(warm_runs)]
+
+    return {
+        'import_ms': import_ms,
+        'cold_render_ms': cold_render_ms,
+        'warm_render_ms': statistics.median(warm) if warm else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'exceptions': [str(exc.value)[:200] for exc in at.exception]
+    }
+
+
+def summarize_runs(runs: List[Dict]) -> Dict:
+    """Median of each metric over the runs that recorded it (None when none did, e.g. --warm-runs=0)"""
+    result = {}
+    for metric in METRIC_NOISE_FLOORS:
+        samples = [run[metric] for run in runs if run.get(metric) is not None]
+        result[metric] = statistics.median(samples) if samples else None
+    result['exceptions'] = runs[-1]['exceptions']
+    return result
+
+
+def measure(target: Dict, repeat: int, warm_runs: int) -> Dict:
+    """Median of `repeat` fresh-process measurements of a target"""
+    runs = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, __file__, "--worker", json.dumps(target), f"--warm-runs={warm_runs}"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=DEFAULTS['timeout']
+        )
+        lines = completed.stdout.strip().splitlines()
+        if completed.returncode != 0 or not lines:
+            error = (completed.stderr.strip().splitlines() or ["no output"])[-1]
+            return {'error': error}
+        runs.append(json.loads(lines[-1]))
+
+    return summarize_runs(runs)
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[Dict]:
+    """
+    Metrics that got worse than the baseline
+
+    A metric regresses when it exceeds baseline * (1 + tolerance) and the
+    absolute change is above its noise floor (METRIC_NOISE_FLOORS).
+
+    Returns:
+        One dict per regression: target, metric, baseline, current, change
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or 'error' in current or 'error' in previous:
+            continue
+        for metric, floor in METRIC_NOISE_FLOORS.items():
+            before, after = previous.get(metric), current.get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before > floor:
+                regressions.append({
+                    'target': name,
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'change': after / before - 1 if before else float('inf')
+                })
+    return regressions
+
+
+def environment() -> Dict:
+    """Where the numbers came from"""
+    import streamlit
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count()
+    }
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main() -> int:
+    repeat = arg_value('repeat', DEFAULTS['repeat'])
+    warm_runs = arg_value('warm-runs', DEFAULTS['warm_runs'])
+    tolerance = arg_value('tolerance', DEFAULTS['tolerance'])
+    output = PROJECT_ROOT / arg_value('output', DEFAULTS['output'])
+    baseline_path = PROJECT_ROOT / arg_value('baseline', DEFAULTS['baseline'])
+    only = arg_value('only')
+
+    targets = benchmark_targets()
+    if only:
+        wanted = [name.strip() for name in only.split(',')]
+        targets = [target for target in targets if any(name in target['name'] for name in wanted)]
+
+    print("=" * 70)
+    print("DASHBOARD PAGE BENCHMARK")
+    print("=" * 70)
+    print(f"\n{len(targets)} targets, {repeat} fresh process(es) each, {warm_runs} warm renders per process\n")
+    print(f"{'Target':42s} {'import':>8s} {'cold':>8s} {'warm':>8s} {'peak RSS':>9s}")
+
+    results = {}
+    for target in targets:
+        result = measure(target, repeat, warm_runs)
+        results[target['name']] = result
+        if 'error' in result:
+            print(f"{target['name']:42s} ❌ {result['error']}")
+            continue
+        flag = " ⚠️  page raised an exception" if result['exceptions'] else ""
+        print(f"{target['name']:42s} {format_metric(result['import_ms'], 'ms', 6)} "
+              f"{format_metric(result['cold_render_ms'], 'ms', 6)} {format_metric(result['warm_render_ms'], 'ms', 6)} "
+              f"{format_metric(result['peak_rss_mb'], 'MB', 7)}{flag}")
+
+    report = {'environment': environment(), 'settings': {'repeat': repeat, 'warm_runs': warm_runs}, 'results': results}
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"\n💾 Results written to {output.name}")
+
+    failed = [name for name, result in results.items() if 'error' in result or result['exceptions']]
+
+    if "--update-baseline" in sys.argv[1:]:
+        baseline_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"✅ Baseline updated: {baseline_path.name}")
+        return 1 if failed else 0
+
+    if not baseline_path.exists():
+        print(f"⚠️  No baseline at {baseline_path.name}; run with --update-baseline to create one")
+        return 1 if failed else 0
+
+    baseline = json.loads(baseline_path.read_text())
+    regressions = compare_to_baseline(results, baseline['results'], tolerance)
+    print(f"\n📊 Compared with baseline from {baseline['environment']['timestamp']} "
+          f"(commit {baseline['environment']['commit']}, tolerance {tolerance:.0%})")
+    for regression in regressions:
+        print(f"❌ {regression['target']}: {regression['metric']} "
+              f"{regression['baseline']:.0f} -> {regression['current']:.0f} ({regression['change']:+.0%})")
+    for name in failed:
+        print(f"❌ {name}: failed to render")
+    if not regressions and not failed:
+        print("✅ No regressions")
+
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv[1:]:
+        target = json.loads(sys.argv[sys.argv.index("--worker") + 1])
+        print(json.dumps(run_worker(target, arg_value('warm-runs', DEFAULTS['warm_runs']))))
+    else:
+        sys.exit(main())
@@ -17,6 +17,7 @@ from dimensions import (
     ANALYTICAL_FRAMEWORK,
     COLORS
 )
+from cache_warmer import get_cache_warmer
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -29,6 +30,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Load all five dimensions and render their default analytics in the background,
+# so the first visitor to each page gets warm-cache latency (started once per server)
+cache_warmer = get_cache_warmer().start()
+
 # Custom CSS - Modern Professional Design
 st.markdown(f"""
 <style>
@@ -361,6 +366,28 @@ with st.sidebar:
     )
     st.caption(f"{readiness['status']}")
 
+    st.markdown("---")
+
+    # Warm-up progress (polls only while the warmer is still running)
+    polling = not cache_warmer.done
+
+    @st.fragment(run_every=1.0 if polling else None)
+    def show_cache_warmup():
+        progress = cache_warmer.progress()
+        if not progress['done']:
+            st.progress(
+                progress['fraction'],
+                text=f"⏳ Preparing analytics {progress['completed']}/{progress['total']}: {progress['current'] or '...'}"
+            )
+        elif polling:
+            st.rerun()  # one full rerun to stop polling
+        else:
+            st.caption(f"⚡ Analytics cached ({progress['elapsed']:.1f}s warm-up)")
+            for label, error in progress['errors']:
+                st.caption(f"⚠️ {label}: {error}")
+
+    show_cache_warmup()
+
     st.markdown("---")
     st.caption("Data updated: 2024-2025")
     st.caption("Sources: 254 verified URLs")
@@ -13,7 +13,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "analysis" / "commo
 
 from dimensions import get_dimension_by_id, COLORS
 from data_loader import load_dimension
-from text_analytics import WordCloudGenerator, SentimentAnalyzer, TopicModeler
+from sentiment_stats import get_sentiment_intervals, format_interval
+from artifact_manifest import get_manifest
+from perf_hud import page_timer, show_perf_hud
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -25,6 +27,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Opt-in section timings (?perf=1 or XR_DASHBOARD_PERF=1)
+perf = page_timer("Maturity")
+
 # Load dimension configuration
 dimension = get_dimension_by_id('maturity')
 if not dimension:
@@ -32,6 +37,7 @@ if not dimension:
     st.stop()
 
 # Load data
+perf.checkpoint("data load")
 try:
     data = load_dimension('maturity')
     corpus = data['corpus']
@@ -44,6 +50,7 @@ except Exception as e:
 # ============================================================================
 # DIMENSION HEADER
 # ============================================================================
+perf.checkpoint("header")
 
 st.markdown(f"# {dimension.icon} {dimension.name}")
 
@@ -119,10 +126,8 @@ st.markdown(f"""
 
 st.markdown("## 📊 Text Analytics")
 
-# Load pre-computed analytics from data files
-analytics_path = dimension.get_data_paths()[0].parent  # xr_present_state_maturity_outputs directory
-sentiment_file = analytics_path / "xr_sentences_sentiment.csv"
-topics_file = analytics_path / "xr_topics.csv"
+# Pre-computed analytics, resolved through the dimension's artifact manifest
+manifest = get_manifest('maturity')
 
 # Only run analytics if we have text data
 if text and len(text.strip()) > 100:
@@ -130,58 +135,50 @@ if text and len(text.strip()) > 100:
     # ========================================================================
     # WORD CLOUD
     # ========================================================================
+    perf.checkpoint("word cloud")
 
     st.markdown("### 📊 Word Cloud Analysis")
     st.markdown("*Identifies dominant themes and key concepts in the corpus*")
 
     try:
-        wc_gen = WordCloudGenerator(width=1200, height=600)
-        wordcloud = wc_gen.generate(
-            text,
-            max_words=100,
-            colormap='viridis',
-            background_color='white'
-        )
-
-        # Display word cloud
-        import matplotlib.pyplot as plt
-        fig, ax = plt.subplots(figsize=(15, 7))
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-        ax.set_title('Dominant Themes in XR Maturity', fontsize=16, fontweight='bold', pad=20)
-        st.pyplot(fig)
-
-        # Top words
-        col1, col2 = st.columns([2, 1])
-
-        with col1:
-            top_words = wc_gen.get_top_words(text, n=20)
-            top_df = pd.DataFrame(top_words, columns=['Word', 'Frequency'])
-            st.dataframe(top_df, use_container_width=True, hide_index=True)
-
-        with col2:
-            st.markdown("**Key Insights:**")
-            if top_words:
-                top_5 = [word for word, _ in top_words[:5]]
-                st.markdown(f"- Most frequent: **{top_5[0]}**")
-                st.markdown(f"- Core themes: {', '.join(top_5[1:4])}")
-                st.markdown("- Indicates focus areas and industry priorities")
+        if manifest.has('wordcloud_image'):
+            st.markdown(manifest.image_html('wordcloud_image', alt="Dominant Themes in XR Maturity"), unsafe_allow_html=True)
+            st.caption("Dominant Themes in XR Maturity")
+
+            # Top words
+            col1, col2 = st.columns([2, 1])
+            top_df = manifest.load('top_words')
+
+            with col1:
+                if top_df is not None:
+                    st.dataframe(top_df.head(20), use_container_width=True, hide_index=True)
+
+            with col2:
+                st.markdown("**Key Insights:**")
+                if top_df is not None and len(top_df) > 0:
+                    top_5 = top_df['Word'].head(5).tolist()
+                    st.markdown(f"- Most frequent: **{top_5[0]}**")
+                    st.markdown(f"- Core themes: {', '.join(top_5[1:4])}")
+                    st.markdown("- Indicates focus areas and industry priorities")
+        else:
+            st.info("Pre-computed word cloud not available. Run analysis/common/artifact_manifest.py to create it.")
 
     except Exception as e:
-        st.warning(f"Word cloud generation failed: {e}")
+        st.warning(f"Word cloud display failed: {e}")
 
     # ========================================================================
     # SENTIMENT ANALYSIS
     # ========================================================================
+    perf.checkpoint("sentiment")
 
     st.markdown("---")
     st.markdown("### 😊 Sentiment Analysis")
     st.markdown("*Assesses industry optimism and outlook*")
 
     try:
-        if sentiment_file.exists():
+        if manifest.has('sentiment'):
             # Load pre-computed sentiment results
-            sentiment_df = pd.read_csv(sentiment_file)
+            sentiment_df = manifest.load('sentiment')
 
             # Calculate summary statistics
             avg_compound = sentiment_df['compound'].mean()
@@ -192,6 +189,11 @@ if text and len(text.strip()) > 100:
             neu_pct = (sentiment_counts.get('neutral', 0) / total) * 100
             neg_pct = (sentiment_counts.get('negative', 0) / total) * 100
 
+            # Bootstrap confidence intervals (cached per file version)
+            intervals = get_sentiment_intervals(
+                sentiment_df, 'compound', 'label', version=manifest.version('sentiment')
+            )
+
             # Display metrics
             col1, col2, col3, col4 = st.columns(4)
 
@@ -201,6 +203,7 @@ if text and len(text.strip()) > 100:
                     f"{avg_compound:.3f}",
                     help="Range: -1 (negative) to +1 (positive)"
                 )
+                st.caption(format_interval(intervals['mean']))
 
             with col2:
                 st.metric(
@@ -210,6 +213,7 @@ if text and len(text.strip()) > 100:
                     delta_color="off",
                     help="Percentage of positive sentiment"
                 )
+                st.caption(format_interval(intervals['shares']['positive'], scale=100, fmt="{:.1f}%"))
 
             with col3:
                 st.metric(
@@ -219,6 +223,7 @@ if text and len(text.strip()) > 100:
                     delta_color="off",
                     help="Percentage of neutral sentiment"
                 )
+                st.caption(format_interval(intervals['shares']['neutral'], scale=100, fmt="{:.1f}%"))
 
             with col4:
                 st.metric(
@@ -228,6 +233,7 @@ if text and len(text.strip()) > 100:
                     delta_color="off",
                     help="Percentage of negative sentiment"
                 )
+                st.caption(format_interval(intervals['shares']['negative'], scale=100, fmt="{:.1f}%"))
 
             # Show detailed sentiment breakdown
             with st.expander("📊 View Detailed Sentiment Breakdown"):
@@ -265,15 +271,16 @@ if text and len(text.strip()) > 100:
     # ========================================================================
     # TOPIC MODELING
     # ========================================================================
+    perf.checkpoint("topics")
 
     st.markdown("---")
     st.markdown("### 🎯 Topic Modeling (LDA)")
     st.markdown("*Discovers latent themes and patterns*")
 
     try:
-        if topics_file.exists():
+        if manifest.has('topics'):
             # Load pre-computed topics
-            topics_df = pd.read_csv(topics_file)
+            topics_df = manifest.load('topics')
 
             st.markdown("**Key Maturity Themes Identified:**")
             st.markdown("")
@@ -307,6 +314,7 @@ else:
 # ============================================================================
 # DATA SOURCES
 # ============================================================================
+perf.checkpoint("sources")
 
 st.markdown("---")
 st.markdown("## 📚 Data Sources")
@@ -338,6 +346,7 @@ else:
 # ============================================================================
 # MANAGERIAL IMPLICATIONS
 # ============================================================================
+perf.checkpoint("implications")
 
 st.markdown("---")
 st.markdown("## 💼 Managerial Implications")
@@ -406,3 +415,5 @@ st.markdown("""
     <p>Part of the Five-Dimension XR Technology Readiness Framework</p>
 </div>
 """, unsafe_allow_html=True)
+
+show_perf_hud(perf)
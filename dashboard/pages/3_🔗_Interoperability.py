@@ -13,7 +13,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "analysis" / "commo
 
 from dimensions import get_dimension_by_id, COLORS
 from data_loader import load_dimension
-from text_analytics import WordCloudGenerator, SentimentAnalyzer, TopicModeler
+from sentiment_stats import get_sentiment_intervals, format_interval
+from artifact_manifest import get_manifest
+from perf_hud import page_timer, show_perf_hud
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -25,6 +27,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Opt-in section timings (?perf=1 or XR_DASHBOARD_PERF=1)
+perf = page_timer("Interoperability")
+
 # Load dimension configuration
 dimension = get_dimension_by_id('interoperability')
 if not dimension:
@@ -32,6 +37,7 @@ if not dimension:
     st.stop()
 
 # Load data
+perf.checkpoint("data load")
 try:
     data = load_dimension('interoperability')
     corpus = data['corpus']
@@ -44,6 +50,7 @@ except Exception as e:
 # ============================================================================
 # DIMENSION HEADER
 # ============================================================================
+perf.checkpoint("header")
 
 st.markdown(f"# {dimension.icon} {dimension.name}")
 
@@ -101,72 +108,51 @@ st.markdown(f"""
 
 st.markdown("## 📊 Text Analytics")
 
-# Load pre-computed analytics from data files
-analytics_path = dimension.get_data_paths()[0].parent  # xr_interop_submission directory
-sentiment_file = analytics_path / "xr_interop_sentiment.csv"
-topics_file = analytics_path / "xr_interop_topics.csv"
-top_words_file = analytics_path / "xr_interop_top_words.csv"
-wordcloud_img = analytics_path / "xr_interop_wordcloud.png"
-sentiment_img = analytics_path / "xr_interop_sentiment_distribution.png"
+# Pre-computed analytics, resolved through the dimension's artifact manifest
+manifest = get_manifest('interoperability')
 
 # Word Cloud
+perf.checkpoint("word cloud")
 st.markdown("### ☁️ Word Cloud Analysis")
 try:
-    if wordcloud_img.exists():
+    if manifest.has('wordcloud_image'):
         # Display pre-computed word cloud image
-        from PIL import Image
-        img = Image.open(wordcloud_img)
-        st.image(img, use_container_width=True, caption="Key Concepts in XR Interoperability")
+        st.markdown(manifest.image_html('wordcloud_image', alt="Key Concepts in XR Interoperability"), unsafe_allow_html=True)
+        st.caption("Key Concepts in XR Interoperability")
     else:
-        # Fallback to generating word cloud
-        wc_gen = WordCloudGenerator(width=1200, height=600)
-        wordcloud = wc_gen.generate(text, max_words=100, colormap='plasma')
-
-        import matplotlib.pyplot as plt
-        fig, ax = plt.subplots(figsize=(15, 7))
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-        ax.set_title('Key Concepts in XR Interoperability', fontsize=16, fontweight='bold', pad=20)
-        st.pyplot(fig)
+        st.info("Pre-computed word cloud not available. Run generate_interop_analysis.py to create it.")
 
     # Display top words table
+    top_words_df = manifest.load('top_words')
     col1, col2 = st.columns([2, 1])
     with col1:
-        if top_words_file.exists():
-            top_words_df = pd.read_csv(top_words_file)
+        if top_words_df is not None:
             st.dataframe(
                 top_words_df.head(20),
                 use_container_width=True,
                 hide_index=True,
                 column_config={
-                    "word": "Word",
-                    "frequency": st.column_config.NumberColumn("Frequency", format="%d")
+                    "Frequency": st.column_config.NumberColumn("Frequency", format="%d")
                 }
             )
-        else:
-            wc_gen = WordCloudGenerator()
-            top_words = wc_gen.get_top_words(text, n=20)
-            top_df = pd.DataFrame(top_words, columns=['Word', 'Frequency'])
-            st.dataframe(top_df, use_container_width=True, hide_index=True)
 
     with col2:
         st.markdown("**Integration Focus:**")
-        if top_words_file.exists():
-            top_words_df = pd.read_csv(top_words_file)
-            if len(top_words_df) > 0:
-                st.markdown(f"- Top theme: **{top_words_df.iloc[0]['word']}**")
+        if top_words_df is not None and len(top_words_df) > 0:
+            st.markdown(f"- Top theme: **{top_words_df.iloc[0]['Word']}**")
         st.markdown("- Shows compatibility priorities")
         st.markdown("- Highlights ecosystem gaps")
 except Exception as e:
     st.warning(f"Word cloud visualization failed: {e}")
 
 # Sentiment Analysis
+perf.checkpoint("sentiment")
 st.markdown("---")
 st.markdown("### 😊 Sentiment Analysis")
 try:
-    if sentiment_file.exists():
+    if manifest.has('sentiment'):
         # Load pre-computed sentiment results
-        sentiment_df = pd.read_csv(sentiment_file)
+        sentiment_df = manifest.load('sentiment')
 
         # Calculate summary statistics
         avg_compound = sentiment_df['compound'].mean()
@@ -177,28 +163,36 @@ try:
         neu_pct = (sentiment_counts.get('neutral', 0) / total) * 100
         neg_pct = (sentiment_counts.get('negative', 0) / total) * 100
 
+        # Bootstrap confidence intervals (cached per file version)
+        intervals = get_sentiment_intervals(
+            sentiment_df, 'compound', 'label', version=manifest.version('sentiment')
+        )
+
         # Display metrics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
             st.metric("Avg Sentiment", f"{avg_compound:.3f}")
+            st.caption(format_interval(intervals['mean']))
         with col2:
             st.metric("Positive", f"{pos_pct:.1f}%",
                      delta=f"{sentiment_counts.get('positive', 0)} sources",
                      delta_color="off")
+            st.caption(format_interval(intervals['shares']['positive'], scale=100, fmt="{:.1f}%"))
         with col3:
             st.metric("Neutral", f"{neu_pct:.1f}%",
                      delta=f"{sentiment_counts.get('neutral', 0)} sources",
                      delta_color="off")
+            st.caption(format_interval(intervals['shares']['neutral'], scale=100, fmt="{:.1f}%"))
         with col4:
             st.metric("Negative", f"{neg_pct:.1f}%",
                      delta=f"{sentiment_counts.get('negative', 0)} sources",
                      delta_color="off")
+            st.caption(format_interval(intervals['shares']['negative'], scale=100, fmt="{:.1f}%"))
 
         # Display sentiment distribution chart
-        if sentiment_img.exists():
-            from PIL import Image
-            img = Image.open(sentiment_img)
-            st.image(img, use_container_width=True, caption="Sentiment Distribution Across Sources")
+        if manifest.has('sentiment_image'):
+            st.markdown(manifest.image_html('sentiment_image', alt="Sentiment Distribution Across Sources"), unsafe_allow_html=True)
+            st.caption("Sentiment Distribution Across Sources")
 
         # Show detailed sentiment breakdown
         with st.expander("📊 View Detailed Sentiment Breakdown"):
@@ -222,12 +216,13 @@ except Exception as e:
     st.warning(f"Sentiment analysis display failed: {e}")
 
 # Topic Modeling
+perf.checkpoint("topics")
 st.markdown("---")
 st.markdown("### 🎯 Topic Modeling (LDA)")
 try:
-    if topics_file.exists():
+    if manifest.has('topics'):
         # Load pre-computed topics
-        topics_df = pd.read_csv(topics_file)
+        topics_df = manifest.load('topics')
 
         st.markdown("**Key Integration Themes Identified:**")
         st.markdown("")
@@ -257,6 +252,7 @@ except Exception as e:
 # ============================================================================
 # DATA SOURCES
 # ============================================================================
+perf.checkpoint("sources")
 
 st.markdown("---")
 st.markdown("## 📚 Verified Data Sources")
@@ -271,6 +267,7 @@ if sources and len(sources) > 0:
 # ============================================================================
 # MANAGERIAL IMPLICATIONS
 # ============================================================================
+perf.checkpoint("implications")
 
 st.markdown("---")
 st.markdown("## 💼 Managerial Implications")
@@ -298,3 +295,5 @@ st.markdown("""
     <p>Part of the Five-Dimension XR Technology Readiness Framework</p>
 </div>
 """, unsafe_allow_html=True)
+
+show_perf_hud(perf)
@@ -13,7 +13,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "analysis" / "commo
 
 from dimensions import get_dimension_by_id, COLORS
 from data_loader import load_dimension
-from text_analytics import WordCloudGenerator, SentimentAnalyzer, TopicModeler
+from sentiment_stats import get_sentiment_intervals, format_interval
+from artifact_manifest import get_manifest
+from perf_hud import page_timer, show_perf_hud
+from topic_sentiment import show_topic_sentiment
+from source_index import get_source_index, show_source_browser
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -25,6 +29,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Opt-in section timings (?perf=1 or XR_DASHBOARD_PERF=1)
+perf = page_timer("Scalability")
+
 # Load dimension configuration
 dimension = get_dimension_by_id('scalability')
 if not dimension:
@@ -32,6 +39,7 @@ if not dimension:
     st.stop()
 
 # Load data
+perf.checkpoint("data load")
 try:
     data = load_dimension('scalability')
     corpus = data['corpus']
@@ -44,6 +52,7 @@ except Exception as e:
 # ============================================================================
 # DIMENSION HEADER
 # ============================================================================
+perf.checkpoint("header")
 
 st.markdown(f"# {dimension.icon} {dimension.name}")
 
@@ -98,6 +107,7 @@ st.markdown(f"""
 # ============================================================================
 # INFRASTRUCTURE BREAKDOWN
 # ============================================================================
+perf.checkpoint("infrastructure breakdown")
 
 st.markdown("## 🏗️ Infrastructure Stack Analysis")
 
@@ -148,48 +158,44 @@ st.dataframe(stack_df, use_container_width=True, hide_index=True)
 st.markdown("---")
 st.markdown("## 📊 Text Analytics")
 
-# Load pre-computed analytics from data files
-analytics_path = dimension.get_data_paths()[0].parent  # XR scalability directory
-sentiment_file = analytics_path / "XR_Sentiment_Analysis_Results.csv"
-topics_file = analytics_path / "XR_LDA_Topic_Distribution.csv"
+# Pre-computed analytics, resolved through the dimension's artifact manifest
+manifest = get_manifest('scalability')
 
 if text and len(text.strip()) > 100:
 
     # Word Cloud
+    perf.checkpoint("word cloud")
     st.markdown("### 📊 Word Cloud Analysis")
     try:
-        wc_gen = WordCloudGenerator(width=1200, height=600)
-        wordcloud = wc_gen.generate(text, max_words=100, colormap='inferno')
-
-        import matplotlib.pyplot as plt
-        fig, ax = plt.subplots(figsize=(15, 7))
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-        ax.set_title('Infrastructure Themes in XR Scalability', fontsize=16, fontweight='bold', pad=20)
-        st.pyplot(fig)
-
-        col1, col2 = st.columns([2, 1])
-        with col1:
-            top_words = wc_gen.get_top_words(text, n=20)
-            top_df = pd.DataFrame(top_words, columns=['Word', 'Frequency'])
-            st.dataframe(top_df, use_container_width=True, hide_index=True)
-
-        with col2:
-            st.markdown("**Infrastructure Focus:**")
-            if top_words:
-                st.markdown(f"- Core technology: **{top_words[0][0]}**")
-                st.markdown("- Reveals bottlenecks")
-                st.markdown("- Shows vendor priorities")
+        if manifest.has('wordcloud_image'):
+            st.markdown(manifest.image_html('wordcloud_image', alt="Infrastructure Themes in XR Scalability"), unsafe_allow_html=True)
+            st.caption("Infrastructure Themes in XR Scalability")
+
+            col1, col2 = st.columns([2, 1])
+            top_df = manifest.load('top_words')
+            with col1:
+                if top_df is not None:
+                    st.dataframe(top_df.head(20), use_container_width=True, hide_index=True)
+
+            with col2:
+                st.markdown("**Infrastructure Focus:**")
+                if top_df is not None and len(top_df) > 0:
+                    st.markdown(f"- Core technology: **{top_df.iloc[0]['Word']}**")
+                    st.markdown("- Reveals bottlenecks")
+                    st.markdown("- Shows vendor priorities")
+        else:
+            st.info("Pre-computed word cloud not available. Run analysis/common/artifact_manifest.py to create it.")
     except Exception as e:
-        st.warning(f"Word cloud generation failed: {e}")
+        st.warning(f"Word cloud display failed: {e}")
 
     # Sentiment Analysis
+    perf.checkpoint("sentiment")
     st.markdown("---")
     st.markdown("### 😊 Sentiment Analysis")
     try:
-        if sentiment_file.exists():
+        if manifest.has('sentiment'):
             # Load pre-computed sentiment results
-            sentiment_df = pd.read_csv(sentiment_file)
+            sentiment_df = manifest.load('sentiment')
 
             # Calculate summary statistics from global_sentiment_score
             avg_sentiment = sentiment_df['global_sentiment_score'].mean()
@@ -200,22 +206,31 @@ if text and len(text.strip()) > 100:
             neu_pct = (sentiment_counts.get('Neutral', 0) / total) * 100
             neg_pct = (sentiment_counts.get('Negative', 0) / total) * 100
 
+            # Bootstrap confidence intervals (cached per file version)
+            intervals = get_sentiment_intervals(
+                sentiment_df, 'global_sentiment_score', 'global_sentiment_class', version=manifest.version('sentiment')
+            )
+
             # Display metrics
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 st.metric("Avg Sentiment", f"{avg_sentiment:.3f}")
+                st.caption(format_interval(intervals['mean']))
             with col2:
                 st.metric("Positive", f"{pos_pct:.1f}%",
                          delta=f"{sentiment_counts.get('Positive', 0)} records",
                          delta_color="off")
+                st.caption(format_interval(intervals['shares']['positive'], scale=100, fmt="{:.1f}%"))
             with col3:
                 st.metric("Neutral", f"{neu_pct:.1f}%",
                          delta=f"{sentiment_counts.get('Neutral', 0)} records",
                          delta_color="off")
+                st.caption(format_interval(intervals['shares']['neutral'], scale=100, fmt="{:.1f}%"))
             with col4:
                 st.metric("Negative", f"{neg_pct:.1f}%",
                          delta=f"{sentiment_counts.get('Negative', 0)} records",
                          delta_color="off")
+                st.caption(format_interval(intervals['shares']['negative'], scale=100, fmt="{:.1f}%"))
 
             # Show detailed sentiment breakdown
             with st.expander("📊 View Detailed Sentiment by Infrastructure Layer"):
@@ -239,15 +254,13 @@ if text and len(text.strip()) > 100:
         st.warning(f"Sentiment analysis display failed: {e}")
 
     # Topic Modeling
+    perf.checkpoint("topics")
     st.markdown("---")
     st.markdown("### 🎯 Topic Modeling (LDA)")
     try:
-        # Load topic keywords from CSV
-        topics_keywords_file = analytics_path / "XR_Scalability_Topics.csv"
-
-        if topics_keywords_file.exists():
+        if manifest.has('topics'):
             # Load pre-computed topics with keywords
-            topics_df = pd.read_csv(topics_keywords_file)
+            topics_df = manifest.load('topics')
 
             st.markdown("**Infrastructure Layer Topics:**")
             st.markdown("")
@@ -272,9 +285,9 @@ if text and len(text.strip()) > 100:
                 """, unsafe_allow_html=True)
 
             # Optionally show topic distribution details
-            if topics_file.exists():
+            if manifest.has('topic_distribution'):
                 with st.expander("📊 View Topic Distribution Across Documents"):
-                    lda_df = pd.read_csv(topics_file)
+                    lda_df = manifest.load('topic_distribution')
                     topic_cols = [col for col in lda_df.columns if col.startswith('Topic_')]
                     if topic_cols:
                         # Calculate average distribution
@@ -294,35 +307,29 @@ if text and len(text.strip()) > 100:
     except Exception as e:
         st.warning(f"Topic modeling display failed: {e}")
 
+    # Sentiment by Topic (doc-topic weights x document sentiment)
+    perf.checkpoint("topic sentiment")
+    show_topic_sentiment('scalability', "How the tone of the corpus differs between the LDA topics (Topic_1..Topic_3 as in the topic distribution):")
+
 else:
     st.info("Limited text data available for analytics")
 
 # ============================================================================
 # DATA SOURCES
 # ============================================================================
+perf.checkpoint("sources")
 
 st.markdown("---")
 st.markdown("## 📚 Verified Data Sources")
 
 st.markdown(f"**{len(sources)} verified URLs** from infrastructure vendors:")
 
-source_categories = {
-    "Network Operators": ["nokia", "verizon", "ericsson", "qualcomm"],
-    "Cloud Platforms": ["aws", "azure", "microsoft", "google"],
-    "Edge Providers": ["cloudflare", "akamai", "vmware"],
-    "Infrastructure Tools": ["kubernetes", "nvidia", "mongodb", "okta", "jamf"]
-}
-
-for category, keywords in source_categories.items():
-    category_sources = [s for s in sources if any(kw in s.lower() for kw in keywords)]
-    if category_sources:
-        with st.expander(f"📁 {category} ({len(category_sources)} sources)"):
-            for i, url in enumerate(category_sources, 1):
-                st.markdown(f"{i}. [{url}]({url})")
+show_source_browser(get_source_index('scalability'), key="scalability_sources")
 
 # ============================================================================
 # MANAGERIAL IMPLICATIONS
 # ============================================================================
+perf.checkpoint("implications")
 
 st.markdown("---")
 st.markdown("## 💼 Managerial Implications")
@@ -359,3 +366,5 @@ st.markdown("""
     <p>Part of the Five-Dimension XR Technology Readiness Framework</p>
 </div>
 """, unsafe_allow_html=True)
+
+show_perf_hud(perf)
@@ -13,7 +13,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "analysis" / "commo
 
 from dimensions import get_dimension_by_id, COLORS
 from data_loader import load_dimension
-from text_analytics import WordCloudGenerator, SentimentAnalyzer, TopicModeler
+from sentiment_stats import get_sentiment_intervals, format_interval
+from artifact_manifest import get_manifest
+from perf_hud import page_timer, show_perf_hud
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -25,6 +27,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Opt-in section timings (?perf=1 or XR_DASHBOARD_PERF=1)
+perf = page_timer("AI Alignment")
+
 # Load dimension configuration
 dimension = get_dimension_by_id('ai_alignment')
 if not dimension:
@@ -32,6 +37,7 @@ if not dimension:
     st.stop()
 
 # Load data
+perf.checkpoint("data load")
 try:
     data = load_dimension('ai_alignment')
     corpus = data['corpus']
@@ -44,6 +50,7 @@ except Exception as e:
 # ============================================================================
 # DIMENSION HEADER
 # ============================================================================
+perf.checkpoint("header")
 
 st.markdown(f"# {dimension.icon} {dimension.name}")
 
@@ -98,6 +105,7 @@ st.markdown(f"""
 # ============================================================================
 # AI-XR SYNERGY MATRIX
 # ============================================================================
+perf.checkpoint("synergy matrix")
 
 st.markdown("## 🔗 AI-XR Synergy Matrix")
 
@@ -148,30 +156,24 @@ st.dataframe(synergy_df, use_container_width=True, hide_index=True)
 st.markdown("---")
 st.markdown("## 📊 Text Analytics")
 
-# Load pre-computed analytics from CSV files
-analytics_path = dimension.get_data_paths()[0].parent if dimension.get_data_paths() else None
-sentiment_file = analytics_path / "xr_ai_alignment_sentiment.csv" if analytics_path else None
-topics_file = analytics_path / "xr_ai_alignment_topics.csv" if analytics_path else None
-wordcloud_img = analytics_path / "xr_ai_alignment_wordcloud.png" if analytics_path else None
-sentiment_img = analytics_path / "xr_ai_alignment_sentiment_distribution.png" if analytics_path else None
-top_words_file = analytics_path / "xr_ai_alignment_top_words.csv" if analytics_path else None
+# Pre-computed analytics, resolved through the dimension's artifact manifest
+manifest = get_manifest('ai_alignment')
 
 # Word Cloud
+perf.checkpoint("word cloud")
 st.markdown("### 📊 Word Cloud Analysis")
-if wordcloud_img and wordcloud_img.exists():
-    from PIL import Image
-    st.image(str(wordcloud_img), use_container_width=True)
+if manifest.has('wordcloud_image'):
+    st.markdown(manifest.image_html('wordcloud_image', alt="AI-XR Integration Themes"), unsafe_allow_html=True)
 
     col1, col2 = st.columns([2, 1])
+    top_words_df = manifest.load('top_words')
     with col1:
-        if top_words_file and top_words_file.exists():
-            top_words_df = pd.read_csv(top_words_file)
-            top_words_df.columns = ['Word', 'Frequency']
+        if top_words_df is not None:
             st.dataframe(top_words_df.head(20), use_container_width=True, hide_index=True)
 
     with col2:
         st.markdown("**AI Integration Points:**")
-        if top_words_file and top_words_file.exists():
+        if top_words_df is not None and len(top_words_df) > 0:
             top_word = top_words_df.iloc[0]['Word']
             st.markdown(f"- Primary focus: **{top_word}**")
             st.markdown("- Shows AI-XR convergence")
@@ -180,33 +182,42 @@ else:
     st.info("Word cloud visualization not available")
 
 # Sentiment Analysis
+perf.checkpoint("sentiment")
 st.markdown("---")
 st.markdown("### 😊 Sentiment Analysis")
-if sentiment_file and sentiment_file.exists():
-    sentiment_df = pd.read_csv(sentiment_file)
+if manifest.has('sentiment'):
+    sentiment_df = manifest.load('sentiment')
 
     # Calculate summary statistics
     avg_compound = sentiment_df['compound'].mean()
     sentiment_counts = sentiment_df['label'].value_counts()
     total = len(sentiment_df)
 
+    # Bootstrap confidence intervals (cached per file version)
+    intervals = get_sentiment_intervals(
+        sentiment_df, 'compound', 'label', version=manifest.version('sentiment')
+    )
+
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Avg Sentiment", f"{avg_compound:.3f}")
+        st.caption(format_interval(intervals['mean']))
     with col2:
         positive_pct = (sentiment_counts.get('positive', 0) / total) * 100
         st.metric("Positive", f"{positive_pct:.1f}%", delta="55.4%")
+        st.caption(format_interval(intervals['shares']['positive'], scale=100, fmt="{:.1f}%"))
     with col3:
         neutral_pct = (sentiment_counts.get('neutral', 0) / total) * 100
         st.metric("Neutral", f"{neutral_pct:.1f}%")
+        st.caption(format_interval(intervals['shares']['neutral'], scale=100, fmt="{:.1f}%"))
     with col4:
         negative_pct = (sentiment_counts.get('negative', 0) / total) * 100
         st.metric("Negative", f"{negative_pct:.1f}%")
+        st.caption(format_interval(intervals['shares']['negative'], scale=100, fmt="{:.1f}%"))
 
     # Display sentiment distribution chart
-    if sentiment_img and sentiment_img.exists():
-        from PIL import Image
-        st.image(str(sentiment_img), use_container_width=True)
+    if manifest.has('sentiment_image'):
+        st.markdown(manifest.image_html('sentiment_image', alt="Sentiment Distribution"), unsafe_allow_html=True)
 
     st.markdown("**Interpretation:**")
     if positive_pct > 50:
@@ -223,10 +234,11 @@ else:
     st.info("Sentiment analysis data not available")
 
 # Topic Modeling
+perf.checkpoint("topics")
 st.markdown("---")
 st.markdown("### 🎯 Topic Modeling (LDA)")
-if topics_file and topics_file.exists():
-    topics_df = pd.read_csv(topics_file)
+if manifest.has('topics'):
+    topics_df = manifest.load('topics')
 
     st.markdown("**AI-XR Integration Themes:**")
 
@@ -254,6 +266,7 @@ else:
 # ============================================================================
 # DATA SOURCES
 # ============================================================================
+perf.checkpoint("sources")
 
 st.markdown("---")
 st.markdown("## 📚 Verified Data Sources")
@@ -268,6 +281,7 @@ if sources and len(sources) > 0:
 # ============================================================================
 # MANAGERIAL IMPLICATIONS
 # ============================================================================
+perf.checkpoint("implications")
 
 st.markdown("---")
 st.markdown("## 💼 Managerial Implications")
@@ -308,3 +322,5 @@ st.markdown("""
     <p>Part of the Five-Dimension XR Technology Readiness Framework</p>
 </div>
 """, unsafe_allow_html=True)
+
+show_perf_hud(perf)
@@ -12,8 +12,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "config"))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "analysis" / "common"))
 
 from dimensions import get_dimension_by_id, COLORS
-from data_loader import load_dimension
-from text_analytics import WordCloudGenerator, SentimentAnalyzer, TopicModeler
+from data_loader import load_dimension, get_loader
+from sentiment_stats import get_sentiment_intervals, format_interval
+from artifact_manifest import get_manifest
+from perf_hud import page_timer, show_perf_hud
+from topic_sentiment import show_topic_sentiment
+from source_index import get_source_index, show_source_browser
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -25,6 +29,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Opt-in section timings (?perf=1 or XR_DASHBOARD_PERF=1)
+perf = page_timer("Use Cases")
+
 # Load dimension configuration
 dimension = get_dimension_by_id('use_cases')
 if not dimension:
@@ -32,6 +39,7 @@ if not dimension:
     st.stop()
 
 # Load data
+perf.checkpoint("data load")
 try:
     data = load_dimension('use_cases')
     corpus = data['corpus']
@@ -44,11 +52,10 @@ try:
     if source_paths:
         links_file = source_paths[0]  # xr_usecases_links_UPDATED_2025.txt
         if links_file.exists():
-            with open(links_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('http'):
-                        verified_urls.append(line)
+            for line in get_loader().load_artifact(links_file).splitlines():
+                line = line.strip()
+                if line.startswith('http'):
+                    verified_urls.append(line)
 
     # Use verified URLs if available, otherwise fallback to sources from data
     if verified_urls:
@@ -61,6 +68,7 @@ except Exception as e:
 # ============================================================================
 # DIMENSION HEADER
 # ============================================================================
+perf.checkpoint("header")
 
 st.markdown(f"# {dimension.icon} {dimension.name}")
 
@@ -115,6 +123,7 @@ st.markdown(f"""
 # ============================================================================
 # USE CASE MATRIX
 # ============================================================================
+perf.checkpoint("use case matrix")
 
 st.markdown("## 🎯 Enterprise Use Case Matrix")
 
@@ -184,48 +193,44 @@ st.dataframe(use_case_df, use_container_width=True, hide_index=True)
 st.markdown("---")
 st.markdown("## 📊 Text Analytics")
 
-# Load pre-computed analytics from data files
-analytics_path = dimension.get_data_paths()[0].parent  # XR_Submission directory
-sentiment_file = analytics_path / "xr_sentiment_output.csv"
-topics_file = analytics_path / "xr_topics.json"
+# Pre-computed analytics, resolved through the dimension's artifact manifest
+manifest = get_manifest('use_cases')
 
 if text and len(text.strip()) > 100:
 
     # Word Cloud
+    perf.checkpoint("word cloud")
     st.markdown("### 📊 Word Cloud Analysis")
     try:
-        wc_gen = WordCloudGenerator(width=1200, height=600)
-        wordcloud = wc_gen.generate(text, max_words=100, colormap='Set2')
-
-        import matplotlib.pyplot as plt
-        fig, ax = plt.subplots(figsize=(15, 7))
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-        ax.set_title('Dominant Use Case Themes', fontsize=16, fontweight='bold', pad=20)
-        st.pyplot(fig)
-
-        col1, col2 = st.columns([2, 1])
-        with col1:
-            top_words = wc_gen.get_top_words(text, n=20)
-            top_df = pd.DataFrame(top_words, columns=['Word', 'Frequency'])
-            st.dataframe(top_df, use_container_width=True, hide_index=True)
-
-        with col2:
-            st.markdown("**Application Focus:**")
-            if top_words:
-                st.markdown(f"- Primary application: **{top_words[0][0]}**")
-                st.markdown("- Shows industry priorities")
-                st.markdown("- Reveals emerging patterns")
+        if manifest.has('wordcloud_image'):
+            st.markdown(manifest.image_html('wordcloud_image', alt="Dominant Use Case Themes"), unsafe_allow_html=True)
+            st.caption("Dominant Use Case Themes")
+
+            col1, col2 = st.columns([2, 1])
+            top_df = manifest.load('top_words')
+            with col1:
+                if top_df is not None:
+                    st.dataframe(top_df.head(20), use_container_width=True, hide_index=True)
+
+            with col2:
+                st.markdown("**Application Focus:**")
+                if top_df is not None and len(top_df) > 0:
+                    st.markdown(f"- Primary application: **{top_df.iloc[0]['Word']}**")
+                    st.markdown("- Shows industry priorities")
+                    st.markdown("- Reveals emerging patterns")
+        else:
+            st.info("Pre-computed word cloud not available. Run analysis/common/artifact_manifest.py to create it.")
     except Exception as e:
-        st.warning(f"Word cloud generation failed: {e}")
+        st.warning(f"Word cloud display failed: {e}")
 
     # Sentiment Analysis
+    perf.checkpoint("sentiment")
     st.markdown("---")
     st.markdown("### 😊 Sentiment Analysis")
     try:
-        if sentiment_file.exists():
+        if manifest.has('sentiment'):
             # Load pre-computed sentiment results
-            sentiment_df = pd.read_csv(sentiment_file)
+            sentiment_df = manifest.load('sentiment')
 
             # Calculate summary statistics
             avg_compound = sentiment_df['compound'].mean()
@@ -236,22 +241,31 @@ if text and len(text.strip()) > 100:
             neu_pct = (sentiment_counts.get('neutral', 0) / total) * 100
             neg_pct = (sentiment_counts.get('negative', 0) / total) * 100
 
+            # Bootstrap confidence intervals (cached per file version)
+            intervals = get_sentiment_intervals(
+                sentiment_df, 'compound', 'label', version=manifest.version('sentiment')
+            )
+
             # Display metrics
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 st.metric("Avg Sentiment", f"{avg_compound:.3f}")
+                st.caption(format_interval(intervals['mean']))
             with col2:
                 st.metric("Positive", f"{pos_pct:.1f}%",
                          delta=f"{sentiment_counts.get('positive', 0)} cases",
                          delta_color="off")
+                st.caption(format_interval(intervals['shares']['positive'], scale=100, fmt="{:.1f}%"))
             with col3:
                 st.metric("Neutral", f"{neu_pct:.1f}%",
                          delta=f"{sentiment_counts.get('neutral', 0)} cases",
                          delta_color="off")
+                st.caption(format_interval(intervals['shares']['neutral'], scale=100, fmt="{:.1f}%"))
             with col4:
                 st.metric("Negative", f"{neg_pct:.1f}%",
                          delta=f"{sentiment_counts.get('negative', 0)} cases",
                          delta_color="off")
+                st.caption(format_interval(intervals['shares']['negative'], scale=100, fmt="{:.1f}%"))
 
             # Show detailed sentiment breakdown
             with st.expander("📊 View Detailed Sentiment by Use Case"):
@@ -283,23 +297,21 @@ if text and len(text.strip()) > 100:
         st.warning(f"Sentiment analysis display failed: {e}")
 
     # Topic Modeling
+    perf.checkpoint("topics")
     st.markdown("---")
     st.markdown("### 🎯 Topic Modeling (LDA)")
     try:
-        if topics_file.exists():
-            # Load pre-computed topics from JSON
-            import json
-            with open(topics_file, 'r') as f:
-                topics_data = json.load(f)
+        if manifest.has('topics'):
+            # Load pre-computed topics (topic_name/terms mapped to topic/keywords)
+            topics_df = manifest.load('topics')
 
             st.markdown("**Key Use Case Themes Identified:**")
             st.markdown("")
 
             # Display topics
-            for topic in topics_data[:5]:  # Show top 5 topics
-                topic_name = topic.get('topic_name', f"Topic {topic.get('topic_id', 0) + 1}")
-                terms = topic.get('terms', [])
-                keywords = ', '.join(terms[:10]) if isinstance(terms, list) else str(terms)
+            for _, row in topics_df.head(5).iterrows():  # Show top 5 topics
+                topic_name = row['topic']
+                keywords = row['keywords']
 
                 # Create colored topic boxes
                 st.markdown(f"""
@@ -319,12 +331,17 @@ if text and len(text.strip()) > 100:
     except Exception as e:
         st.warning(f"Topic modeling display failed: {e}")
 
+    # Sentiment by Topic (doc-topic weights x document sentiment)
+    perf.checkpoint("topic sentiment")
+    show_topic_sentiment('use_cases', "How the tone of the case studies differs between use case themes:")
+
 else:
     st.info("Limited text data available for analytics")
 
 # ============================================================================
 # DATA SOURCES
 # ============================================================================
+perf.checkpoint("sources")
 
 st.markdown("---")
 st.markdown("## 📚 Verified Data Sources")
@@ -333,62 +350,15 @@ if sources and len(sources) > 0:
     st.markdown(f"**{len(sources)} verified case study URLs** from real-world XR implementations:")
     st.markdown("*All URLs verified for 200 OK response (2025-01-22)*")
 
-    # Group URLs by category
-    categories = {
-        "MANUFACTURING": [],
-        "HEALTHCARE": [],
-        "RETAIL": [],
-        "LOGISTICS & FIELD SERVICE": [],
-        "AUTOMOTIVE & DESIGN": [],
-        "CONSTRUCTION & ARCHITECTURE": [],
-        "AVIATION & DEFENSE": []
-    }
-
-    current_category = None
-    for url in sources:
-        # Check if this is a category marker in the source file
-        for cat in categories.keys():
-            if cat in url.upper():
-                current_category = cat
-                break
-        else:
-            # This is an actual URL
-            if current_category and url.startswith('http'):
-                categories[current_category].append(url)
-            elif url.startswith('http'):
-                # Uncategorized URL
-                if "OTHER" not in categories:
-                    categories["OTHER"] = []
-                categories["OTHER"].append(url)
-
-    # Display URLs by category
-    with st.expander("📖 View All Source URLs by Industry"):
-        for category, urls in categories.items():
-            if urls:
-                st.markdown(f"### {category}")
-                for i, url in enumerate(urls, 1):
-                    # Extract domain for cleaner display
-                    try:
-                        from urllib.parse import urlparse
-                        parsed = urlparse(url)
-                        domain = parsed.netloc.replace('www.', '')
-                        # Truncate URL for display
-                        display_url = url[:80] + '...' if len(url) > 80 else url
-                        st.markdown(f"{i}. **{domain}** - [{display_url}]({url})")
-                    except:
-                        st.markdown(f"{i}. [{url}]({url})")
-                st.markdown("")
-
-    # Also show flat list
-    with st.expander("📋 View Complete URL List"):
-        for i, url in enumerate(sources, 1):
-            st.markdown(f"{i}. {url}")
+    with st.expander("📖 Browse Source URLs by Industry"):
+        show_source_browser(get_source_index('use_cases'), key="use_case_sources")
 else:
     st.info("Source URLs are embedded in the corpus data")
 
 # ============================================================================
 # USE CASE DEEP DIVE
 # ============================================================================
+perf.checkpoint("deep dive")
 
 st.markdown("---")
 st.markdown("## 🔍 Use Case Deep Dive")
@@ -419,6 +389,7 @@ if isinstance(corpus, pd.DataFrame) and not corpus.empty:
 # ============================================================================
 # MANAGERIAL IMPLICATIONS
 # ============================================================================
+perf.checkpoint("implications")
 
 st.markdown("---")
 st.markdown("## 💼 Managerial Implications")
@@ -467,3 +438,5 @@ st.markdown("""
     <p>Part of the Five-Dimension XR Technology Readiness Framework</p>
 </div>
 """, unsafe_allow_html=True)
+
+show_perf_hud(perf)
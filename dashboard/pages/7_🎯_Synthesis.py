@@ -17,6 +17,9 @@ from dimensions import (
     get_data_summary,
     COLORS
 )
+from figure_cache import readiness_figure
+from perf_hud import page_timer, show_perf_hud
+from joint_topics import data_version, get_joint_topics
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -28,9 +31,13 @@ st.set_page_config(
     layout="wide"
 )
 
+# Opt-in section timings (?perf=1 or XR_DASHBOARD_PERF=1)
+perf = page_timer("Synthesis")
+
 # ============================================================================
 # PAGE HEADER
 # ============================================================================
+perf.checkpoint("header")
 
 st.markdown("# 🎯 Strategic Synthesis & Recommendations")
 
@@ -48,6 +55,7 @@ st.markdown("""
 # ============================================================================
 # FIVE-DIMENSION SCORECARD
 # ============================================================================
+perf.checkpoint("scorecard")
 
 st.markdown("## 📊 Five-Dimension Scorecard")
 
@@ -125,46 +133,18 @@ st.dataframe(
 )
 
 # Visualization
+perf.checkpoint("readiness chart")
 st.markdown("### 📈 Readiness Score Visualization")
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Bar chart
-dimensions_short = [dim.name.split()[-1] if len(dim.name.split()) > 2 else dim.name for dim in ALL_DIMENSIONS]
-scores = [dim.readiness_score for dim in ALL_DIMENSIONS]
-colors_list = ['#00C9A7' if s >= 80 else '#FFC107' if s >= 60 else '#DC3545' for s in scores]
-
-ax1.barh(dimensions_short, scores, color=colors_list, alpha=0.8, edgecolor='black')
-ax1.axvline(x=readiness['average_score'], color='red', linestyle='--', linewidth=2, label=f'Average: {readiness["average_score"]:.0f}%')
-ax1.set_xlabel('Readiness Score (%)', fontweight='bold')
-ax1.set_title('Dimension Readiness Scores', fontweight='bold', fontsize=14)
-ax1.legend()
-ax1.grid(axis='x', alpha=0.3)
-
-# Radar chart
-angles = np.linspace(0, 2 * np.pi, len(ALL_DIMENSIONS), endpoint=False).tolist()
-scores_radar = scores + [scores[0]]  # Close the polygon
-angles += angles[:1]
-
-ax2 = plt.subplot(122, projection='polar')
-ax2.plot(angles, scores_radar, 'o-', linewidth=2, color='#0066CC')
-ax2.fill(angles, scores_radar, alpha=0.25, color='#00C9A7')
-ax2.set_xticks(angles[:-1])
-ax2.set_xticklabels(dimensions_short, size=9)
-ax2.set_ylim(0, 100)
-ax2.set_yticks([20, 40, 60, 80, 100])
-ax2.set_title('Five-Dimension Radar', fontweight='bold', fontsize=14, pad=20)
-ax2.grid(True)
-
-plt.tight_layout()
-st.pyplot(fig)
+# Rendered once per set of scores, then shared by every rerun and session
+st.image(readiness_figure(ALL_DIMENSIONS, readiness['average_score']), use_container_width=True)
 
 # ============================================================================
 # CROSS-DIMENSIONAL INSIGHTS
 # ============================================================================
+perf.checkpoint("insights")
 
 st.markdown("---")
 st.markdown("## 🔍 Cross-Dimensional Insights")
@@ -203,9 +183,52 @@ with col2:
     - User adoption and ergonomics concerns
     """)
 
+# Shared themes from one topic model over all five corpora
+perf.checkpoint("shared themes")
+st.markdown("### 🧩 Shared Themes Across Dimensions")
+st.caption(
+    "One topic model fitted on the combined corpus of all five dimensions, "
+    "so themes are directly comparable between dimensions."
+)
+
+try:
+    # Built by the pipeline (joint_topics.py); fitting here would stall the page load
+    joint = get_joint_topics(version=data_version(), fit=False)
+    if joint is None:
+        st.info("Pre-computed shared themes not available. Run analysis/common/joint_topics.py to create them.")
+    else:
+        prevalence, overlap, n_documents = joint['prevalence'], joint['overlap'], joint['n_documents']
+
+        col1, col2 = st.columns([3, 2])
+
+        with col1:
+            st.markdown("**Theme prevalence by dimension**")
+            st.dataframe(
+                (prevalence * 100).style.format("{:.0f}%").background_gradient(cmap='Blues', axis=None),
+                use_container_width=True
+            )
+
+        with col2:
+            st.markdown("**Theme overlap between dimensions** (1.00 = identical mix)")
+            st.dataframe(
+                overlap.style.format("{:.2f}").background_gradient(cmap='Greens', axis=None),
+                use_container_width=True
+            )
+
+        # Closest pair of distinct dimensions
+        pairs = overlap.where(~np.eye(len(overlap), dtype=bool)).stack()
+        (dim_a, dim_b), score = pairs.idxmax(), pairs.max()
+        st.info(
+            f"**Most similar theme mix:** {dim_a} & {dim_b} (overlap {score:.2f}) · "
+            f"{sum(n_documents.values())} documents analyzed"
+        )
+except Exception as e:
+    st.warning(f"Joint topic model unavailable: {e}")
+
 # ============================================================================
 # STRATEGIC RECOMMENDATIONS
 # ============================================================================
+perf.checkpoint("recommendations")
 
 st.markdown("---")
 st.markdown("## 🎯 Strategic Recommendations")
@@ -344,6 +367,7 @@ with tab3:
 # ============================================================================
 # RISK MITIGATION
 # ============================================================================
+perf.checkpoint("risk mitigation")
 
 st.markdown("---")
 st.markdown("## ⚠️ Risk Mitigation Strategies")
@@ -399,6 +423,7 @@ st.dataframe(risk_df, use_container_width=True, hide_index=True)
 # ============================================================================
 # INVESTMENT GUIDANCE
 # ============================================================================
+perf.checkpoint("investment guidance")
 
 st.markdown("---")
 st.markdown("## 💰 Investment Guidance")
@@ -469,6 +494,7 @@ with col2:
 # ============================================================================
 # FINAL RECOMMENDATION
 # ============================================================================
+perf.checkpoint("final recommendation")
 
 st.markdown("---")
 st.markdown("## ✅ Final Recommendation")
@@ -502,3 +528,5 @@ st.markdown("""
     <p>Analysis based on 254 verified sources | 2020-2025 data period</p>
 </div>
 """, unsafe_allow_html=True)
+
+show_perf_hud(perf)
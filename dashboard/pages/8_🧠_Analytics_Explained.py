@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
+from typing import Dict, Optional, Tuple
 
 # Add paths
 sys.path.insert(0, str(Path(__file__).parent.parent / "config"))
@@ -127,6 +128,63 @@ elif compound <= -0.05: → Negative
 else:                  → Neutral
     """)
 
+# ============================================================================
+# CACHED VADER SCORING
+# ============================================================================
+
+# Canned XR statements scored together for the comparison table
+EXAMPLE_SENTENCES = (
+    "OpenXR provides excellent cross-platform compatibility for XR applications. However, fragmentation persists across proprietary SDKs.",
+    "Boeing reduced wiring assembly time by 30% using AR work instructions.",
+    "Cloud rendering latency remains a serious problem for multi-user XR deployments.",
+    "The headset ships with a 2064x2208 per-eye display and a Snapdragon XR2 chipset.",
+    "Enterprise pilots are promising, but high hardware costs and poor content pipelines slow adoption.",
+)
+
+
+def classify_compound(compound_score: float) -> Tuple[str, str, str]:
+    """Map a compound score to (label, color, emoji) using VADER thresholds"""
+    if compound_score >= 0.05:
+        return "Positive", "green", "😊"
+    elif compound_score <= -0.05:
+        return "Negative", "red", "😟"
+    return "Neutral", "blue", "😐"
+
+
+@st.cache_resource(show_spinner=False)
+def get_vader_analyzer():
+    """Load the VADER lexicon once per server process (None if not installed)"""
+    try:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    except ImportError:
+        return None
+    return SentimentIntensityAnalyzer()
+
+
+@st.cache_data(show_spinner=False, max_entries=4096)
+def score_text(text: str) -> Optional[Dict[str, float]]:
+    """Memoized VADER scores for a single input text"""
+    sia = get_vader_analyzer()
+    if sia is None:
+        return None
+    return sia.polarity_scores(text)
+
+
+@st.cache_data(show_spinner=False)
+def score_examples(texts: Tuple[str, ...]) -> Optional[pd.DataFrame]:
+    """Score all canned example sentences in a single batch"""
+    sia = get_vader_analyzer()
+    if sia is None:
+        return None
+
+    scores = pd.DataFrame([sia.polarity_scores(text) for text in texts])
+    scores.insert(0, 'Text', list(texts))
+    scores['Label'] = [classify_compound(c)[0] for c in scores['compound']]
+    return scores.rename(columns={
+        'compound': 'Compound', 'pos': 'Positive', 'neu': 'Neutral', 'neg': 'Negative'
+    })[['Text', 'Compound', 'Positive', 'Neutral', 'Negative', 'Label']]
+
+
 # ============================================================================
 # INTERACTIVE DEMO
 # ============================================================================
@@ -136,9 +194,16 @@ st.markdown("### 🎮 Interactive Demo: Try VADER Yourself")
 
 st.markdown("Enter your own text to see how VADER analyzes sentiment in real-time:")
 
+example_choice = st.selectbox(
+    "Start from an example:",
+    range(len(EXAMPLE_SENTENCES)),
+    format_func=lambda i: EXAMPLE_SENTENCES[i][:90] + ('...' if len(EXAMPLE_SENTENCES[i]) > 90 else ''),
+    help="Pick a canned XR statement, then edit it below"
+)
+
 example_text = st.text_area(
     "Sample Text:",
-    "OpenXR provides excellent cross-platform compatibility for XR applications. However, fragmentation persists across proprietary SDKs.",
+    EXAMPLE_SENTENCES[example_choice],
     height=120,
     help="Try different texts to see how VADER scores them!"
 )
@@ -146,15 +211,8 @@ example_text = st.text_area(
 if example_text:
     try:
         # Use VADER (not TextBlob) to match the explanation
-        try:
-            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-            sia = SentimentIntensityAnalyzer()
-            scores = sia.polarity_scores(example_text)
-            vader_available = True
-        except ImportError:
-            # Fallback to basic implementation if VADER not available
-            vader_available = False
-            scores = {'compound': 0.0, 'pos': 0.0, 'neu': 1.0, 'neg': 0.0}
+        scores = score_text(example_text)
+        vader_available = scores is not None
 
         if vader_available:
             compound_score = scores['compound']
@@ -195,19 +253,7 @@ if example_text:
             col_a, col_b = st.columns(2)
 
             with col_a:
-                if compound_score >= 0.05:
-                    label = "Positive"
-                    color = "green"
-                    emoji = "😊"
-                elif compound_score <= -0.05:
-                    label = "Negative"
-                    color = "red"
-                    emoji = "😟"
-                else:
-                    label = "Neutral"
-                    color = "blue"
-                    emoji = "😐"
-
+                label, color, emoji = classify_compound(compound_score)
                 st.markdown(f"### :{color}[{emoji} {label}]")
 
             with col_b:
@@ -228,6 +274,21 @@ if example_text:
         st.error(f"Error analyzing sentiment: {e}")
         st.info("Make sure vaderSentiment is installed: `pip install vaderSentiment`")
 
+with st.expander("📋 **How VADER Scores Typical XR Statements**"):
+    examples_df = score_examples(EXAMPLE_SENTENCES)
+    if examples_df is not None:
+        st.dataframe(
+            examples_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                col: st.column_config.NumberColumn(col, format="%.3f")
+                for col in ['Compound', 'Positive', 'Neutral', 'Negative']
+            }
+        )
+    else:
+        st.info("Install vaderSentiment to score the example statements.")
+
 # ============================================================================
 # MATHEMATICAL FOUNDATION
 # ============================================================================
@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+"""
+Static Snapshot Export of the Dashboard
+Renders every page and view once and writes a self-contained HTML bundle
+
+The framework landing page, the dimension pages, Synthesis, Analytics
+Explained and every view of streamlit_app.py are run headlessly with
+Streamlit's AppTest. The resulting element tree is converted to plain HTML:
+markdown, metrics, tables, alerts, columns, expanders and tabs keep their
+layout. Images are written once to assets/img/ (named by content hash),
+and Plotly charts are drawn by a bundled plotly.min.js. The result is
+static files only, so any file server or CDN can serve it.
+
+Widgets are shown with their default value; interactive exploration stays
+in the live dashboard.
+
+Usage:
+    python export_static_dashboard.py [--output=static_export]
+"""
+import base64
+import hashlib
+import html
+import json
+import re
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest import mock
+
+PROJECT_ROOT = Path(__file__).parent
+DASHBOARD_APP = PROJECT_ROOT / "dashboard" / "app.py"
+PAGES_DIR = PROJECT_ROOT / "dashboard" / "pages"
+STANDALONE_APP = PROJECT_ROOT / "streamlit_app.py"
+
+sys.path.insert(0, str(PROJECT_ROOT / "dashboard" / "config"))
+sys.path.insert(0, str(PROJECT_ROOT / "analysis" / "common"))
+from dimensions import COLORS
+from image_assets import STATIC_IMAGE_DIR, STATIC_IMAGE_URL
+from joint_topics import get_joint_topics
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_OUTPUT = "static_export"
+EXPORT_MARKER = ".static_export"  # marks a directory this script created and may replace
+RENDER_TIMEOUT = 300  # seconds per page
+
+MIME_EXTENSIONS = {
+    'image/png': 'png', 'image/jpeg': 'jpg', 'image/gif': 'gif',
+    'image/webp': 'webp', 'image/svg+xml': 'svg'
+}
+DATA_URI = re.compile(r"data:(image/[\w+.-]+);base64,([A-Za-z0-9+/=]+)")
+STATIC_IMAGE = re.compile(re.escape(STATIC_IMAGE_URL) + r"/([\w-]+)\.(\w+)(?:\?v=\w+)?")  # image_assets.static_image_url()
+
+STYLESHEET = f"""
+body {{ margin: 0; font-family: -apple-system, "Segoe UI", Roboto, sans-serif; color: #262730; line-height: 1.6; }}
+nav {{ position: fixed; top: 0; bottom: 0; left: 0; width: 250px; overflow-y: auto; padding: 24px 16px;
+      background: #F0F2F6; box-sizing: border-box; }}
+nav h2 {{ font-size: 0.8rem; text-transform: uppercase; letter-spacing: 0.05em; color: {COLORS['neutral_gray']}; margin: 20px 0 8px; }}
+nav a {{ display: block; padding: 6px 10px; border-radius: 6px; color: #262730; text-decoration: none; }}
+nav a:hover {{ background: #E0E4EB; }}
+nav a.active {{ background: {COLORS['primary_blue']}; color: white; }}
+main {{ margin-left: 250px; padding: 32px 48px; max-width: 1400px; }}
+h1 {{ color: {COLORS['primary_blue']}; border-bottom: 3px solid {COLORS['accent_teal']}; padding-bottom: 12px; }}
+h2, h3 {{ color: {COLORS['primary_blue']}; }}
+img {{ max-width: 100%; height: auto; }}
+.row {{ display: flex; gap: 16px; flex-wrap: wrap; }}
+.col {{ min-width: 0; }}
+.metric {{ padding: 12px 0; }}
+.metric .label {{ font-size: 0.875rem; color: {COLORS['neutral_gray']}; }}
+.metric .value {{ font-size: 2rem; }}
+.metric .delta {{ font-size: 0.875rem; color: {COLORS['success_green']}; }}
+.caption {{ font-size: 0.875rem; color: {COLORS['neutral_gray']}; }}
+.alert {{ padding: 12px 16px; border-radius: 8px; margin: 12px 0; }}
+.alert-info {{ background: #E8F0FE; }} .alert-success {{ background: #E6F4EA; }}
+.alert-warning {{ background: #FFF8E1; }} .alert-error {{ background: #FDECEA; }}
+.table-wrap {{ overflow-x: auto; max-height: 480px; margin: 12px 0; }}
+table {{ border-collapse: collapse; font-size: 0.875rem; }}
+th, td {{ border: 1px solid #E6E9EF; padding: 4px 8px; text-align: left; vertical-align: top; }}
+th {{ background: #F7F8FA; position: sticky; top: 0; }}
+details {{ border: 1px solid #E6E9EF; border-radius: 8px; padding: 8px 16px; margin: 12px 0; }}
+summary {{ cursor: pointer; font-weight: 600; }}
+.tab-label {{ font-weight: 600; border-bottom: 2px solid {COLORS['accent_teal']}; display: inline-block; margin-top: 16px; }}
+.widget {{ font-size: 0.875rem; color: {COLORS['neutral_gray']}; border-left: 3px solid #E6E9EF; padding-left: 8px; margin: 8px 0; }}
+pre {{ background: #F7F8FA; padding: 12px; border-radius: 6px; overflow-x: auto; }}
+footer {{ margin-top: 48px; font-size: 0.8rem; color: {COLORS['neutral_gray']}; }}
+"""
+
+
+def arg_value(name: str, default=None):
+    """Value of a --name=value command-line flag"""
+    for arg in sys.argv[1:]:
+        if arg.startswith(f"--{name}="):
+            return arg.split("=", 1)[1]
+    return default
+
+
+def slugify(text: str) -> str:
+    """File-name friendly version of a page or view name"""
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+# ============================================================================
+# MARKDOWN (the subset st.markdown is used with in this repo)
+# ============================================================================
+
+def markdown_inline(text: str, allow_html: bool = True) -> str:
+    """Inline markdown: code spans, links, bold and italic"""
+    code_spans: List[str] = []
+
+    def keep_code(match):
+        code_spans.append(f"<code>{html.escape(match.group(1))}</code>")
+        return f"\x00{len(code_spans) - 1}\x00"
+
+    text = re.sub(r"`([^`]+)`", keep_code, text)
+    if not allow_html:
+        text = html.escape(text, quote=False)
+    text = re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", r'<a href="\2">\1</a>', text)
+    text = re.sub(r"\*\*(.+?)\*\*|__(.+?)__", lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    text = re.sub(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])", r"<em>\1</em>", text)
+    text = re.sub(r"(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)", r"<em>\1</em>", text)
+    text = re.sub(r"  $", "<br>", text, flags=re.M)
+    return re.sub(r"\x00(\d+)\x00", lambda m: code_spans[int(m.group(1))], text)
+
+
+def markdown_to_html(text: str, allow_html: bool = True) -> str:
+    """
+    Block markdown: headings, lists (nested by indent), tables, rules,
+    quotes, fenced code, paragraphs and raw HTML blocks
+    """
+    lines = text.strip("\n").split("\n")
+    out: List[str] = []
+    paragraph: List[str] = []
+    lists: List[tuple] = []  # open lists: (indent, tag)
+    i = 0
+
+    def flush_paragraph():
+        if paragraph:
+            out.append(f"<p>{markdown_inline(' '.join(paragraph), allow_html)}</p>")
+            paragraph.clear()
+
+    def close_lists(indent: int = -1):
+        while lists and lists[-1][0] > indent:
+            out.append(f"</li></{lists.pop()[1]}>")
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        item = re.match(r"^(\s*)([-*+]|\d+\.)\s+(.*)$", line)
+
+        if not stripped:
+            flush_paragraph()
+            close_lists()
+        elif stripped.startswith("```"):
+            flush_paragraph()
+            close_lists()
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith("```"):
+                code.append(lines[i])
+                i += 1
+            out.append(f"<pre><code>{html.escape(chr(10).join(code))}</code></pre>")
+        elif allow_html and stripped.startswith("<") and not paragraph:
+            close_lists()
+            block = []
+            while i < len(lines) and lines[i].strip():
+                block.append(lines[i])
+                i += 1
+            out.append("\n".join(block))
+            continue
+        elif re.match(r"^#{1,6}\s", stripped):
+            flush_paragraph()
+            close_lists()
+            level = len(stripped) - len(stripped.lstrip("#"))
+            out.append(f"<h{level}>{markdown_inline(stripped[level:].strip(), allow_html)}</h{level}>")
+        elif re.match(r"^(-{3,}|\*{3,}|_{3,})$", stripped):
+            flush_paragraph()
+            close_lists()
+            out.append("<hr>")
+        elif stripped.startswith("|") and i + 1 < len(lines) and re.match(r"^\|?\s*:?-+", lines[i + 1].strip()):
+            flush_paragraph()
+            close_lists()
+            cells = lambda row: [cell.strip() for cell in row.strip().strip("|").split("|")]
+            header = cells(line)
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                rows.append(cells(lines[i]))
+                i += 1
+            out.append("<table><thead><tr>" + "".join(f"<th>{markdown_inline(c, allow_html)}</th>" for c in header)
+                       + "</tr></thead><tbody>"
+                       + "".join("<tr>" + "".join(f"<td>{markdown_inline(c, allow_html)}</td>" for c in row) + "</tr>"
+                                 for row in rows)
+                       + "</tbody></table>")
+            continue
+        elif stripped.startswith(">"):
+            flush_paragraph()
+            close_lists()
+            out.append(f"<blockquote>{markdown_inline(stripped.lstrip('> '), allow_html)}</blockquote>")
+        elif item:
+            flush_paragraph()
+            indent = len(item.group(1))
+            tag = "ol" if item.group(2)[0].isdigit() else "ul"
+            if lists and lists[-1][0] == indent:
+                out.append("</li>")
+            elif not lists or lists[-1][0] < indent:
+                out.append(f"<{tag}>")
+                lists.append((indent, tag))
+            else:
+                close_lists(indent)
+                if lists and lists[-1][0] == indent:
+                    out.append("</li>")
+                else:
+                    out.append(f"<{tag}>")
+                    lists.append((indent, tag))
+            out.append(f"<li>{markdown_inline(item.group(3), allow_html)}")
+        elif lists and line.startswith(" "):
+            out.append(" " + markdown_inline(stripped, allow_html))  # continuation of a list item
+        else:
+            paragraph.append(stripped)
+        i += 1
+
+    flush_paragraph()
+    close_lists()
+    return "\n".join(out)
+
+
+# ============================================================================
+# ASSETS
+# ============================================================================
+
+class AssetWriter:
+    """Writes images and scripts once into the bundle's assets/ folder"""
+
+    def __init__(self, output: Path):
+        self.output = output
+        self.images: Dict[str, str] = {}  # content hash -> relative path
+
+    def image(self, data: bytes, mimetype: str) -> str:
+        """Relative URL of an image, written on first use"""
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        if digest not in self.images:
+            relative = f"assets/img/{digest}.{MIME_EXTENSIONS.get(mimetype, 'bin')}"
+            path = self.output / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            self.images[digest] = relative
+        return self.images[digest]
+
+    def externalize_data_uris(self, markup: str) -> str:
+        """Move inline base64 images (and dashboard static image URLs) into the bundle's asset files"""
+        markup = STATIC_IMAGE.sub(
+            lambda m: self.image((STATIC_IMAGE_DIR / f"{m.group(1)}.{m.group(2)}").read_bytes(), f"image/{m.group(2)}"),
+            markup
+        )
+        return DATA_URI.sub(lambda m: self.image(base64.b64decode(m.group(2)), m.group(1)), markup)
+
+    def plotly_js(self) -> Optional[str]:
+        """Relative URL of plotly.min.js (None if plotly is not installed)"""
+        path = self.output / "assets" / "plotly.min.js"
+        if not path.exists():
+            try:
+                from plotly.offline import get_plotlyjs
+            except ImportError:
+                return None
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(get_plotlyjs(), encoding='utf-8')
+        return "assets/plotly.min.js"
+
+
+# ============================================================================
+# ELEMENT TREE -> HTML
+# ============================================================================
+
+class PageRenderer:
+    """Converts one AppTest element tree into HTML"""
+
+    def __init__(self, assets: AssetWriter, media: Dict[str, tuple]):
+        self.assets = assets
+        self.media = media  # media URL -> (bytes, mimetype) captured during the run
+        self.uses_plotly = False
+        self.skipped: Dict[str, int] = {}
+
+    def render(self, node) -> str:
+        kind = getattr(node, 'type', None)
+        handler = getattr(self, f"_render_{kind}", None)
+        if handler is not None:
+            return handler(node)
+        if hasattr(node, 'children'):
+            return self._children(node)
+        self.skipped[kind] = self.skipped.get(kind, 0) + 1
+        return ""
+
+    def _children(self, node) -> str:
+        return "\n".join(filter(None, (self.render(child) for child in node.children.values())))
+
+    # Layout blocks
+    def _render_flex_container(self, node) -> str:
+        horizontal = node.proto.flex_container.direction == node.proto.flex_container.HORIZONTAL
+        return f"<div class='{'row' if horizontal else 'stack'}'>{self._children(node)}</div>"
+
+    def _render_column(self, node) -> str:
+        return f"<div class='col' style='flex: {node.weight:g}'>{self._children(node)}</div>"
+
+    def _render_expander(self, node) -> str:
+        return f"<details open><summary>{markdown_inline(node.label)}</summary>{self._children(node)}</details>"
+
+    def _render_tab(self, node) -> str:
+        return f"<div class='tab-label'>{markdown_inline(node.label)}</div>{self._children(node)}"
+
+    # Text
+    def _render_markdown(self, node) -> str:
+        if node.proto.allow_html and node.value.lstrip().startswith("<style"):
+            return node.value  # page stylesheet (.insight-box, .main-header, ...), may contain blank lines
+        return self.assets.externalize_data_uris(markdown_to_html(node.value, node.proto.allow_html))
+
+    def _render_title(self, node) -> str:
+        return f"<h1>{markdown_inline(node.value)}</h1>"
+
+    def _render_header(self, node) -> str:
+        return f"<h2>{markdown_inline(node.value)}</h2>"
+
+    def _render_subheader(self, node) -> str:
+        return f"<h3>{markdown_inline(node.value)}</h3>"
+
+    def _render_caption(self, node) -> str:
+        return f"<div class='caption'>{markdown_to_html(node.value, node.proto.allow_html)}</div>"
+
+    def _render_text(self, node) -> str:
+        return f"<pre>{html.escape(node.value)}</pre>"
+
+    def _render_code(self, node) -> str:
+        return f"<pre><code>{html.escape(node.value)}</code></pre>"
+
+    def _render_latex(self, node) -> str:
+        return f"<pre class='latex'>{html.escape(node.value)}</pre>"
+
+    def _alert(self, node, level: str) -> str:
+        return f"<div class='alert alert-{level}'>{markdown_to_html(node.value)}</div>"
+
+    def _render_info(self, node) -> str:
+        return self._alert(node, 'info')
+
+    def _render_success(self, node) -> str:
+        return self._alert(node, 'success')
+
+    def _render_warning(self, node) -> str:
+        return self._alert(node, 'warning')
+
+    def _render_error(self, node) -> str:
+        return self._alert(node, 'error')
+
+    def _render_exception(self, node) -> str:
+        return f"<div class='alert alert-error'><pre>{html.escape(str(node.value))}</pre></div>"
+
+    # Data
+    def _render_metric(self, node) -> str:
+        delta = f"<div class='delta'>{html.escape(node.delta)}</div>" if node.delta else ""
+        return (f"<div class='metric'><div class='label'>{markdown_inline(node.label)}</div>"
+                f"<div class='value'>{html.escape(str(node.value))}</div>{delta}</div>")
+
+    def _render_arrow_data_frame(self, node) -> str:
+        import pandas as pd
+        frame = node.value
+        show_index = not isinstance(frame.index, pd.RangeIndex)
+        return f"<div class='table-wrap'>{frame.to_html(index=show_index, border=0, na_rep='')}</div>"
+
+    _render_arrow_table = _render_arrow_data_frame
+
+    # Media
+    def _render_imgs(self, node) -> str:
+        figures = []
+        for image in node.proto.imgs:
+            if image.url in self.media:
+                src = self.assets.image(*self.media[image.url])
+            else:
+                src = self.assets.externalize_data_uris(image.url)
+            caption = f"<figcaption class='caption'>{html.escape(image.caption)}</figcaption>" if image.caption else ""
+            figures.append(f"<figure><img src='{src}' alt='{html.escape(image.caption, quote=True)}'>{caption}</figure>")
+        return "\n".join(figures)
+
+    def _render_plotly_chart(self, node) -> str:
+        self.uses_plotly = True
+        spec = json.loads(node.proto.spec)
+        chart_id = f"chart-{hashlib.sha256(node.proto.spec.encode('utf-8')).hexdigest()[:12]}"
+        return (f"<div id='{chart_id}'></div><script>Plotly.newPlot('{chart_id}', "
+                f"{json.dumps(spec.get('data', []))}, {json.dumps(spec.get('layout', {}))}, "
+                f"{{responsive: true, displaylogo: false}});</script>")
+
+    # Widgets: frozen at their default value
+    def _widget(self, node) -> str:
+        value = getattr(node, 'value', None)
+        shown = f": <strong>{html.escape(str(value))}</strong>" if value not in (None, "") else ""
+        return f"<div class='widget'>🎛️ {markdown_inline(node.label)}{shown} (interactive in the live dashboard)</div>"
+
+    _render_radio = _render_selectbox = _render_slider = _render_multiselect = _widget
+    _render_text_area = _render_text_input = _render_number_input = _render_checkbox = _widget
+    _render_button = _widget
+
+    def _render_empty(self, node) -> str:
+        return ""
+
+
+# ============================================================================
+# RENDERING PAGES
+# ============================================================================
+
+class CapturingMediaStorage:
+    """
+    Keeps the bytes behind /media URLs (st.pyplot, st.image of arrays)
+
+    AppTest stores media in a per-run in-memory storage that is dropped when
+    the run ends; this subclass records each file as it is added.
+    """
+    files: Dict[str, tuple] = {}
+
+    @classmethod
+    def make(cls):
+        from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+        class Storage(MemoryMediaFileStorage):
+            def load_and_get_id(self, path_or_data, mimetype, kind, filename=None):
+                file_id = super().load_and_get_id(path_or_data, mimetype, kind, filename)
+                cls.files[self.get_url(file_id)] = (self._files_by_id[file_id].content, mimetype)
+                return file_id
+        return Storage
+
+
+def run_app(script: Path, select_view: Optional[str] = None):
+    """Run a script with AppTest (optionally choosing a sidebar radio view)"""
+    from streamlit.testing.v1 import AppTest
+
+    with mock.patch("streamlit.testing.v1.app_test.MemoryMediaFileStorage", CapturingMediaStorage.make()):
+        at = AppTest.from_file(str(script), default_timeout=RENDER_TIMEOUT)
+        at.run()
+        if select_view is not None:
+            at.sidebar.radio[0].set_value(select_view).run()
+    return at
+
+
+def export_targets() -> List[Dict]:
+    """Pages in navigation order: name, file name, script, view, section"""
+    targets = [{'name': "Framework", 'file': "index.html", 'script': DASHBOARD_APP, 'view': None, 'section': "Dashboard"}]
+    for path in sorted(PAGES_DIR.glob("[0-9]*_*.py")):
+        name = path.stem.split('_', 2)[-1].replace('_', ' ')
+        targets.append({'name': name, 'file': f"{slugify(name)}.html", 'script': path, 'view': None, 'section': "Dashboard"})
+
+    views = run_app(STANDALONE_APP).sidebar.radio[0].options
+    for view in views:
+        name = view.split(' ', 1)[1]
+        targets.append({
+            'name': name, 'file': f"text-analytics-{slugify(name)}.html",
+            'script': STANDALONE_APP, 'view': view, 'section': "Text Analytics App"
+        })
+    return targets
+
+
+def page_html(target: Dict, targets: List[Dict], body: str, plotly_src: Optional[str], generated: str) -> str:
+    """Full HTML document with navigation"""
+    nav, section = [], None
+    for other in targets:
+        if other['section'] != section:
+            section = other['section']
+            nav.append(f"<h2>{html.escape(section)}</h2>")
+        active = " class='active'" if other is target else ""
+        nav.append(f"<a href='{other['file']}'{active}>{html.escape(other['name'])}</a>")
+
+    plotly = f"<script src='{plotly_src}'></script>" if plotly_src else ""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(target['name'])} | XR Technology Readiness Dashboard</title>
+<link rel="stylesheet" href="assets/style.css">
+{plotly}
+</head>
+<body>
+<nav>
+<strong>🥽 XR Dashboard</strong>
+{chr(10).join(nav)}
+</nav>
+<main>
+{body}
+<footer>Static snapshot generated {generated}. Interactive controls are available in the live dashboard.</footer>
+</main>
+</body>
+</html>
+"""
+
+
+def prepare_output(output: Path):
+    """
+    Create an empty output directory, replacing a previous export
+
+    An existing directory is only deleted if it holds EXPORT_MARKER, so a
+    mistyped --output never removes unrelated files.
+
+    Raises:
+        ValueError: If output is a file or a non-empty directory without the marker
+    """
+    if output.exists():
+        if not output.is_dir():
+            raise ValueError(f"{output} exists and is not a directory")
+        if (output / EXPORT_MARKER).exists():
+            shutil.rmtree(output)
+        elif any(output.iterdir()):
+            raise ValueError(f"{output} is not empty and was not created by this exporter")
+    output.mkdir(parents=True, exist_ok=True)
+    (output / EXPORT_MARKER).write_text("Created by export_static_dashboard.py\n", encoding='utf-8')
+
+
+def export_dashboard(output: Path) -> Dict:
+    """
+    Render every target into output/
+
+    Returns:
+        Dictionary with pages (name, file, bytes, skipped element types) and failed page names
+
+    Raises:
+        ValueError: If output holds files that are not a previous export (see prepare_output)
+    """
+    prepare_output(output)
+    get_joint_topics()  # fits the shared-themes model the Synthesis page only loads
+    (output / "assets").mkdir()
+    (output / "assets" / "style.css").write_text(STYLESHEET.strip() + "\n", encoding='utf-8')
+
+    assets = AssetWriter(output)
+    targets = export_targets()
+    generated = datetime.now().strftime("%Y-%m-%d %H:%M")
+    pages, failed = [], []
+
+    for target in targets:
+        CapturingMediaStorage.files = {}
+        at = run_app(target['script'], target['view'])
+        if at.exception:
+            failed.append(target['name'])
+
+        renderer = PageRenderer(assets, CapturingMediaStorage.files)
+        body = renderer.render(at.main)
+        plotly_src = assets.plotly_js() if renderer.uses_plotly else None
+        document = page_html(target, targets, body, plotly_src, generated)
+        (output / target['file']).write_text(document, encoding='utf-8')
+        pages.append({
+            'name': target['name'],
+            'file': target['file'],
+            'bytes': len(document.encode('utf-8')),
+            'skipped': renderer.skipped
+        })
+
+    return {'pages': pages, 'failed': failed, 'images': len(assets.images)}
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+if __name__ == "__main__":
+    output = PROJECT_ROOT / arg_value('output', DEFAULT_OUTPUT)
+
+    print("=" * 70)
+    print("STATIC DASHBOARD EXPORT")
+    print("=" * 70)
+    print()
+
+    try:
+        result = export_dashboard(output)
+    except ValueError as e:
+        print(f"❌ {e}; choose a new or empty --output directory")
+        sys.exit(1)
+    for page in result['pages']:
+        skipped = f"  (skipped: {', '.join(page['skipped'])})" if page['skipped'] else ""
+        print(f"✅ {page['file']:45s} {page['bytes'] / 1e3:7.1f} KB{skipped}")
+
+    total = sum(path.stat().st_size for path in output.rglob("*") if path.is_file())
+    print(f"\n💾 {len(result['pages'])} pages, {result['images']} images, {total / 1e6:.1f} MB in {output}")
+    for name in result['failed']:
+        print(f"❌ {name}: page raised an exception during rendering")
+    sys.exit(1 if result['failed'] else 0)
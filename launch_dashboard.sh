@@ -41,4 +41,4 @@ echo "→ Press Ctrl+C to stop the dashboard"
 echo ""
 
 cd dashboard
-streamlit run app.py
+streamlit run app.py --server.enableStaticServing=true
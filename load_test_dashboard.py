@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Concurrent-Session Load Test for the Streamlit Dashboard
+Drives dashboard/app.py and every page with N simulated browser sessions
+
+Each simulated session opens the same websocket a browser does
+(/_stcore/stream), asks the server to run the landing page and then
+navigates through every page in a per-session random order. A page visit is
+timed from the rerun request to the server's script_finished message, so
+the latency includes script execution and delta serialization but not
+browser-side rendering. The server runs as a subprocess of this script,
+which samples its resident memory during the test.
+
+Usage:
+    python load_test_dashboard.py [--sessions=50] [--rounds=1] [--ramp=0] [--cold]
+                                  [--pages=Maturity,Synthesis] [--port=8599]
+                                  [--url=ws://host:port] [--timeout=120]
+                                  [--json=results.json]
+
+    --url        Load an already running server instead of starting one
+                 (no memory sampling)
+    --rounds     How many times each session visits every page
+    --ramp       Seconds over which session starts are spread
+    --cold       Skip the single-session warm-up pass, so first-visit costs
+                 (imports, cache fills) are included in the measurements
+
+Client and server share the machine, so run large tests on a host with
+spare cores or point --url at a separate server.
+"""
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent
+APP_PATH = PROJECT_ROOT / "dashboard" / "app.py"
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULTS = {
+    'sessions': 50,
+    'rounds': 1,
+    'ramp': 0.0,
+    'port': 8599,
+    'timeout': 120.0,
+    'startup_timeout': 60.0
+}
+RSS_SAMPLE_INTERVAL = 0.25  # seconds
+LANDING_PAGE = "app"
+
+
+def arg_value(name: str, default=None):
+    """Value of a --name=value command-line flag"""
+    for arg in sys.argv[1:]:
+        if arg.startswith(f"--{name}="):
+            value = arg.split("=", 1)[1]
+            return type(default)(value) if default is not None else value
+    return default
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+def start_server(port: int, startup_timeout: float) -> subprocess.Popen:
+    """Start `streamlit run dashboard/app.py` headless and wait until it is healthy"""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+         "--server.headless", "true",
+         "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Streamlit exited during startup (code {server.returncode})")
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1) as response:
+                if response.read().strip() == b"ok":
+                    return server
+        except OSError:
+            pass
+        time.sleep(0.25)
+
+    server.terminate()
+    raise RuntimeError(f"Streamlit did not become healthy within {startup_timeout:.0f}s")
+
+
+def process_rss_mb(pid: int) -> Optional[float]:
+    """Resident set size of a process in MB (Linux /proc; None elsewhere)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+async def sample_rss(pid: int, samples: List[float], stop: asyncio.Event):
+    """Record the server's RSS until stop is set"""
+    while not stop.is_set():
+        rss = process_rss_mb(pid)
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(stop.wait(), RSS_SAMPLE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+# ============================================================================
+# SIMULATED SESSIONS
+# ============================================================================
+
+async def visit_page(ws, timeout: float, page_script_hash: str = "", page_name: str = "") -> Dict:
+    """
+    Ask the server to run one page and read until the run finishes
+
+    Returns:
+        Dictionary with latency_ms, status, exceptions, messages and, for the
+        first visit of a session, the app's pages as (hash, name) pairs
+    """
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    request = BackMsg()
+    request.rerun_script.query_string = ""
+    request.rerun_script.page_script_hash = page_script_hash
+    request.rerun_script.page_name = page_name
+
+    start = time.perf_counter()
+    await ws.write_message(request.SerializeToString(), binary=True)
+
+    result = {'exceptions': 0, 'messages': 0, 'pages': None}
+    while True:
+        raw = await asyncio.wait_for(ws.read_message(), timeout)
+        if raw is None:
+            raise ConnectionError("server closed the websocket")
+
+        msg = ForwardMsg()
+        msg.ParseFromString(raw)
+        result['messages'] += 1
+        kind = msg.WhichOneof('type')
+
+        if kind == 'navigation':
+            result['pages'] = [(page.page_script_hash, page.page_name) for page in msg.navigation.app_pages]
+        elif kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+            if msg.delta.new_element.WhichOneof('type') == 'exception':
+                result['exceptions'] += 1
+        elif kind == 'script_finished':
+            result['latency_ms'] = (time.perf_counter() - start) * 1000
+            result['status'] = ForwardMsg.ScriptFinishedStatus.Name(msg.script_finished)
+            return result
+
+
+async def run_session(
+    session_id: int,
+    url: str,
+    rounds: int,
+    page_filter: Optional[List[str]],
+    timeout: float,
+    delay: float
+) -> List[Dict]:
+    """One simulated browser: landing page, then every page `rounds` times in random order"""
+    from tornado.websocket import websocket_connect
+
+    await asyncio.sleep(delay)
+    visits = []
+
+    def record(page: str, outcome: Dict):
+        visits.append({
+            'session': session_id,
+            'page': page,
+            'latency_ms': outcome.get('latency_ms', np.nan),
+            'ok': outcome.get('status') == 'FINISHED_SUCCESSFULLY' and outcome.get('exceptions', 0) == 0,
+            'status': outcome.get('status'),
+            'exceptions': outcome.get('exceptions', 0),
+            'messages': outcome.get('messages', 0),
+            'error': outcome.get('error')
+        })
+
+    try:
+        ws = await asyncio.wait_for(websocket_connect(f"{url}/_stcore/stream"), timeout)
+    except Exception as e:
+        record(LANDING_PAGE, {'error': f"connect: {e}"})
+        return visits
+
+    try:
+        landing = await visit_page(ws, timeout)
+        record(LANDING_PAGE, landing)
+
+        pages = [(page_hash, name) for page_hash, name in (landing['pages'] or []) if name != LANDING_PAGE]
+        if page_filter:
+            pages = [(page_hash, name) for page_hash, name in pages if name in page_filter]
+
+        rng = random.Random(session_id)
+        for _ in range(rounds):
+            for page_hash, name in rng.sample(pages, len(pages)):
+                try:
+                    record(name, await visit_page(ws, timeout, page_hash, name))
+                except asyncio.TimeoutError:
+                    record(name, {'error': f"timeout after {timeout:.0f}s"})
+                    return visits
+    except Exception as e:
+        record(LANDING_PAGE if not visits else "navigation", {'error': str(e) or type(e).__name__})
+    finally:
+        ws.close()
+    return visits
+
+
+async def run_load_test(url: str, sessions: int, rounds: int, ramp: float,
+                        page_filter: Optional[List[str]], timeout: float,
+                        server_pid: Optional[int] = None, warmup: bool = True) -> Dict:
+    """Run all sessions concurrently, sampling the server's memory meanwhile"""
+    warmup_seconds = None
+    if warmup:
+        start = time.perf_counter()
+        await run_session(-1, url, 1, page_filter, timeout, 0.0)
+        warmup_seconds = time.perf_counter() - start
+
+    rss_samples: List[float] = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(server_pid, rss_samples, stop)) if server_pid else None
+
+    rss_start = process_rss_mb(server_pid) if server_pid else None
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        run_session(i, url, rounds, page_filter, timeout, ramp * i / max(sessions, 1))
+        for i in range(sessions)
+    ])
+    wall_seconds = time.perf_counter() - start
+
+    stop.set()
+    if sampler:
+        await sampler
+
+    return {
+        'visits': pd.DataFrame([visit for session in results for visit in session]),
+        'wall_seconds': wall_seconds,
+        'warmup_seconds': warmup_seconds,
+        'rss_start_mb': rss_start,
+        'rss_peak_mb': max(rss_samples) if rss_samples else None,
+        'rss_end_mb': process_rss_mb(server_pid) if server_pid else None
+    }
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def summarize_latencies(visits: pd.DataFrame) -> pd.DataFrame:
+    """
+    Latency percentiles per page over successful visits
+
+    Returns:
+        DataFrame with page, visits, errors, p50_ms, p95_ms, p99_ms, max_ms
+        (plus an 'ALL' row), slowest p95 first
+    """
+    def row(page: str, frame: pd.DataFrame) -> Dict:
+        latencies = frame.loc[frame['ok'], 'latency_ms'].to_numpy()
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan,) * 3
+        return {
+            'page': page,
+            'visits': len(frame),
+            'errors': int((~frame['ok']).sum()),
+            'p50_ms': p50,
+            'p95_ms': p95,
+            'p99_ms': p99,
+            'max_ms': latencies.max() if len(latencies) else np.nan
+        }
+
+    per_page = pd.DataFrame([row(page, frame) for page, frame in visits.groupby('page')])
+    per_page = per_page.sort_values('p95_ms', ascending=False)
+    return pd.concat([per_page, pd.DataFrame([row('ALL', visits)])], ignore_index=True)
+
+
+def print_report(result: Dict, sessions: int):
+    visits = result['visits']
+    summary = summarize_latencies(visits)
+    ok = int(visits['ok'].sum())
+
+    print(f"\n📊 Render latency by page ({sessions} concurrent sessions):\n")
+    print(summary.round(1).to_string(index=False))
+
+    print()
+    if result['warmup_seconds'] is not None:
+        print(f"⏱️  Warm-up (1 session, not counted): {result['warmup_seconds']:.1f} s")
+    print(f"⏱️  Wall time: {result['wall_seconds']:.1f} s")
+    print(f"⏱️  Throughput: {ok / result['wall_seconds']:.1f} page renders/s "
+          f"({sessions / result['wall_seconds']:.2f} sessions/s)")
+
+    if result['rss_start_mb'] is not None:
+        growth = result['rss_end_mb'] - result['rss_start_mb']
+        print(f"\n💾 Server RSS: start {result['rss_start_mb']:.0f} MB, "
+              f"peak {result['rss_peak_mb']:.0f} MB, end {result['rss_end_mb']:.0f} MB")
+        print(f"💾 Growth: {growth:+.0f} MB ({growth / sessions:+.2f} MB per session)")
+
+    failures = visits[~visits['ok']]
+    if len(failures):
+        print(f"\n⚠️  {len(failures)} failed visit(s):")
+        for _, failure in failures.head(10).iterrows():
+            reason = failure['error'] or f"{failure['status']}, {failure['exceptions']} exception(s)"
+            print(f"   session {failure['session']} {failure['page']}: {reason}")
+    else:
+        print(f"\n✅ All {len(visits)} page visits completed without errors")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main() -> int:
+    sessions = arg_value('sessions', DEFAULTS['sessions'])
+    rounds = arg_value('rounds', DEFAULTS['rounds'])
+    ramp = arg_value('ramp', DEFAULTS['ramp'])
+    port = arg_value('port', DEFAULTS['port'])
+    timeout = arg_value('timeout', DEFAULTS['timeout'])
+    url = arg_value('url')
+    pages = arg_value('pages')
+    page_filter = [page.strip() for page in pages.split(',')] if pages else None
+
+    print("=" * 70)
+    print("DASHBOARD LOAD TEST")
+    print("=" * 70)
+
+    server = None
+    if url is None:
+        print(f"\n🚀 Starting Streamlit on port {port}...")
+        server = start_server(port, DEFAULTS['startup_timeout'])
+        url = f"ws://localhost:{port}"
+
+    try:
+        print(f"👥 {sessions} sessions x {rounds} round(s), ramp {ramp:.0f}s → {url}")
+        result = asyncio.run(run_load_test(
+            url, sessions, rounds, ramp, page_filter, timeout,
+            server.pid if server else None, warmup="--cold" not in sys.argv[1:]
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print_report(result, sessions)
+
+    json_path = arg_value('json')
+    if json_path:
+        report = {
+            'sessions': sessions,
+            'rounds': rounds,
+            'wall_seconds': result['wall_seconds'],
+            'rss_mb': {key[4:-3]: result[key] for key in ('rss_start_mb', 'rss_peak_mb', 'rss_end_mb')},
+            'pages': summarize_latencies(result['visits']).replace({np.nan: None}).to_dict(orient='records')
+        }
+        Path(json_path).write_text(json.dumps(report, indent=2))
+        print(f"\n💾 Results written to {json_path}")
+
+    return 0 if result['visits']['ok'].all() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,9 @@ XR Data Intelligence Alignment Dashboard
 Integrating Word Cloud Analysis, Sentiment Analysis, and Topic Modeling
 """
 
+import sys
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -11,9 +14,14 @@ import plotly.graph_objects as go
 from wordcloud import WordCloud
 from textblob import TextBlob
 from sklearn.feature_extraction.text import CountVectorizer
-from sklearn.decomposition import LatentDirichletAllocation
 import numpy as np
 
+# Shared analytics
+sys.path.insert(0, str(Path(__file__).parent / "analysis" / "common"))
+from data_loader import get_loader
+from dtm_cache import get_dtm_cache
+from model_cache import get_model_cache, top_words
+
 # Page configuration
 st.set_page_config(
     page_title="XR Data Intelligence Analysis",
@@ -65,12 +73,12 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Data loading
-@st.cache_data
 def load_data():
-    """Load the XR data with real verified sources"""
+    """Load the XR data with real verified sources (parsed once per file version)"""
     try:
-        df_cleaned = pd.read_csv("XR_Cleaned_Data.csv")
-        df_master = pd.read_csv("XR_Integrated_Master_Corpus.csv")
+        loader = get_loader()
+        df_cleaned = loader.load_artifact("XR_Cleaned_Data.csv")
+        df_master = loader.load_artifact("XR_Integrated_Master_Corpus.csv")
         return df_cleaned, df_master
     except FileNotFoundError as e:
         st.error(f"Data files not found: {e}")
@@ -406,36 +414,41 @@ def show_topic_modeling(df):
     with col2:
         n_words = st.slider("Words per Topic", min_value=5, max_value=15, value=10)
 
-    if st.button("🚀 Run LDA Analysis", type="primary"):
-        with st.spinner("Training LDA model on real data..."):
-            # Vectorize text
-            cv = CountVectorizer(max_df=0.95, min_df=2, stop_words='english')
-            dtm = cv.fit_transform(df['Cleaned_Text'].fillna(''))
+    # Vectorize text (cached per corpus version and vectorizer config)
+    cached = get_dtm_cache().get_or_build(
+        df['Cleaned_Text'].fillna('').tolist(),
+        CountVectorizer(max_df=0.95, min_df=2, stop_words='english')
+    )
 
-            # Fit LDA
-            lda = LatentDirichletAllocation(n_components=n_topics, random_state=42)
-            lda.fit(dtm)
+    # Fitted models are shared across sessions per (corpus, n_topics); the
+    # slider range is fitted in the background so most choices are instant
+    model_cache = get_model_cache()
+    model_cache.prefetch(cached.key, cached.matrix, n_topics_range=sorted(range(2, 9), key=lambda k: k != n_topics))
 
-            # Get feature names
-            feature_names = cv.get_feature_names_out()
+    if st.button("🚀 Run LDA Analysis", type="primary"):
+        st.session_state['lda_requested'] = True
 
-            # Display topics
-            st.markdown("---")
-            st.subheader("🔍 Discovered Topics")
+    if st.session_state.get('lda_requested'):
+        if model_cache.is_cached(cached.key, n_topics):
+            lda = model_cache.get_or_fit(cached.key, cached.matrix, n_topics)
+        else:
+            with st.spinner("Training LDA model on real data..."):
+                lda = model_cache.get_or_fit(cached.key, cached.matrix, n_topics)
 
-            cols = st.columns(min(n_topics, 3))
+        # Display topics ("Words per Topic" only changes this step, never the fit)
+        st.markdown("---")
+        st.subheader("🔍 Discovered Topics")
 
-            for idx, topic in enumerate(lda.components_):
-                top_word_indices = topic.argsort()[:-n_words - 1:-1]
-                top_words = [feature_names[i] for i in top_word_indices]
+        cols = st.columns(min(n_topics, 3))
 
-                with cols[idx % len(cols)]:
-                    st.markdown(f"### Topic {idx + 1}")
-                    st.markdown("**Key Terms:**")
-                    for word in top_words:
-                        st.markdown(f"- {word}")
+        for idx, words in enumerate(top_words(lda, cached.terms, n_words)):
+            with cols[idx % len(cols)]:
+                st.markdown(f"### Topic {idx + 1}")
+                st.markdown("**Key Terms:**")
+                for word in words:
+                    st.markdown(f"- {word}")
 
-            st.success(f"✅ Successfully extracted {n_topics} topics from {len(df)} documents")
+        st.success(f"✅ Successfully extracted {n_topics} topics from {len(df)} documents")
 
 def show_integrated_analysis(df, df_master):
     """Integrated Analysis Page"""
@@ -17,10 +17,14 @@ from dimensions import (
 )
 from data_loader import XRDataLoader, get_all_sources, load_dimension
 from text_analytics import (
+    TextPreprocessor,
     WordCloudGenerator,
     SentimentAnalyzer,
     TopicModeler
 )
+from sentiment_stats import get_sentiment_intervals, format_interval
+from model_registry import ModelRegistry
+from dtm_cache import DTMCache, term_frequencies
 
 def print_header(title: str):
     """Print formatted header"""
@@ -107,6 +111,659 @@ def test_text_analytics():
     else:
         print(f"   ⚠️  Unexpected data format, skipping analytics")
 
+def test_sentiment_intervals():
+    """Test bootstrap confidence intervals on pre-computed sentiment"""
+    print_header("SENTIMENT CONFIDENCE INTERVALS")
+
+    import pandas as pd
+
+    dimension = ALL_DIMENSIONS[1]  # Interoperability (smallest sample)
+    sentiment_file = dimension.get_data_paths()[0].parent / "xr_interop_sentiment.csv"
+    sentiment_df = pd.read_csv(sentiment_file)
+
+    intervals = get_sentiment_intervals(sentiment_df, 'compound', 'label', version="test")
+    mean_ci = intervals['mean']
+    print(f"\n{dimension.icon} {dimension.name} ({intervals['n']} sources)")
+    print(f"   Avg sentiment: {mean_ci['estimate']:.3f} ({format_interval(mean_ci)})")
+
+    assert mean_ci['lower'] <= mean_ci['estimate'] <= mean_ci['upper']
+    for cls, ci in intervals['shares'].items():
+        print(f"   {cls.title()}: {ci['estimate'] * 100:.1f}% ({format_interval(ci, scale=100, fmt='{:.1f}%')})")
+        assert 0.0 <= ci['lower'] <= ci['estimate'] <= ci['upper'] <= 1.0
+
+    # Second call is served from the cache
+    assert get_sentiment_intervals(sentiment_df, 'compound', 'label', version="test")['mean'] is mean_ci
+
+def test_topic_model_persistence():
+    """Test saving, registering and reloading a fitted topic model"""
+    print_header("TOPIC MODEL PERSISTENCE")
+
+    import tempfile
+    import numpy as np
+
+    texts = load_dimension('use_cases')['corpus']['raw_text'].dropna().tolist()
+
+    with tempfile.TemporaryDirectory() as registry_dir:
+        registry = ModelRegistry(Path(registry_dir))
+        fitted = TopicModeler.load_or_fit('use_cases_test', texts, n_topics=3, registry=registry)
+
+        # A fresh registry instance must load (not refit) the same model
+        reloaded = TopicModeler.load_or_fit('use_cases_test', texts, n_topics=3, registry=ModelRegistry(Path(registry_dir)))
+        print(f"\n   ✅ Registered models: {[m['key'] for m in registry.list_models()]}")
+
+        assert len(registry.list_models('use_cases_test')) == 1
+        assert np.allclose(fitted.transform(texts), reloaded.transform(texts))
+        assert reloaded.get_topic_labels() == fitted.get_topic_labels()
+
+        # Updating a loaded model must not change the registry's cached copy
+        loaded = TopicModeler.load_or_fit('use_cases_test', texts, n_topics=3, registry=registry)
+        loaded.update(["volumetric holoportation telepresence rigs"], extend_vocabulary=True)
+        again = TopicModeler.load_or_fit('use_cases_test', texts, n_topics=3, registry=registry)
+        assert again.lda_model is not loaded.lda_model
+        assert np.allclose(reloaded.transform(texts), again.transform(texts))
+
+def test_topic_sweep():
+    """Test the topic-count sweep returns one scored row per configuration"""
+    print_header("TOPIC-COUNT SWEEP")
+
+    texts = load_dimension('use_cases')['corpus']['raw_text'].dropna().tolist()
+    results = TopicModeler().sweep(texts, n_topics_grid=[2, 3], doc_topic_priors=(None, 0.1), max_workers=1)
+    print(f"\n{results[['n_topics', 'doc_topic_prior', 'perplexity', 'umass_coherence']].to_string(index=False)}")
+
+    assert len(results) == 4
+    assert (results['perplexity'] > 0).all()
+    assert (results['umass_coherence'] <= 0).all()
+    assert results['npmi_coherence'].between(-1, 1).all()
+
+    modeler = TopicModeler(n_topics=3)
+    modeler.fit(texts)
+    coherence = modeler.get_coherence(texts)
+    print(f"\n{coherence.to_string(index=False)}")
+    assert len(coherence) == 3
+
+    # Sweeping another corpus must not touch the fitted vocabulary
+    labels = modeler.get_topic_labels()
+    other = load_dimension('scalability')['corpus']['content'].dropna().astype(str).tolist()
+    modeler.sweep(other, n_topics_grid=[2], max_features=200, max_workers=1)
+    assert modeler.get_topic_labels() == labels and modeler.max_features == 1000
+
+def test_topic_update():
+    """Test incremental updates can start from a single document"""
+    print_header("INCREMENTAL TOPIC UPDATE")
+
+    modeler = TopicModeler(n_topics=2)
+    modeler.update(["augmented reality headset training in the factory"])
+    assert {'augmented', 'factory', 'headset'} <= set(modeler.feature_names)
+
+    modeler.update(["edge computing lowers latency", "cloud rendering latency"], extend_vocabulary=True)
+    assert 'latency' in modeler.feature_names and modeler.n_documents_seen == 3
+
+    # Coherence on the update corpus must not swap in the fit() vectorizer
+    texts = load_dimension('use_cases')['corpus']['raw_text'].dropna().tolist()
+    updated = TopicModeler(n_topics=3).update(texts)
+    terms = list(updated.feature_names)
+    assert len(updated.get_coherence(texts)) == 3
+    assert list(updated.feature_names) == terms and len(terms) == updated.topic_word_matrix.shape[1]
+    print(f"\n   ✅ {len(modeler.feature_names)} terms after {modeler.n_documents_seen} documents")
+
+def test_topic_engines():
+    """Test every topic engine behind the shared TopicModeler interface"""
+    print_header("TOPIC ENGINES")
+
+    import numpy as np
+    from topic_engines import ENGINES, TopicEngine
+
+    class IncompleteEngine(TopicEngine):
+        name = 'incomplete'
+
+    try:
+        IncompleteEngine()
+        assert False, "an engine without build_model() was instantiated"
+    except TypeError:
+        pass
+
+    texts = load_dimension('use_cases')['corpus']['raw_text'].dropna().tolist()
+
+    for engine in ENGINES:
+        modeler = TopicModeler(n_topics=3, engine=engine).fit(texts)
+        doc_topics = modeler.transform(texts)
+        print(f"\n   ✅ {engine}: {list(modeler.get_topic_labels().values())}")
+
+        assert doc_topics.shape == (len(texts), 3)
+        assert np.allclose(doc_topics.sum(axis=1), 1.0)
+        assert all(len(words) == 5 for words in modeler.get_top_words_per_topic(5).values())
+
+def test_dtm_cache():
+    """Test the document-term matrix cache round-trips through a memory-mapped file"""
+    print_header("DOCUMENT-TERM MATRIX CACHE")
+
+    import tempfile
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    texts = load_dimension('scalability')['corpus']['content'].astype(str).tolist()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        built = DTMCache(Path(cache_dir)).get_or_build(texts, CountVectorizer(stop_words='english'))
+        loaded = DTMCache(Path(cache_dir)).get_or_build(texts, CountVectorizer(stop_words='english'))
+
+        print(f"\n   ✅ Cached matrix: {loaded.matrix.shape}, key {loaded.key}")
+        assert loaded.key == built.key
+        assert (built.matrix != loaded.matrix).nnz == 0
+        assert list(loaded.terms) == list(built.terms)
+
+        top = term_frequencies(loaded.matrix, loaded.terms, n=5)
+        print(f"   ✅ Top terms: {top['Word'].tolist()}")
+        assert top['Frequency'].is_monotonic_decreasing
+
+        # Preprocessor settings are part of the key; the in-memory LRU is bounded
+        preprocessor = TextPreprocessor()
+        cache = DTMCache(Path(cache_dir), max_matrices=1)
+        before = cache.get_or_build(texts[:5], CountVectorizer(), preprocess=preprocessor.preprocess)
+        preprocessor.stopwords.add('xr')
+        after = cache.get_or_build(texts[:5], CountVectorizer(), preprocess=preprocessor.preprocess)
+        assert before.key != after.key and 'xr' not in after.terms
+        assert list(cache._loaded) == [after.key]
+
+def test_joint_topics():
+    """Test the joint topic model yields comparable per-dimension prevalence"""
+    print_header("JOINT CROSS-DIMENSION TOPICS")
+
+    import tempfile
+    import numpy as np
+    from joint_topics import build_union_corpus, fit_joint_model, load_joint_model
+
+    corpus = build_union_corpus()
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = ModelRegistry(Path(tmp))
+        assert load_joint_model(corpus, n_topics=4, registry=registry) is None  # pages never fit
+        joint = fit_joint_model(corpus, n_topics=4, registry=registry)
+        loaded = load_joint_model(corpus, n_topics=4, registry=registry)
+    print(f"\n{(joint['prevalence'] * 100).round(1).to_string()}")
+
+    assert set(corpus['dimension_id']) == {dim.id for dim in ALL_DIMENSIONS}
+    assert joint['prevalence'].shape == (len(ALL_DIMENSIONS), 4)
+    assert loaded['prevalence'].equals(joint['prevalence'])
+    assert np.allclose(joint['prevalence'].sum(axis=1), 1.0)
+    assert np.allclose(np.diag(joint['overlap']), 1.0)
+
+def test_lda_planner():
+    """Test the LDA planner keeps small fits in-process and caps dashboard workers"""
+    print_header("LDA EXECUTION PLANNER")
+
+    from lda_planner import INTERACTIVE_MAX_JOBS, plan_lda_fit
+
+    small = plan_lda_fit(n_documents=600, n_nonzero=9_000, n_topics=5, cores=16, interactive=False)
+    print(f"\n   ✅ Small corpus: {small.reason}")
+    assert small.n_jobs == 1
+    assert small.learning_method == 'batch'
+
+    large = plan_lda_fit(n_documents=200_000, n_nonzero=15_000_000, n_topics=5, cores=16, interactive=False)
+    dashboard = plan_lda_fit(n_documents=200_000, n_nonzero=15_000_000, n_topics=5, cores=16, interactive=True)
+    print(f"   ✅ Large corpus: {large.reason}")
+    print(f"   ✅ Large corpus in dashboard: {dashboard.reason}")
+    assert large.learning_method == 'online'
+    assert 1 < large.n_jobs <= 16
+    assert dashboard.n_jobs == INTERACTIVE_MAX_JOBS
+
+def test_dynamic_topics():
+    """Test monthly topic windows are warm-started and report prevalence and drift"""
+    print_header("DYNAMIC TOPICS")
+
+    import numpy as np
+    from dynamic_topics import fit_dynamic_topics
+
+    corpus = load_dimension('scalability')['corpus']
+    dynamic = fit_dynamic_topics(
+        corpus['content'].astype(str).tolist(), corpus['date'],
+        groups=corpus['category'], n_topics=3, max_workers=1
+    )
+
+    windows = dynamic['windows']
+    print(f"\n   ✅ {len(windows)} windows across {windows['group'].nunique()} categories")
+    assert windows.groupby('group')['warm_start'].sum().eq(windows.groupby('group').size() - 1).all()
+
+    totals = dynamic['prevalence'].groupby(['group', 'window'])['prevalence'].sum()
+    assert np.allclose(totals, 1.0)
+
+    drift = dynamic['drift']['jaccard_to_previous'].dropna()
+    print(f"   ✅ Mean keyword overlap between months: {drift.mean():.2f}")
+    assert drift.between(0, 1).all()
+
+def test_topic_service():
+    """Test the micro-batched inference service matches TopicModeler.transform, in-process and over HTTP"""
+    print_header("TOPIC INFERENCE SERVICE")
+
+    import http.client
+    import json
+    import threading
+    import urllib.error
+    import urllib.request
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+    from topic_service import TopicInferenceService, make_http_server
+
+    texts = load_dimension('use_cases')['corpus']['raw_text'].dropna().tolist()
+    modeler = TopicModeler(n_topics=3).fit(texts)
+
+    with TopicInferenceService(modeler.to_artifact(), max_batch_size=8) as service:
+        with ThreadPoolExecutor(max_workers=8) as clients:
+            doc_topics = np.vstack(list(clients.map(lambda text: service.submit(text).result(timeout=10), texts)))
+
+        stats = service.stats()
+        print(f"\n   ✅ {stats['documents']} documents in {stats['batches']} batches")
+        assert np.allclose(doc_topics, modeler.transform(texts))
+        assert stats['batches'] <= stats['documents']
+
+        # A request cancelled by its caller is skipped; the worker keeps serving
+        cancelled = service.submit(texts[0])
+        cancelled.cancel()
+        assert service.submit(texts[1]).result(timeout=10).shape == (3,)
+
+        server = make_http_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        def post(body):
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{server.server_port}/infer",
+                data=json.dumps(body).encode('utf-8'),
+                headers={"Content-Type": "application/json"}
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    return response.status, json.loads(response.read())
+            except urllib.error.HTTPError as error:
+                return error.code, json.loads(error.read())
+
+        try:
+            status, payload = post({"texts": texts[:2]})
+            assert status == 200
+            assert post({"texts": "not a list"})[0] == 400
+            assert post({"texts": [1, 2]})[0] == 400
+
+            # A negative Content-Length is rejected instead of blocking on read(-1)
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+            connection.request("POST", "/infer", body=b"", headers={"Content-Length": "-1"})
+            assert connection.getresponse().status == 400
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        print(f"   ✅ HTTP /infer dominant topics: {payload['dominant_topic']}")
+        assert np.allclose(payload['topics'], doc_topics[:2], atol=1e-5)
+
+        # A submit racing stop() fails instead of waiting on a drained queue
+        service._stopping.set()
+        assert isinstance(service.submit(texts[0]).exception(timeout=1), RuntimeError)
+
+def test_topic_sentiment():
+    """Test topic-weighted sentiment matches a per-topic loop and joins the pre-computed outputs"""
+    print_header("TOPIC-SENTIMENT")
+
+    import numpy as np
+    from topic_sentiment import TOPIC_SENTIMENT_SOURCES, attach_corpus_ids, get_topic_sentiment, topic_sentiment_matrix
+
+    rng = np.random.default_rng(0)
+    doc_topics = rng.dirichlet(np.ones(4), size=200)
+    scores = rng.uniform(-1, 1, size=200)
+    table = topic_sentiment_matrix(doc_topics, scores)
+
+    for k in range(4):
+        mean = np.average(scores, weights=doc_topics[:, k])
+        variance = np.average((scores - mean) ** 2, weights=doc_topics[:, k])
+        assert np.isclose(table['mean_sentiment'][k], mean)
+        assert np.isclose(table['std_sentiment'][k], np.sqrt(variance))
+
+    # Unlabeled documents add no share_nan column and the class shares still sum to 1
+    labels = rng.choice(['Positive', 'Negative', None], size=200)
+    shares = topic_sentiment_matrix(doc_topics, scores, labels=labels).filter(like='share_')
+    assert list(shares.columns) == ['share_negative', 'share_positive']
+    assert np.allclose(shares.sum(axis=1), 1.0)
+
+    # Topic rows without ids map to corpus rows that have text, not to sentiment rows by position
+    import pandas as pd
+    corpus = pd.DataFrame({'cleaned_text': ["a", None, "b", "c"]})
+    topics = attach_corpus_ids(pd.DataFrame({'Topic_1': [1.0, 0.0, 1.0]}), corpus, 'cleaned_text', 'record_id')
+    assert topics['record_id'].tolist() == [0, 2, 3]
+    try:
+        attach_corpus_ids(topics.head(2), corpus, 'cleaned_text', 'record_id')
+        raise AssertionError("row-count mismatch must not be joined")
+    except ValueError:
+        pass
+
+    for dimension_id in TOPIC_SENTIMENT_SOURCES:
+        joined = get_topic_sentiment(dimension_id)
+        print(f"\n   ✅ {dimension_id}: {dict(zip(joined['topic'], joined['mean_sentiment'].round(3)))}")
+        assert np.isclose(joined['weight_share'].sum(), 1.0)
+        assert joined['mean_sentiment'].between(-1, 1).all()
+
+def test_model_cache():
+    """Test fitted models are reused per (corpus, n_topics), evicted LRU-first, and prefetched once"""
+    print_header("FITTED MODEL CACHE")
+
+    from sklearn.feature_extraction.text import CountVectorizer
+    from dtm_cache import get_dtm_cache
+    from model_cache import LDAModelCache, top_words
+
+    texts = load_dimension('use_cases')['corpus']['raw_text'].dropna().tolist()
+    cached = get_dtm_cache().get_or_build(texts, CountVectorizer(stop_words='english'))
+    cache = LDAModelCache(max_models=2)
+
+    model = cache.get_or_fit(cached.key, cached.matrix, n_topics=3)
+    assert cache.get_or_fit(cached.key, cached.matrix, n_topics=3) is model
+    assert len(top_words(model, cached.terms, 5)[0]) == 5
+
+    futures = cache.prefetch(cached.key, cached.matrix, n_topics_range=[3, 4, 5])
+    assert len(futures) == 2  # n_topics=3 is already cached
+    for future in futures:
+        future.result(timeout=60)
+
+    stats = cache.stats()
+    print(f"\n   ✅ {stats}")
+    assert stats['models'] == 2 and stats['misses'] == 3
+    assert not cache.is_cached(cached.key, 3)  # least recently used, evicted
+
+def test_artifact_manifest():
+    """Test every dimension's manifest is current and resolves artifacts with canonical columns"""
+    print_header("ARTIFACT MANIFESTS")
+
+    from artifact_manifest import ROLE_COLUMNS, check_manifest, get_manifest, load_manifest
+
+    for dimension in ALL_DIMENSIONS:
+        problems = check_manifest(dimension.id)
+        assert not problems, problems
+
+        manifest = get_manifest(dimension.id)
+        assert load_manifest(dimension.id) is manifest  # cached until the file changes
+        assert manifest.has('wordcloud_image') and manifest.has('sentiment')
+
+        for role, columns in ROLE_COLUMNS.items():
+            frame = manifest.load(role)
+            assert frame is not None and set(columns) <= set(frame.columns), (dimension.id, role)
+        print(f"   ✅ {dimension.id}: {', '.join(manifest.entries)}")
+
+def test_artifact_reads():
+    """Test artifact files are parsed once per file version and re-read after they change"""
+    print_header("CACHED ARTIFACT READS")
+
+    import os
+    import tempfile
+    import pandas as pd
+    from artifact_manifest import get_manifest
+    from data_loader import get_loader
+
+    loader = get_loader()
+    manifest = get_manifest('use_cases')
+    for role in manifest.entries:
+        manifest.load(role)
+    reads = loader.artifact_reads
+    for role in manifest.entries:
+        assert manifest.load(role) is manifest.load(role)
+    assert loader.artifact_reads == reads  # second pass served from memory
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "artifact.csv"
+        pd.DataFrame({'Word': ['xr'], 'Frequency': [1]}).to_csv(path, index=False)
+        first = loader.load_artifact(path)
+        assert loader.load_artifact(path) is first
+
+        pd.DataFrame({'Word': ['xr', 'ai'], 'Frequency': [1, 2]}).to_csv(path, index=False)
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        assert len(loader.load_artifact(path)) == 2
+    print(f"\n   ✅ {loader.artifact_reads} files parsed")
+
+def test_image_assets():
+    """Test manifest images have downscaled renditions and pages are served the one fitting the layout"""
+    print_header("IMAGE ASSET VARIANTS")
+
+    from artifact_manifest import get_manifest
+    from image_assets import COLUMN_WIDTH, FULL_WIDTH, get_image, pick_variant
+
+    manifest = get_manifest('ai_alignment')
+    source = manifest.path('wordcloud_image')
+    variants = manifest.entry('wordcloud_image')['variants']
+    assert {variant['width'] for variant in variants} >= {COLUMN_WIDTH, FULL_WIDTH}
+
+    served = pick_variant(source, COLUMN_WIDTH, variants=variants)
+    assert served.stem.endswith(f"_w{COLUMN_WIDTH}")
+    data, mime_type = get_image(source, FULL_WIDTH, variants=variants)
+    assert len(data) * 10 < source.stat().st_size  # 300-dpi original vs layout-sized rendition
+    assert manifest.image_html('wordcloud_image') is not None
+    assert manifest.image_html('wordcloud_image') == manifest.image_html('wordcloud_image')
+
+    # Served as cacheable static files by URL, not re-sent inline on every rerun
+    import re
+    from image_assets import STATIC_IMAGE_DIR, STATIC_IMAGE_URL, image_html
+    tag = image_html(source, width=FULL_WIDTH, variants=variants, inline=False)
+    urls = re.findall(re.escape(STATIC_IMAGE_URL) + r"/([\w.-]+)\?v=", tag)
+    assert 'base64' not in tag and len(urls) >= 1
+    assert (STATIC_IMAGE_DIR / urls[0]).read_bytes() == get_image(source, FULL_WIDTH, variants=variants)[0]
+    print(f"\n   ✅ {source.name}: {source.stat().st_size / 1e6:.2f} MB -> {len(data) / 1e3:.0f} KB ({mime_type})")
+
+    # A rendition no smaller than its source is recorded as rejected, not re-encoded on every build
+    import tempfile
+    import numpy as np
+    from PIL import Image
+    from image_assets import build_variants, variant_path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        noise = Path(tmp) / "noise.png"
+        pixels = np.random.default_rng(0).integers(0, 255, (40, 60, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(noise, optimize=True)
+        assert build_variants(noise, widths=(60,), formats=('png',)) == []
+        marker = variant_path(noise, 60, 'png').with_name("noise_w60.png.skip")
+        recorded = marker.stat().st_mtime_ns
+        assert build_variants(noise, widths=(60,), formats=('png',)) == []
+        assert marker.stat().st_mtime_ns == recorded
+        assert not variant_path(noise, 60, 'png').exists()
+    print("   ✅ Incompressible rendition skipped on rebuild")
+
+def test_figure_cache():
+    """Test rendered figures are reused for identical inputs and redrawn when inputs change"""
+    print_header("FIGURE CACHE")
+
+    from matplotlib.figure import Figure
+    from figure_cache import FigureCache
+
+    def render_bars(labels, values):
+        fig = Figure(figsize=(4, 2))
+        fig.add_subplot(111).barh(labels, values)
+        return fig
+
+    cache = FigureCache()
+    svg = cache.get_or_render('bars', render_bars, labels=['A', 'B'], values=[1, 2])
+    assert svg.startswith('<?xml')
+    assert cache.get_or_render('bars', render_bars, labels=['A', 'B'], values=[1, 2]) is svg
+    assert cache.stats() == {'figures': 1, 'hits': 1, 'renders': 1}
+
+    cache.get_or_render('bars', render_bars, labels=['A', 'B'], values=[1, 3])
+    assert cache.stats()['renders'] == 2
+    print(f"\n   ✅ {cache.stats()}")
+
+def test_cache_warmer():
+    """Test the startup warmer runs every step in the background and records failures"""
+    print_header("CACHE WARMER")
+
+    from cache_warmer import CacheWarmer, warmup_steps
+
+    ran = []
+    def failing_step():
+        raise ValueError("missing file")
+    warmer = CacheWarmer(steps=lambda: [("first", lambda: ran.append(1)), ("broken", failing_step), ("last", lambda: ran.append(3))])
+    assert warmer.start() is warmer.start()  # started once
+    assert warmer.wait(timeout=10)
+
+    progress = warmer.progress()
+    assert ran == [1, 3]
+    assert progress['completed'] == progress['total'] == 3 and progress['fraction'] == 1.0
+    assert progress['errors'] == [("broken", "missing file")]
+
+    labels = [label for label, _ in warmup_steps()]
+    assert len(labels) == 2 * len(ALL_DIMENSIONS) + 2
+    print(f"\n   ✅ {len(labels)} default steps, failures recorded: {progress['errors']}")
+
+def test_perf_hud():
+    """Test page section timings are attributed per checkpoint and round-trip through the JSONL log"""
+    print_header("PERFORMANCE HUD")
+
+    import tempfile
+    import time
+    from perf_hud import PageTimer, read_timings, summarize_timings
+
+    assert PageTimer("Maturity", enabled=False).finish() is None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "page_timings.jsonl"
+        for session in ("a", "b"):
+            timer = PageTimer("Maturity", session_id=session, log_path=log_path)
+            timer.checkpoint("data load")
+            time.sleep(0.02)
+            timer.checkpoint("word cloud")
+            record = timer.finish()
+            timer.write_log(record)
+
+        assert list(record['sections']) == ["data load", "word cloud"]
+        assert record['sections']["data load"] >= 20
+        assert record['total_ms'] >= sum(record['sections'].values()) - 0.005 * len(record['sections'])  # 0.01 ms rounding
+
+        summary = summarize_timings(read_timings(log_path))
+        assert summary.iloc[0]['section'] == "data load"
+        assert summary.iloc[0]['runs'] == 2 and summary.iloc[0]['sessions'] == 2
+    print(f"\n   ✅ {record['sections']}")
+
+def test_load_test_summary():
+    """Test load-test latency percentiles exclude failed visits and count them as errors"""
+    print_header("LOAD TEST SUMMARY")
+
+    import numpy as np
+    import pandas as pd
+    from load_test_dashboard import summarize_latencies
+
+    visits = pd.DataFrame({
+        'page': ['Maturity'] * 100 + ['Synthesis'] * 2,
+        'latency_ms': list(range(1, 101)) + [50.0, np.nan],
+        'ok': [True] * 101 + [False]
+    })
+    summary = summarize_latencies(visits).set_index('page')
+
+    assert summary.loc['Maturity', 'p50_ms'] == 50.5
+    assert summary.loc['Maturity', 'max_ms'] == 100
+    assert summary.loc['Synthesis', 'errors'] == 1 and summary.loc['Synthesis', 'p99_ms'] == 50
+    assert summary.loc['ALL', 'visits'] == 102
+    print(f"\n   ✅ {summary[['visits', 'errors', 'p50_ms', 'p95_ms', 'p99_ms']].to_dict(orient='index')}")
+
+def test_benchmark_baseline():
+    """Test benchmark regressions need both the relative tolerance and the absolute noise floor"""
+    print_header("PAGE BENCHMARK BASELINE")
+
+    from benchmark_dashboard_pages import benchmark_targets, compare_to_baseline, summarize_runs
+
+    baseline = {'Maturity': {'cold_render_ms': 300.0, 'warm_render_ms': 50.0, 'peak_rss_mb': 170.0}}
+    current = {'Maturity': {'cold_render_ms': 600.0, 'warm_render_ms': 70.0, 'peak_rss_mb': 175.0}}
+
+    regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+    assert [r['metric'] for r in regressions] == ['cold_render_ms']  # warm +40% but only +20 ms
+    assert compare_to_baseline({'Synthesis': {'cold_render_ms': 1e6}}, baseline, tolerance=0.25) == []
+
+    runs = [{'import_ms': 900.0, 'cold_render_ms': 300.0, 'warm_render_ms': None, 'peak_rss_mb': 170.0,
+             'exceptions': []}]
+    summary = summarize_runs(runs)  # --warm-runs=0
+    assert summary['warm_render_ms'] is None and summary['cold_render_ms'] == 300.0
+
+    names = [target['name'] for target in benchmark_targets()]
+    assert names[0] == 'Maturity' and 'Analytics Explained' in names
+    assert sum(name.startswith('streamlit_app:') for name in names) == 6
+    print(f"\n   ✅ {len(names)} targets; regression: {regressions[0]['metric']} {regressions[0]['change']:+.0%}")
+
+def test_static_export():
+    """Test static export markdown conversion and moving inline images into asset files"""
+    print_header("STATIC EXPORT")
+
+    import base64
+    import tempfile
+    from export_static_dashboard import EXPORT_MARKER, AssetWriter, markdown_to_html, prepare_output
+
+    page = markdown_to_html("## Scores\n\n- **High** `75%`\n  - nested\n- Low\n\n| A | B |\n|---|---|\n| 1 | 2 |")
+    assert page.startswith("<h2>Scores</h2>")
+    assert "<li><strong>High</strong> <code>75%</code>\n<ul>\n<li>nested" in page
+    assert page.count("<ul>") == page.count("</ul>") == 2
+    assert "<td>1</td><td>2</td>" in page
+    assert "&lt;b&gt;" in markdown_to_html("<b>x</b>", allow_html=False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        assets = AssetWriter(Path(tmp))
+        uri = "data:image/png;base64," + base64.b64encode(b"png bytes").decode()
+        markup = assets.externalize_data_uris(f"<img src='{uri}'><img src='{uri}'>")
+        files = list((Path(tmp) / "assets" / "img").iterdir())
+        assert len(files) == 1 and files[0].read_bytes() == b"png bytes"
+        assert markup.count(f"assets/img/{files[0].name}") == 2 and "base64" not in markup
+
+    # Only a previous export (or an empty directory) may be replaced
+    with tempfile.TemporaryDirectory() as tmp:
+        unrelated = Path(tmp) / "notes.txt"
+        unrelated.write_text("keep me")
+        try:
+            prepare_output(Path(tmp))
+            assert False, "non-empty directory without the export marker was accepted"
+        except ValueError:
+            pass
+        assert unrelated.exists()
+
+        export = Path(tmp) / "export"
+        prepare_output(export)
+        (export / "old.html").write_text("stale")
+        prepare_output(export)
+        assert [path.name for path in export.iterdir()] == [EXPORT_MARKER]
+    print(f"\n   ✅ {len(page)} chars of HTML; 1 asset for 2 inline images; foreign directories refused")
+
+def test_source_index():
+    """Test source file parsing, search and pagination of the source index"""
+    print_header("SOURCE INDEX")
+
+    from data_loader import get_loader
+    from source_index import SourceIndex, get_source_index, page_count, parse_source_file
+
+    text = """===== HEALTHCARE =====
+https://www.mayoclinic.org/xr
+
+EDGE PLATFORMS
+══════════════════════════════
+1. AWS Wavelength
+   https://aws.amazon.com/wavelength/
+   → Edge zones
+"""
+    rows = parse_source_file(text, "Sample")
+    assert [(r['section'], r['title']) for r in rows] == [("Healthcare", None), ("Edge Platforms", "AWS Wavelength")]
+
+    index = SourceIndex(rows * 2 + [
+        {'url': f"https://site{i}.example.com/{i}", 'title': None, 'section': None, 'collection': "Sample"}
+        for i in range(45)
+    ])
+    assert len(index) == 47 and index.domains.iloc[0]['sources'] == 1
+    assert list(index.search("WAVELENGTH")) == [1]
+    assert len(index.search("", category="Healthcare")) == 1
+    assert page_count(len(index.search())) == 3
+    last = index.page(index.search(), page=99)
+    assert list(last['rank']) == [41, 42, 43, 44, 45, 46, 47]
+
+    # A new search opens on its first page even when the current page still exists
+    from streamlit.testing.v1 import AppTest
+
+    def browser_app():
+        from source_index import SourceIndex, show_source_browser
+        rows = [{'url': f"https://site{i}.example.com/{i}", 'collection': "Sample"} for i in range(45)]
+        show_source_browser(SourceIndex(rows), key="test")
+
+    at = AppTest.from_function(browser_app).run()
+    at.number_input(key="test_page").set_value(3).run()
+    at.text_input(key="test_query").set_value("example").run()
+    assert at.number_input(key="test_page").value == 1 and not at.exception
+
+    use_cases = get_source_index('use_cases')
+    assert len(use_cases) == len(get_loader().load_dimension_sources('use_cases'))
+    assert "Manufacturing" in use_cases.categories
+    print(f"\n   ✅ use_cases: {len(use_cases)} sources in {len(use_cases.categories)} categories")
+
 def test_readiness_scores():
     """Test readiness score calculations"""
     print_header("READINESS ASSESSMENT")
@@ -164,6 +821,28 @@ def main():
     try:
         test_data_loading()
         test_text_analytics()
+        test_sentiment_intervals()
+        test_topic_model_persistence()
+        test_topic_sweep()
+        test_topic_update()
+        test_topic_engines()
+        test_dtm_cache()
+        test_joint_topics()
+        test_lda_planner()
+        test_dynamic_topics()
+        test_topic_service()
+        test_topic_sentiment()
+        test_model_cache()
+        test_artifact_manifest()
+        test_artifact_reads()
+        test_image_assets()
+        test_figure_cache()
+        test_cache_warmer()
+        test_perf_hud()
+        test_load_test_summary()
+        test_benchmark_baseline()
+        test_static_export()
+        test_source_index()
         test_readiness_scores()
         test_source_verification()
         test_analytical_framework()